@@ -730,6 +730,52 @@ with Conf('global.cylc', desc='''
 
                Moved into the ``[scheduler]`` section from the top level.
         ''')
+        Conf('config cache', VDR.V_BOOLEAN, False, desc='''
+            Cache the templated workflow configuration on disk.
+
+            Templating the ``flow.cylc`` file (inlining include-files and
+            Jinja2 or EmPy templating) can be slow for large workflows.
+            If this is set, the templated configuration is cached (in
+            ``~/.cylc/flow/config-cache/``) and reused by subsequent
+            ``cylc play``, ``cylc reload``, ``cylc validate``, etc.
+
+            Only the templating is cached, the configuration is still
+            validated and the workflow (e.g. its graph) loaded from it
+            each time.
+
+            The cache is keyed on the contents of the files in the workflow
+            directory, the template variables, the ``CYLC_*`` environment
+            variables and any other environment variables whose names
+            appear in the workflow files, the global configuration and the
+            versions of Cylc and any pre-configure plugins. Any change to
+            these will cause the configuration to be templated again.
+
+            .. warning::
+
+               Do not use this if your templating depends on anything else,
+               e.g. the current time, files outside of the workflow
+               directory, environment variables whose names are
+               constructed in the template or custom Jinja2 filters which
+               may change.
+
+            .. versionadded:: 8.3.0
+        ''')
+        Conf('graph parsing processes', VDR.V_INTEGER, 1, desc='''
+            Maximum number of processes used to parse the workflow graph.
+
+            If greater than one, the graph strings for different
+            recurrences (e.g. ``R1``, ``PT6H``, ``T00``) are parsed
+            concurrently in this many worker processes when the workflow
+            configuration is loaded (e.g. ``cylc validate``, ``cylc play``
+            or ``cylc reload``).
+
+            This can speed up loading workflows with many large
+            (e.g. parameterised) graph strings, but starting the worker
+            processes has an overhead so it will slow down loading smaller
+            workflows.
+
+            .. versionadded:: 8.3.0
+        ''')
         Conf('auto restart delay', VDR.V_INTERVAL, desc=f'''
             Maximum number of seconds the auto-restart mechanism will delay
             before restarting workflows.
@@ -868,6 +914,23 @@ with Conf('global.cylc', desc='''
 
                    {REPLACES}``[suite servers][run host select]rank``.
             ''')
+            Conf('metrics cache timeout', VDR.V_INTERVAL, DurationFloat(0),
+                 desc='''
+                Reuse run host metrics collected within this interval.
+
+                The metrics required by the ``ranking`` expressions are
+                collected from each run host (over SSH for remote hosts).
+                If this is set, the results are cached on disk (in
+                ``~/.cylc/flow/host-metrics.json``) and reused by
+                subsequent host selections (e.g. ``cylc play``) until they
+                are older than this interval. This avoids probing every run
+                host for each workflow when many workflows are started at
+                once.
+
+                The default (zero) disables the cache.
+
+                .. versionadded:: 8.3.0
+            ''')
 
         with Conf('host self-identification', desc=f'''
             How Cylc determines and shares the identity of the workflow host.
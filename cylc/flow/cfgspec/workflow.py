@@ -23,6 +23,7 @@ from typing import Any, Dict, Optional, Set
 from metomi.isodatetime.data import Calendar
 
 from cylc.flow import LOG
+from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.cfgspec.globalcfg import (
     DIRECTIVES_DESCR,
     DIRECTIVES_ITEM_DESCR,
@@ -2308,4 +2309,8 @@ class RawWorkflowConfig(ParsecConfig):
             self, SPEC, upg, output_fname, tvars, cylc_config_validate,
             options
         )
-        self.loadcfg(fpath, "workflow definition")
+        self.loadcfg(
+            fpath,
+            "workflow definition",
+            use_cache=glbl_cfg().get(['scheduler', 'config cache']),
+        )
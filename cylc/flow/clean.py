@@ -19,7 +19,6 @@
 import glob
 import os
 import sqlite3
-from collections import deque
 from contextlib import suppress
 from functools import partial
 from pathlib import Path
@@ -29,16 +28,13 @@ from subprocess import (
     PIPE,
     Popen,
 )
-from time import sleep
 from typing import (
     TYPE_CHECKING,
     Any,
     Container,
-    Deque,
     Dict,
     Iterable,
     List,
-    NamedTuple,
     Optional,
     Set,
     Union,
@@ -67,7 +63,13 @@ from cylc.flow.platforms import (
     get_install_target_to_platforms_map,
     get_localhost_install_target,
 )
-from cylc.flow.remote import construct_ssh_cmd
+from cylc.flow.remote import (
+    RemoteOp,
+    RemoteOpResult,
+    RemoteOpStarter,
+    construct_ssh_cmd,
+    run_remote_ops,
+)
 from cylc.flow.rundb import CylcWorkflowDAO
 from cylc.flow.workflow_files import (
     WorkflowFiles,
@@ -82,12 +84,6 @@ if TYPE_CHECKING:
     from optparse import Values
 
 
-class RemoteCleanQueueTuple(NamedTuple):
-    proc: 'Popen[str]'
-    install_target: str
-    platforms: List[Dict[str, Any]]
-
-
 async def get_contained_workflows(partial_id) -> List[str]:
     """Return the sorted names of any workflows in a directory.
 
@@ -361,10 +357,39 @@ def remote_clean(
             f"Cannot clean {id_} on remote platforms as the workflow database "
             f"is out of date/inconsistent with the global config - {exc}")
 
-    queue: Deque[RemoteCleanQueueTuple] = deque()
     remote_clean_cmd = partial(
         _remote_clean_cmd, id_=id_, rm_dirs=rm_dirs, timeout=timeout
     )
+
+    def _clean_error(result: RemoteOpResult) -> PlatformError:
+        return PlatformError(
+            PlatformError.MSG_TIDY,
+            result.platform['name'],
+            cmd=cast('List[str]', result.proc.args),
+            ret_code=result.ret_code,
+            out=result.out,
+            err=result.err,
+        )
+
+    def _starter(platforms: List[Dict[str, Any]]) -> RemoteOpStarter:
+        def _start(prev: Optional[RemoteOpResult]) -> Optional[RemoteOp]:
+            if prev is not None:
+                platforms.pop(0)
+                if not platforms:
+                    # Exhausted list of platforms (the result is logged
+                    # below)
+                    return None
+                if prev.out:
+                    LOG.info(f"[{prev.target}]\n{prev.out}")
+                # SSH error; try again using the next platform for this
+                # install target
+                LOG.debug(_clean_error(prev))
+            # Issue ssh command:
+            return RemoteOp(remote_clean_cmd(platform=platforms[0]),
+                            platforms[0])
+        return _start
+
+    ops: Dict[str, RemoteOpStarter] = {}
     for target, platforms in install_targets_map.items():
         if target == get_localhost_install_target():
             continue
@@ -373,55 +398,26 @@ def remote_clean(
             f"Cleaning {id_} on install target: "
             f"{platforms[0]['install target']}"
         )
-        # Issue ssh command:
-        queue.append(
-            RemoteCleanQueueTuple(
-                remote_clean_cmd(platform=platforms[0]), target, platforms
-            )
-        )
+        ops[target] = _starter(platforms)
+    # Run the commands concurrently (the timeout is applied remotely):
+    results = run_remote_ops(ops)
     failed_targets: Dict[str, Union[PlatformError, str]] = {}
-    # Handle subproc pool results almost concurrently:
-    while queue:
-        item = queue.popleft()
-        ret_code = item.proc.poll()
-        if ret_code is None:  # proc still running
-            queue.append(item)
-            continue
-        out, err = item.proc.communicate()
-        if out:
-            LOG.info(f"[{item.install_target}]\n{out}")
-        if ret_code == 124:
-            failed_targets[item.install_target] = (
+    for target in ops:
+        result = results[target]
+        if result.out:
+            LOG.info(f"[{target}]\n{result.out}")
+        if result.ret_code == 124:
+            failed_targets[target] = (
                 f"cylc clean timed out after {timeout}s. You can increase "
                 "this timeout using the --timeout option."
             )
-        elif ret_code:
-            this_platform = item.platforms.pop(0)
-            excp = PlatformError(
-                PlatformError.MSG_TIDY,
-                this_platform['name'],
-                cmd=cast('List[str]', item.proc.args),
-                ret_code=ret_code,
-                out=out,
-                err=err,
-            )
-            if ret_code == 255 and item.platforms:
-                # SSH error; try again using the next platform for this
-                # install target
-                LOG.debug(excp)
-                queue.append(
-                    item._replace(
-                        proc=remote_clean_cmd(platform=item.platforms[0])
-                    )
-                )
-            else:  # Exhausted list of platforms
-                failed_targets[item.install_target] = excp
-        elif err:
+        elif result.ret_code:
+            failed_targets[target] = _clean_error(result)
+        elif result.err:
             # Only show stderr from remote host in debug mode if ret code 0
             # because stderr often contains useless stuff like ssh login
             # messages
-            LOG.debug(f"[{item.install_target}]\n{err}")
-        sleep(0.2)
+            LOG.debug(f"[{target}]\n{result.err}")
     if failed_targets:
         for target, info in failed_targets.items():
             LOG.error(
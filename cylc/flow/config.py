@@ -67,14 +67,14 @@ from cylc.flow.exceptions import (
     WorkflowConfigError,
 )
 import cylc.flow.flags
-from cylc.flow.graph_parser import GraphParser
+from cylc.flow.graph_parser import GraphParser, parse_graphs
 from cylc.flow.listify import listify
 from cylc.flow.log_level import verbosity_to_env
 from cylc.flow.graphnode import GraphNodeParser
 from cylc.flow.param_expand import NameExpander
 from cylc.flow.parsec.exceptions import ItemNotFoundError
 from cylc.flow.parsec.OrderedDict import OrderedDictWithDefaults
-from cylc.flow.parsec.util import dequote, replicate
+from cylc.flow.parsec.util import dequote, pdeepcopy, replicate
 from cylc.flow.pathutil import (
     get_workflow_name_from_id,
     get_cylc_run_dir,
@@ -1215,7 +1215,8 @@ class WorkflowConfig:
         name_expander = NameExpander(self.parameters)
         exp_names = []
         for orig_name in orig_names:
-            exp_names += [name for name, _ in name_expander.expand(orig_name)]
+            exp_names.extend(
+                name for name, _ in name_expander.iter_expand(orig_name))
         return exp_names
 
     def _update_task_params(self, task_name, params):
@@ -1251,7 +1252,9 @@ class WorkflowConfig:
         newruntime = OrderedDictWithDefaults()
         name_expander = NameExpander(self.parameters)
         for namespace_heading, namespace_dict in self.cfg['runtime'].items():
-            for name, indices in name_expander.expand(namespace_heading):
+            for name, indices in name_expander.iter_expand(
+                namespace_heading
+            ):
                 if name not in newruntime:
                     newruntime[name] = OrderedDictWithDefaults()
                 replicate(newruntime[name], namespace_dict)
@@ -1433,41 +1436,51 @@ class WorkflowConfig:
                 ).add(name)
 
     def compute_inheritance(self):
+        """Compute the post-inheritance config of each runtime namespace.
+
+        Each namespace inherits from its linearized ancestors, root first.
+        Namespaces which share the start of their MRO (e.g. the members of
+        a family) share the result of inheriting from it, so each namespace
+        costs a single copy of its nearest already computed prefix rather
+        than a replication of every ancestor in turn.
+        """
         LOG.debug("Parsing the runtime namespace hierarchy")
 
-        # TODO: Note an unused alternative mechanism was removed here
-        # (March 2020). It stored the result of each completed MRO and
-        # re-used these wherever possible. This could be more efficient
-        # for full namespaces in deep hierarchies. We should go back and
-        # look if inheritance computation becomes a problem.
+        runtime = self.cfg['runtime']
+        # {reversed MRO prefix: inherited config}
+        # These must not be modified, they are copied before extending.
+        prefixes: Dict[Tuple[str, ...], OrderedDictWithDefaults] = {
+            (): OrderedDictWithDefaults()
+        }
+
+        def _inherit(hierarchy: Tuple[str, ...]) -> OrderedDictWithDefaults:
+            # find the longest prefix which has already been computed
+            index = len(hierarchy)
+            while hierarchy[:index] not in prefixes:
+                index -= 1
+            result = prefixes[hierarchy[:index]]
+            # replicate the remaining namespaces onto it
+            for index in range(index, len(hierarchy)):
+                result = pdeepcopy(result)
+                replicate(result, runtime[hierarchy[index]])
+                prefixes[hierarchy[:index + 1]] = result
+            return result
 
         results = OrderedDictWithDefaults()
 
         # Loop through runtime members, 'root' first.
-        nses = list(self.cfg['runtime'])
+        nses = list(runtime)
         nses.sort(key=lambda ns: ns != 'root')
         for ns in nses:
-            # for each namespace ...
-
-            hierarchy = copy(self.runtime['linearized ancestors'][ns])
-            hierarchy.reverse()
-
-            result = OrderedDictWithDefaults()
-
             # Go up the linearized MRO from root, replicating or
             # overriding each namespace element as we go.
-            for name in hierarchy:
-                replicate(result, self.cfg['runtime'][name])
-                # n_reps += 1
-
-            results[ns] = result
+            hierarchy = tuple(
+                reversed(self.runtime['linearized ancestors'][ns]))
+            results[ns] = _inherit(hierarchy)
 
         # replace pre-inheritance namespaces with the post-inheritance result
         self.cfg['runtime'] = results
 
-        # uncomment this to compare the simple and efficient methods
-        # print '  Number of namespace replications:', n_reps
-
     # def print_inheritance(self):
     #     # (use for debugging)
     #     for foo in self.runtime:
@@ -1512,6 +1525,72 @@ class WorkflowConfig:
         for orphan in orphans:
             self.runtime['linearized ancestors'][orphan] = [orphan, 'root']
 
+    def reuse_taskdefs(
+        self, old_config: 'WorkflowConfig'
+    ) -> Optional[Set[str]]:
+        """Reuse task definitions unchanged since the config being reloaded.
+
+        Called by the scheduler on reload. Task definitions which are the
+        same as in the old config are replaced by the old TaskDef objects so
+        that the task pool and data store can keep what they derived from
+        them.
+
+        Returns:
+            The names of the tasks which were added, removed or changed (or
+            which are graph neighbours of such tasks). Or None if other
+            changes (e.g. to cycling) mean all task definitions must be
+            treated as changed.
+
+        """
+        if (
+            self.run_mode() != old_config.run_mode()
+            or self._get_scheduling_cfg() != old_config._get_scheduling_cfg()
+        ):
+            return None
+        changed = set(self.taskdefs).symmetric_difference(old_config.taskdefs)
+        for name, tdef in self.taskdefs.items():
+            if (
+                name not in changed
+                and tdef.get_signature()
+                != old_config.taskdefs[name].get_signature()
+            ):
+                changed.add(name)
+
+        # A change to a task may change how it triggers (or is triggered by)
+        # its graph neighbours.
+        neighbours = set()
+        for config in (self, old_config):
+            for name in changed:
+                with suppress(KeyError):
+                    tdef = config.taskdefs[name]
+                    for children in tdef.graph_children.values():
+                        for child_list in children.values():
+                            neighbours.update(
+                                child_name for child_name, _ in child_list
+                            )
+                    for parents in tdef.graph_parents.values():
+                        neighbours.update(
+                            parent_name for parent_name, _ in parents
+                        )
+        changed.update(neighbours)
+
+        for name in self.taskdefs:
+            if name not in changed:
+                self.taskdefs[name] = old_config.taskdefs[name]
+        return changed
+
+    def _get_scheduling_cfg(self) -> dict:
+        """Return the [scheduling] config which affects task definitions.
+
+        This excludes the graph (which is compared task by task) and queues
+        (which are recreated on reload).
+        """
+        return {
+            key: value
+            for key, value in self.cfg['scheduling'].items()
+            if key not in {'graph', 'queues'}
+        }
+
     def configure_workflow_state_polling_tasks(self):
         # Check custom script not defined for automatic workflow polling tasks.
         for l_task in self.workflow_polling_tasks:
@@ -1989,6 +2068,20 @@ class WorkflowConfig:
 
         For validation, return non-suicide edges with left and right nodes.
         """
+        graph_raw_edges = list(
+            self.iter_graph_raw(start_point_str, stop_point_str, grouping)
+        )
+        graph_raw_edges.sort(key=lambda x: [y if y else '' for y in x[:2]])
+        return graph_raw_edges
+
+    def iter_graph_raw(
+            self, start_point_str=None, stop_point_str=None, grouping=None):
+        """Yield concrete graph edges between specified cycle points.
+
+        As get_graph_raw, but edges are yielded (unsorted, one cycle point of
+        one sequence at a time) as they are generated, so memory use does not
+        grow with the length of the range.
+        """
         start_point = get_point(
             start_point_str or
             self.cfg['scheduling']['initial cycle point']
@@ -2024,108 +2117,135 @@ class WorkflowConfig:
         workflow_final_point = get_point(
             self.cfg['scheduling']['final cycle point'])
 
-        # For the computed stop point, store VIS_N_POINTS of each sequence,
-        # and then cull later to the first VIS_N_POINTS over all sequences.
-
+        # Map members of closed families to the family.
         # For nested closed families, only consider the outermost one
         fpd = self.runtime['first-parent descendants']
-        clf_map = {}
-        for name in grouping:
+        clf_map = {
+            member: name
+            for name in grouping
             if all(
                 name not in fpd[i]
                 for i in grouping
-            ):
-                clf_map[name] = fpd[name]
+            )
+            for member in fpd[name]
+        }
 
+        # For the computed stop point, store VIS_N_POINTS of each sequence,
+        # and then cull later to the first VIS_N_POINTS over all sequences.
         gr_edges = {}
         start_point_offset_cache = {}
-        point_offset_cache = None
-        for sequence, edges in self.edges.items():
-            # Get initial cycle point for this sequence
-            point = sequence.get_first_point(start_point)
-            new_points = []
-            while point is not None:
-                if point not in new_points:
-                    new_points.append(point)
-                if stop_point is not None and point > stop_point:
-                    # Beyond requested final cycle point.
-                    break
-                if (workflow_final_point is not None
-                        and point > workflow_final_point):
-                    # Beyond workflow final cycle point.
-                    break
-                if stop_point is None and len(new_points) > self.VIS_N_POINTS:
-                    # Take VIS_N_POINTS cycles from each sequence.
-                    break
-                point_offset_cache = {}
+        try:
+            for sequence, edges in self.edges.items():
+                # Parse the left hand nodes once for all points.
+                parsed_edges = []
                 for left, right, suicide, cond in edges:
                     if is_validate and (not right or suicide):
                         continue
-                    if right:
-                        r_id = (right, point)
-                    else:
-                        r_id = None
                     if left.startswith('@'):
                         # @xtrigger node.
-                        name = left
-                        offset_is_from_icp = False
-                        offset = None
+                        name, offset, offset_is_from_icp = left, None, False
                     else:
                         name, offset, _, offset_is_from_icp, _, _ = (
                             GraphNodeParser.get_inst().parse(left))
-                    if offset:
-                        if offset_is_from_icp:
-                            cache = start_point_offset_cache
-                            rel_point = start_point
-                        else:
-                            cache = point_offset_cache
-                            rel_point = point
-                        try:
-                            l_point = cache[offset]
-                        except KeyError:
-                            l_point = get_point_relative(offset, rel_point)
-                            cache[offset] = l_point
-                    else:
-                        l_point = point
-                    l_id = (name, l_point)
-
-                    if l_id is None and r_id is None:
+                    parsed_edges.append((
+                        name, offset, offset_is_from_icp, right, suicide, cond
+                    ))
+                if stop_point is None:
+                    # Take VIS_N_POINTS cycles from each sequence.
+                    points = []
+                    point = sequence.get_first_point(start_point)
+                    while (
+                        point is not None
+                        and len(points) < self.VIS_N_POINTS
+                        and (
+                            workflow_final_point is None
+                            or point <= workflow_final_point
+                        )
+                    ):
+                        points.append(point)
+                        point = sequence.get_next_point_on_sequence(point)
+                else:
+                    # Expand the sequence up to the requested (or workflow)
+                    # final cycle point in one go.
+                    points = sequence.get_points(
+                        start_point,
+                        stop_point if workflow_final_point is None
+                        else min(stop_point, workflow_final_point)
+                    )
+                for point in points:
+                    point_edges = self._get_point_graph_raw(
+                        point,
+                        parsed_edges,
+                        start_point,
+                        actual_first_point,
+                        start_point_offset_cache,
+                        clf_map,
+                        is_validate,
+                    )
+                    if not point_edges:
                         continue
-                    if l_id is not None and actual_first_point > l_id[1]:
-                        # Check that l_id is not earlier than start time.
-                        if (r_id is None or r_id[1] < actual_first_point or
-                                is_validate):
-                            continue
-                        # Pre-initial dependency;
-                        # keep right hand node.
-                        l_id = r_id
-                        r_id = None
-                    if point not in gr_edges:
-                        gr_edges[point] = []
-                    if is_validate:
-                        gr_edges[point].append((l_id, r_id))
+                    if stop_point is None:
+                        gr_edges.setdefault(point, []).extend(point_edges)
                     else:
-                        lstr, rstr = self._close_families(l_id, r_id, clf_map)
-                        gr_edges[point].append(
-                            (lstr, rstr, None, suicide, cond))
-                # Increment the cycle point.
-                point = sequence.get_next_point_on_sequence(point)
-
-        del clf_map
-        del start_point_offset_cache
-        del point_offset_cache
-        GraphNodeParser.get_inst().clear()
-        if stop_point is None:
-            # Prune to VIS_N_POINTS points in total.
-            graph_raw_edges = []
-            for point in sorted(gr_edges)[:self.VIS_N_POINTS]:
-                graph_raw_edges.extend(gr_edges[point])
-        else:
-            # Flatten nested list.
-            graph_raw_edges = (
-                [i for sublist in gr_edges.values() for i in sublist])
-        graph_raw_edges.sort(key=lambda x: [y if y else '' for y in x[:2]])
-        return graph_raw_edges
+                        yield from point_edges
+            if stop_point is None:
+                # Prune to VIS_N_POINTS points in total.
+                for point in sorted(gr_edges)[:self.VIS_N_POINTS]:
+                    yield from gr_edges[point]
+        finally:
+            GraphNodeParser.get_inst().clear()
+
+    def _get_point_graph_raw(
+        self,
+        point,
+        parsed_edges,
+        start_point,
+        actual_first_point,
+        start_point_offset_cache,
+        clf_map,
+        is_validate,
+    ):
+        """Return the concrete graph edges of a sequence at a cycle point."""
+        ret = []
+        point_offset_cache = {}
+        for name, offset, offset_is_from_icp, right, suicide, cond in (
+            parsed_edges
+        ):
+            if right:
+                r_id = (right, point)
+            else:
+                r_id = None
+            if offset:
+                if offset_is_from_icp:
+                    cache = start_point_offset_cache
+                    rel_point = start_point
+                else:
+                    cache = point_offset_cache
+                    rel_point = point
+                try:
+                    l_point = cache[offset]
+                except KeyError:
+                    l_point = get_point_relative(offset, rel_point)
+                    cache[offset] = l_point
+            else:
+                l_point = point
+            l_id = (name, l_point)
+
+            if actual_first_point > l_point:
+                # Check that l_id is not earlier than start time.
+                if (r_id is None or r_id[1] < actual_first_point or
+                        is_validate):
+                    continue
+                # Pre-initial dependency;
+                # keep right hand node.
+                l_id = r_id
+                r_id = None
+            if is_validate:
+                ret.append((l_id, r_id))
+            else:
+                lstr, rstr = self._close_families(l_id, r_id, clf_map)
+                ret.append((lstr, rstr, None, suicide, cond))
+        return ret
 
     def get_node_labels(self, start_point_str=None, stop_point_str=None):
         """Return dependency graph node labels."""
@@ -2146,49 +2266,25 @@ class WorkflowConfig:
         """Turn (name, point) to 'name.point' for edge.
 
         Replace close family members with family nodes if relevant.
+
+        Args:
+            clf_map: Map of closed family members to the family.
+
         """
         lret = None
-        lname, lpoint = None, None
         if l_id:
             lname, lpoint = l_id
             lret = Tokens(
                 cycle=str(lpoint),
-                task=lname,
+                task=clf_map.get(lname, lname),
             ).relative_id
         rret = None
-        rname, rpoint = None, None
         if r_id:
             rname, rpoint = r_id
             rret = Tokens(
                 cycle=str(rpoint),
-                task=rname,
+                task=clf_map.get(rname, rname),
             ).relative_id
-
-        for fam_name, fam_members in clf_map.items():
-            if lname in fam_members and rname in fam_members:
-                # l and r are both members
-                lret = Tokens(
-                    cycle=str(lpoint),
-                    task=fam_name,
-                ).relative_id
-                rret = Tokens(
-                    cycle=str(rpoint),
-                    task=fam_name,
-                ).relative_id
-                break
-            elif lname in fam_members:
-                # l is a member
-                lret = Tokens(
-                    cycle=str(lpoint),
-                    task=fam_name,
-                ).relative_id
-            elif rname in fam_members:
-                # r is a member
-                rret = Tokens(
-                    cycle=str(rpoint),
-                    task=fam_name,
-                ).relative_id
-
         return lret, rret
 
     def load_graph(self):
@@ -2243,29 +2339,49 @@ class WorkflowConfig:
         # Parse and process each graph section.
         task_triggers = {}
         task_output_opt = {}
-        for section, graph in sections:
-            try:
-                seq = get_sequence(section, icp, fcp)
-            except (AttributeError, TypeError, ValueError, CylcError) as exc:
-                if cylc.flow.flags.verbosity > 1:
-                    traceback.print_exc()
-                msg = 'Cannot process recurrence %s' % section
-                msg += ' (initial cycle point=%s)' % icp
-                msg += ' (final cycle point=%s)' % fcp
-                if isinstance(exc, CylcError):
-                    msg += ' %s' % exc.args[0]
-                raise WorkflowConfigError(msg)
-            self.sequences.append(seq)
-            parser = GraphParser(
+        processes = glbl_cfg().get(['scheduler', 'graph parsing processes'])
+        parsers = None
+        if processes > 1 and len(sections) > 1:
+            parsers = parse_graphs(
+                [graph for _, graph in sections],
                 family_map,
                 self.parameters,
-                task_output_opt=task_output_opt
+                min(processes, len(sections)),
+                task_output_opt,
             )
-            parser.parse_graph(graph)
-            task_output_opt.update(parser.task_output_opt)
-            self.workflow_polling_tasks.update(
-                parser.workflow_state_polling_tasks)
-            self._proc_triggers(parser, seq, task_triggers)
+        try:
+            for section, graph in sections:
+                try:
+                    seq = get_sequence(section, icp, fcp)
+                except (
+                    AttributeError, TypeError, ValueError, CylcError
+                ) as exc:
+                    if cylc.flow.flags.verbosity > 1:
+                        traceback.print_exc()
+                    msg = 'Cannot process recurrence %s' % section
+                    msg += ' (initial cycle point=%s)' % icp
+                    msg += ' (final cycle point=%s)' % fcp
+                    if isinstance(exc, CylcError):
+                        msg += ' %s' % exc.args[0]
+                    raise WorkflowConfigError(msg)
+                self.sequences.append(seq)
+                if parsers is not None:
+                    parser = next(parsers)
+                else:
+                    parser = GraphParser(
+                        family_map,
+                        self.parameters,
+                        task_output_opt=task_output_opt
+                    )
+                    parser.parse_graph(graph)
+                task_output_opt.update(parser.task_output_opt)
+                self.workflow_polling_tasks.update(
+                    parser.workflow_state_polling_tasks)
+                self._proc_triggers(parser, seq, task_triggers)
+        finally:
+            if parsers is not None:
+                # shut down the worker processes
+                parsers.close()
 
         self.set_required_outputs(task_output_opt)
 
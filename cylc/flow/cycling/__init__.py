@@ -321,7 +321,8 @@ class SequenceBase(metaclass=ABCMeta):
     get_offset & set_offset (deprecated), is_on_sequence,
     get_nearest_prev_point, get_next_point,
     get_next_point_on_sequence, get_first_point
-    get_start_point, and get_stop_point.
+    get_start_point, and get_stop_point. They may override get_points
+    with a faster bulk implementation.
 
     They should also provide a self.__eq__ implementation
     which should return whether a SequenceBase-derived object
@@ -405,6 +406,20 @@ class SequenceBase(metaclass=ABCMeta):
         """Return the first point >= to point, or None if out of bounds."""
         pass
 
+    def get_points(self, start_point, stop_point):
+        """Return all points of this sequence from start_point to stop_point
+        (inclusive), in order.
+
+        Use this in preference to repeated calls to get_next_point (etc)
+        when walking a range of points.
+        """
+        points = []
+        point = self.get_first_point(start_point)
+        while point is not None and point <= stop_point:
+            points.append(point)
+            point = self.get_next_point_on_sequence(point)
+        return points
+
     @abstractmethod
     def get_start_point(self):
         """Return the first point of this sequence."""
@@ -457,6 +472,22 @@ class ExclusionBase(metaclass=ABCMeta):
             return True
         return False
 
+    def get_points(self, start_point, stop_point):
+        """Return the set of excluded points from start_point to stop_point
+        (inclusive).
+
+        Testing membership of this set is much cheaper than testing
+        membership of this exclusion one point at a time.
+        """
+        points = {
+            point
+            for point in self.exclusion_points
+            if start_point <= point <= stop_point
+        }
+        for sequence in self.exclusion_sequences:
+            points.update(sequence.get_points(start_point, stop_point))
+        return points
+
     def __getitem__(self, key):
         """Allows indexing of the exclusion object"""
         return self.exclusion_sequences[key]
@@ -549,6 +549,28 @@ class IntegerSequence(SequenceBase):
             return self.get_next_point_on_sequence(point)
         return point
 
+    def get_points(self, start_point, stop_point):
+        """Return all points of this sequence from start_point to stop_point
+        (inclusive), in order."""
+        first_point = self.get_first_point(start_point)
+        if first_point is None or first_point > stop_point:
+            return []
+        if not self.i_step:
+            return [first_point]
+        if self.p_stop is not None and self.p_stop < stop_point:
+            stop_point = self.p_stop
+        excluded = set()
+        if self.exclusions:
+            excluded = self.exclusions.get_points(first_point, stop_point)
+        points = []
+        for value in range(
+            int(first_point), int(stop_point) + 1, int(self.i_step)
+        ):
+            point = IntegerPoint(str(value))
+            if point not in excluded:
+                points.append(point)
+        return points
+
     def get_start_point(self):
         """Return the first point in this sequence, or None."""
         if self.exclusions and self.p_start in self.exclusions:
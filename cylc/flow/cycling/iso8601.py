@@ -19,7 +19,7 @@
 import contextlib
 from functools import lru_cache
 import re
-from typing import List, Optional, TYPE_CHECKING, Tuple
+from typing import List, Optional, Set, TYPE_CHECKING, Tuple
 
 from metomi.isodatetime.data import Calendar, CALENDAR, Duration
 from metomi.isodatetime.dumpers import TimePointDumper
@@ -79,7 +79,12 @@ class ISO8601Point(PointBase):
     TYPE = CYCLER_TYPE_ISO8601
     TYPE_SORT_KEY = CYCLER_TYPE_SORT_KEY_ISO8601
 
-    __slots__ = ('value')
+    __slots__ = ('value', '_key')
+
+    def __init__(self, value):
+        super().__init__(value)
+        # (calendar mode, sort key), see _get_key
+        self._key = None
 
     @classmethod
     def from_nonstandard_string(cls, point_string):
@@ -96,6 +101,7 @@ class ISO8601Point(PointBase):
         """Reformat self.value into a standard representation."""
         try:
             self.value = str(point_parse(self.value))
+            self._key = None
         except IsodatetimeError as exc:
             if self.value.startswith("+") or self.value.startswith("-"):
                 message = WARNING_PARSE_EXPANDED_YEAR_DIGITS % (
@@ -124,7 +130,45 @@ class ISO8601Point(PointBase):
         return str(point + interval)
 
     def _cmp(self, other: 'ISO8601Point') -> int:
-        return self._iso_point_cmp(self.value, other.value, CALENDAR.mode)
+        key = self._get_key()
+        other_key = other._get_key()
+        if key is None or other_key is None:
+            return self._iso_point_cmp(self.value, other.value, CALENDAR.mode)
+        return cmp(key, other_key)
+
+    def _get_key(self) -> Optional[int]:
+        """Return the sort key for this point (see _iso_point_key).
+
+        This is stored on the point so that points can be compared without
+        parsing them.
+        """
+        if self._key is None or self._key[0] != CALENDAR.mode:
+            self._key = (
+                CALENDAR.mode,
+                self._iso_point_key(self.value, CALENDAR.mode)
+            )
+        return self._key[1]
+
+    @staticmethod
+    @lru_cache(10000)
+    def _iso_point_key(point_string, _calendar_mode):
+        """Return an integer which orders the parsed point_string.
+
+        This is the number of seconds since 0000-00-00T00Z with each month
+        given 32 days and each year 13 months. So it orders points (in the
+        same calendar) correctly regardless of the calendar or time zone.
+
+        Returns None for truncated points (which can't be ordered this way).
+        """
+        point = point_parse(point_string)
+        if point.truncated:
+            return None
+        point = point.to_utc()
+        year, month, day = point.get_calendar_date()
+        return (
+            ((year * 13 + month) * 32 + day) * CALENDAR.SECONDS_IN_DAY
+            + point.get_second_of_day()
+        )
 
     @staticmethod
     @lru_cache(10000)
@@ -597,6 +641,41 @@ class ISO8601Sequence(SequenceBase):
                 return ret
         return None
 
+    def get_points(
+        self,
+        start_point: ISO8601Point,
+        stop_point: ISO8601Point
+    ) -> List[ISO8601Point]:
+        """Return all points of this sequence from start_point to stop_point
+        (inclusive), in order.
+
+        This walks the recurrence once and applies exclusions as a set,
+        rather than re-parsing each point and testing it against every
+        exclusion sequence as get_next_point_on_sequence does.
+        """
+        first_point = self.get_first_point(start_point)
+        if first_point is None or first_point > stop_point:
+            return []
+        excluded: Set[ISO8601Point] = set()
+        if self.exclusions:
+            excluded = self.exclusions.get_points(first_point, stop_point)
+        points = []
+        stop_iso_point = point_parse(stop_point.value)
+        iso_point = point_parse(first_point.value)
+        prev_point = None
+        while iso_point is not None and iso_point <= stop_iso_point:
+            point = ISO8601Point(str(iso_point))
+            if point == prev_point:
+                raise SequenceDegenerateError(
+                    self.recurrence, WorkflowSpecifics.DUMP_FORMAT,
+                    prev_point, point
+                )
+            if point not in excluded:
+                points.append(point)
+            prev_point = point
+            iso_point = self.recurrence.get_next(iso_point)
+        return points
+
     def get_start_point(self):
         """Return the first point in this sequence, or None."""
         for recurrence_iso_point in self.recurrence:
@@ -62,6 +62,7 @@ from time import time
 from typing import (
     Any,
     Dict,
+    Iterable,
     Optional,
     List,
     Set,
@@ -85,6 +86,7 @@ from cylc.flow.parsec.util import (
     pdeepcopy,
     poverride
 )
+from cylc.flow.rundb import CylcWorkflowDAO
 from cylc.flow.workflow_status import get_workflow_status
 from cylc.flow.task_job_logs import JOB_LOG_OPTS, get_task_job_log
 from cylc.flow.task_proxy import TaskProxy
@@ -126,6 +128,9 @@ DELTA_ADDED = 'added'
 DELTA_UPDATED = 'updated'
 DELTA_PRUNED = 'pruned'
 LATEST_STATE_TASKS_QUEUE_SIZE = 5
+# The maximum number of jobs held in the data store for each task proxy,
+# older jobs are loaded from the database on request (see get_db_jobs).
+MAX_TASK_JOBS = 10
 
 MESSAGE_MAP = {
     EDGES: PbEdge,
@@ -160,6 +165,17 @@ DELTAS_MAP = {
 
 DELTA_FIELDS = {DELTA_ADDED, DELTA_UPDATED, DELTA_PRUNED}
 
+# Element fields indexed for query filters (see ElementIndex).
+INDEXED_FIELDS = {
+    FAMILY_PROXIES: (
+        'state', 'cycle_point', 'name', 'is_held', 'is_queued', 'is_runahead'
+    ),
+    JOBS: ('state', 'cycle_point', 'name'),
+    TASK_PROXIES: (
+        'state', 'cycle_point', 'name', 'is_held', 'is_queued', 'is_runahead'
+    ),
+}
+
 JOB_STATUSES_ALL = [
     TASK_STATUS_SUBMITTED,
     TASK_STATUS_SUBMIT_FAILED,
@@ -289,6 +305,20 @@ def runtime_from_config(rtconfig):
     )
 
 
+def merge_element(key, element, updated):
+    """Merge updated fields into a data-store element."""
+    # Clear fields that require overwrite with delta
+    if key == WORKFLOW and updated.states_updated:
+        clear_fields = CLEAR_FIELD_MAP[key]
+    else:
+        clear_fields = CLEAR_FIELD_MAP[key].intersection(
+            field.name for field, _ in updated.ListFields()
+        )
+    for field in clear_fields:
+        element.ClearField(field)
+    element.MergeFrom(updated)
+
+
 def apply_delta(key, delta, data):
     """Apply delta to specific data-store workflow and type."""
     # Assimilate new data
@@ -300,22 +330,11 @@ def apply_delta(key, delta, data):
     # Merge in updated fields
     if getattr(delta, 'updated', False):
         if key == WORKFLOW:
-            # Clear fields that require overwrite with delta
-            field_set = {f.name for f, _ in delta.updated.ListFields()}
-            for field in CLEAR_FIELD_MAP[key]:
-                if field in field_set or delta.updated.states_updated:
-                    data[key].ClearField(field)
-            data[key].MergeFrom(delta.updated)
+            merge_element(key, data[key], delta.updated)
         else:
             for element in delta.updated:
                 try:
-                    data_element = data[key][element.id]
-                    # Clear fields that require overwrite with delta
-                    if CLEAR_FIELD_MAP[key]:
-                        for field, _ in element.ListFields():
-                            if field.name in CLEAR_FIELD_MAP[key]:
-                                data_element.ClearField(field.name)
-                    data_element.MergeFrom(element)
+                    merge_element(key, data[key][element.id], element)
                 except KeyError as exc:
                     # Ensure data-sync doesn't fail with
                     # network issues, sync reconcile/validate will catch.
@@ -422,12 +441,163 @@ def create_delta_store(delta=None, workflow_id=None):
     return delta_store
 
 
+def _copy_element(element):
+    """Return a copy of a protobuf element."""
+    copy = type(element)()
+    copy.CopyFrom(element)
+    return copy
+
+
+def merge_delta_store(delta_store, new_delta_store):
+    """Merge a delta store into the one which preceded it.
+
+    Applying the merged delta store is equivalent to applying both in turn.
+    This is used to combine the deltas queued for subscribers which have
+    fallen behind.
+
+    Elements are copied from new_delta_store, so only delta_store is
+    modified.
+
+    Args:
+        delta_store (dict):
+            A delta store (see create_delta_store), modified in place.
+        new_delta_store (dict):
+            The delta store which followed it.
+
+    """
+    added = delta_store[DELTA_ADDED]
+    updated = delta_store[DELTA_UPDATED]
+    pruned = delta_store[DELTA_PRUNED]
+    new_added = new_delta_store[DELTA_ADDED]
+    new_updated = new_delta_store[DELTA_UPDATED]
+    new_pruned = new_delta_store[DELTA_PRUNED]
+
+    # the workflow is replaced if added and its updates merged otherwise
+    if new_added[WORKFLOW].ListFields():
+        added[WORKFLOW] = _copy_element(new_added[WORKFLOW])
+        updated[WORKFLOW] = PbWorkflow()
+    if new_updated[WORKFLOW].ListFields():
+        if added[WORKFLOW].ListFields():
+            merge_element(WORKFLOW, added[WORKFLOW], new_updated[WORKFLOW])
+        else:
+            merge_element(WORKFLOW, updated[WORKFLOW], new_updated[WORKFLOW])
+    if new_pruned.get(WORKFLOW):
+        pruned[WORKFLOW] = True
+
+    for key in DATA_TEMPLATE:
+        if key == WORKFLOW:
+            continue
+        for id_, element in new_added.get(key, {}).items():
+            added[key][id_] = _copy_element(element)
+            updated[key].pop(id_, None)
+        for id_, element in new_updated.get(key, {}).items():
+            if id_ in added[key]:
+                merge_element(key, added[key][id_], element)
+            elif id_ in updated[key]:
+                merge_element(key, updated[key][id_], element)
+            else:
+                updated[key][id_] = _copy_element(element)
+        for id_ in new_pruned.get(key, []):
+            # NOTE: elements added then pruned are kept in added so that
+            # pruning them removes the references to them (e.g. from their
+            # task or the workflow) queued in updated
+            updated[key].pop(id_, None)
+        # elements pruned then added again are no longer pruned
+        pruned[key] = list(dict.fromkeys([
+            *(
+                id_
+                for id_ in pruned[key]
+                if id_ not in new_added.get(key, {})
+            ),
+            *new_pruned.get(key, []),
+        ]))
+
+
+class ElementIndex:
+    """Index the data-store elements of one type by the values of fields.
+
+    Used to narrow down query filters without scanning every element.
+
+    Args:
+        fields: The names of the element fields to index.
+
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = tuple(fields)
+        # {field: {value: {id, ...}}}
+        self.index: Dict[str, Dict[Any, Set[str]]] = {
+            field: {} for field in self.fields
+        }
+        # {id: (value, ...)}
+        self.values: Dict[str, tuple] = {}
+        # The order in which elements were added (the data-store order).
+        self.order: Dict[str, int] = {}
+        self._counter = 0
+
+    def update(self, element) -> None:
+        """Add or re-index an element."""
+        values = tuple(getattr(element, field) for field in self.fields)
+        old_values = self.values.get(element.id)
+        if old_values == values:
+            return
+        if old_values is None:
+            old_values = (None,) * len(self.fields)
+            self.order[element.id] = self._counter
+            self._counter += 1
+        for field, old_value, value in zip(self.fields, old_values, values):
+            if old_value == value:
+                continue
+            if old_value is not None:
+                self._discard(field, old_value, element.id)
+            self.index[field].setdefault(value, set()).add(element.id)
+        self.values[element.id] = values
+
+    def remove(self, id_: str) -> None:
+        """Remove an element from the index."""
+        values = self.values.pop(id_, None)
+        if values is None:
+            return
+        del self.order[id_]
+        for field, value in zip(self.fields, values):
+            self._discard(field, value, id_)
+
+    def _discard(self, field, value, id_):
+        ids = self.index[field][value]
+        ids.discard(id_)
+        if not ids:
+            del self.index[field][value]
+
+    def apply_delta(self, delta, elements: Dict[str, Any]) -> None:
+        """Update the index after a delta has been applied to elements."""
+        for element in (*delta.added, *delta.updated):
+            with suppress(KeyError):
+                self.update(elements[element.id])
+        for id_ in delta.pruned:
+            self.remove(id_)
+
+    def get(self, field: str, values: Iterable[Any]) -> Set[str]:
+        """Return the IDs of elements with any of the given field values."""
+        index = self.index[field]
+        ids: Set[str] = set()
+        for value in values:
+            ids.update(index.get(value, ()))
+        return ids
+
+    def sort(self, ids: Iterable[str]) -> List[str]:
+        """Return IDs in the order the elements were added."""
+        return sorted(ids, key=self.order.__getitem__)
+
+
 class DataStoreMgr:
     """Manage the workflow data store.
 
     Attributes:
         .ancestors (dict):
             Local store of config.get_first_parent_ancestors()
+        .indexes (dict):
+            ElementIndex of workflow data elements by type, for the element
+            types in INDEXED_FIELDS.
         .data (dict):
             .edges (dict):
                 cylc.flow.data_messages_pb2.PbEdge by internal ID.
@@ -489,6 +659,10 @@ class DataStoreMgr:
         self.data = {
             self.workflow_id: deepcopy(DATA_TEMPLATE)
         }
+        self.indexes = {
+            key: ElementIndex(fields)
+            for key, fields in INDEXED_FIELDS.items()
+        }
         self.added = deepcopy(DATA_TEMPLATE)
         self.updated = deepcopy(DATA_TEMPLATE)
         self.deltas = {
@@ -513,6 +687,7 @@ class DataStoreMgr:
         self.n_window_depths = {}
         self.update_window_depths = False
         self.db_load_task_proxies = {}
+        self.db_load_task_jobs = set()
         self.family_pruned_ids = set()
         self.prune_trigger_nodes = {}
         self.prune_flagged_nodes = set()
@@ -521,20 +696,32 @@ class DataStoreMgr:
         self.updates_pending_follow_on = False
         self.publish_pending = False
 
-    def initiate_data_model(self, reloaded=False):
+    def initiate_data_model(self, reloaded=False, changed_tasks=None):
         """Initiate or Update data model on start/restart/reload.
 
         Args:
             reloaded (bool, optional):
                 Reset data-store before regenerating.
+            changed_tasks (set, optional):
+                On reload, the names of tasks whose definitions changed
+                (see WorkflowConfig.reuse_taskdefs). Definition elements of
+                other tasks are kept rather than regenerated.
 
         """
+        unchanged = {}
         # Reset attributes/data-store on reload:
         if reloaded:
+            if changed_tasks is not None:
+                unchanged = {
+                    t_id: task
+                    for t_id, task in self.data[self.workflow_id][
+                        TASKS].items()
+                    if task.name not in changed_tasks
+                }
             self.__init__(self.schd, self.n_edge_distance)
 
         # Static elements
-        self.generate_definition_elements()
+        self.generate_definition_elements(unchanged)
 
         # Update workflow statuses and totals (assume needed)
         self.update_workflow(True)
@@ -556,13 +743,20 @@ class DataStoreMgr:
         # Clear second batch after publishing
         self.clear_delta_batch()
 
-    def generate_definition_elements(self):
+    def generate_definition_elements(self, unchanged=None):
         """Generate static definition data elements.
 
         Populates the tasks, families, and workflow elements
         with data from and/or derived from the workflow definition.
 
+        Args:
+            unchanged (dict, optional):
+                Existing task definition elements, by ID, which are still
+                valid (i.e. unchanged by a reload), to reuse.
+
         """
+        if unchanged is None:
+            unchanged = {}
         config = self.schd.config
         update_time = time()
         tasks = self.added[TASKS]
@@ -595,6 +789,14 @@ class DataStoreMgr:
         for name, tdef in config.taskdefs.items():
             t_id = self.definition_id(name)
             t_stamp = f'{t_id}@{update_time}'
+            if t_id in unchanged:
+                task = PbTask()
+                task.CopyFrom(unchanged[t_id])
+                task.stamp = t_stamp
+                # (proxies are re-added from the task pool)
+                task.ClearField('proxies')
+                tasks[t_id] = task
+                continue
             task = PbTask(
                 stamp=t_stamp,
                 id=t_id,
@@ -1257,14 +1459,10 @@ class DataStoreMgr:
         # Active, but not in the data-store yet (new).
         if tp_id in self.n_window_nodes:
             self._process_internal_task_proxy(itask, tproxy)
-            # Has run before, so get history.
-            # Cannot batch as task is active (all jobs retrieved at once).
+            # Has run before, so get job history (the task is active so
+            # only its jobs are loaded, see load_db_task_jobs).
             if itask.submit_num > 0:
-                flow_db = self.schd.workflow_db_mgr.pri_dao
-                for row in flow_db.select_jobs_for_datastore(
-                        {itask.identity}
-                ):
-                    self.insert_db_job(1, row)
+                self.db_load_task_jobs.add(itask.identity)
         else:
             # Batch non-active node for load of DB history.
             self.db_load_task_proxies[itask.identity] = (
@@ -1392,8 +1590,12 @@ class DataStoreMgr:
             fp_parent.child_families.append(child_fam)
 
     def apply_task_proxy_db_history(self):
-        """Extract and apply DB history on given task proxies."""
-        if not self.db_load_task_proxies:
+        """Extract and apply DB history on given task proxies.
+
+        The history of all task proxies added since the last update is
+        loaded at once to avoid issuing queries for each task.
+        """
+        if not self.db_load_task_proxies and not self.db_load_task_jobs:
             return
 
         flow_db = self.schd.workflow_db_mgr.pri_dao
@@ -1471,12 +1673,48 @@ class DataStoreMgr:
                 ]
             )
 
-        # Batch load jobs from DB.
-        for row in flow_db.select_jobs_for_datastore(task_ids):
-            self.insert_db_job(1, row)
+        # Batch load jobs from DB (of active tasks too).
+        self.load_db_task_jobs(task_ids)
 
         self.db_load_task_proxies.clear()
 
+    def load_db_task_jobs(self, task_ids=None):
+        """Load the jobs of task proxies from the DB.
+
+        The jobs of active task proxies which have run before are queued
+        (in db_load_task_jobs) as they are added to the store, then loaded
+        at once before a job is next looked up (see store_node_fetcher) or
+        on the next update. Only the most recent jobs of each task are held
+        in the data store (see MAX_TASK_JOBS).
+
+        Args:
+            task_ids (set, optional):
+                Relative IDs of other task proxies to load the jobs of.
+
+        """
+        task_ids = {*(task_ids or ()), *self.db_load_task_jobs}
+        self.db_load_task_jobs.clear()
+        if not task_ids:
+            return
+        task_jobs = {}
+        for row in self.schd.workflow_db_mgr.pri_dao.select_jobs_for_datastore(
+            task_ids
+        ):
+            task_jobs.setdefault(row[:2], []).append(row)
+        for (cycle, name), rows in task_jobs.items():
+            rows.sort(key=lambda row: row[2])
+            for row in rows[:-MAX_TASK_JOBS]:
+                self.insert_db_job(1, row, id_only=True)
+            for row in rows[-MAX_TASK_JOBS:]:
+                self.insert_db_job(1, row)
+            # jobs may have been submitted since the task was added
+            tp_id, tproxy = self.store_node_fetcher(
+                self.id_.duplicate(cycle=cycle, task=name)
+            )
+            tp_delta = self.updated[TASK_PROXIES].get(tp_id)
+            if tproxy and tp_delta is not None:
+                self.prune_task_jobs(tproxy, tp_delta)
+
     def _process_internal_task_proxy(
         self,
         itask: 'TaskProxy',
@@ -1615,12 +1853,128 @@ class DataStoreMgr:
         )
         tp_delta.job_submits = sub_num
         tp_delta.jobs.append(j_id)
+        self.prune_task_jobs(tproxy, tp_delta)
         self.updates_pending = True
 
-    def insert_db_job(self, row_idx, row):
-        """Load job element from DB post restart."""
+    def prune_task_jobs(self, tproxy, tp_delta):
+        """Prune the oldest jobs of a task proxy from the data store.
+
+        Only the most recent MAX_TASK_JOBS jobs of each task proxy are held,
+        older jobs remain listed against the task proxy and are loaded from
+        the database on request (see get_db_jobs).
+
+        Args:
+            tproxy (PbTaskProxy): The task proxy.
+            tp_delta (PbTaskProxy): Its pending update.
+
+        """
+        jobs = self.data[self.workflow_id][JOBS]
+        pruned = set(self.deltas[JOBS].pruned)
+        held = [
+            j_id
+            for j_id in dict.fromkeys((*tproxy.jobs, *tp_delta.jobs))
+            if (
+                (j_id in jobs or j_id in self.added[JOBS])
+                and j_id not in pruned
+            )
+        ]
+        if len(held) > MAX_TASK_JOBS:
+            held.sort(key=lambda j_id: int(Tokens(j_id)['job']))
+            self.deltas[JOBS].pruned.extend(held[:-MAX_TASK_JOBS])
+
+    def insert_db_job(self, row_idx, row, id_only=False):
+        """Load job element from DB post restart.
+
+        Args:
+            row_idx (int): Row number, 0 for the first row.
+            row (tuple): Row from select_jobs_for_datastore.
+            id_only (bool):
+                Only list the job against its task proxy, don't hold it in
+                the data store (see MAX_TASK_JOBS).
+
+        """
         if row_idx == 0:
             LOG.info("LOADING job data")
+        tp_tokens = self.id_.duplicate(
+            cycle=row[0],
+            task=row[1],
+        )
+        tproxy: Optional[PbTaskProxy]
+        tp_id, tproxy = self.store_node_fetcher(tp_tokens)
+        if not tproxy:
+            return
+        if tp_tokens.duplicate(job=str(row[2])).id in self.added[JOBS]:
+            # the job has been submitted since the task was loaded
+            return
+        j_buf = self._get_db_job(tp_id, tproxy, row)
+        if j_buf is None:
+            return
+        j_id = j_buf.id
+        if not id_only:
+            self.added[JOBS][j_id] = j_buf
+            getattr(self.updated[WORKFLOW], JOBS).append(j_id)
+        tp_delta = self.updated[TASK_PROXIES].setdefault(
+            tp_id,
+            PbTaskProxy(
+                stamp=f'{tp_id}@{time()}',
+                id=tp_id,
+            )
+        )
+        tp_delta.job_submits = max((j_buf.submit_num, tp_delta.job_submits))
+        tp_delta.jobs.append(j_id)
+        self.updates_pending = True
+
+    def get_db_jobs(self, job_ids: Iterable[str]) -> Dict[str, PbJob]:
+        """Load jobs which are not held in the data store from the DB.
+
+        Only the most recent jobs of each task proxy are held in the data
+        store (see MAX_TASK_JOBS), older jobs are loaded from the public
+        database when requested. They are not added to the data store.
+
+        This is called by the GraphQL resolvers (in the server thread) so
+        it uses its own connection to the database.
+
+        Args:
+            job_ids: Job IDs, those held in the data store or not listed
+                against a task proxy in it are ignored.
+
+        Returns:
+            {job_id: job}
+
+        """
+        data = self.data[self.workflow_id]
+        tproxies = {}
+        for j_id in job_ids:
+            if j_id in data[JOBS]:
+                continue
+            tp_id = Tokens(j_id).duplicate(job=None).id
+            tproxy = data[TASK_PROXIES].get(tp_id)
+            if tproxy is not None and j_id in tproxy.jobs:
+                tproxies[j_id] = (tp_id, tproxy)
+        if not tproxies:
+            return {}
+        with CylcWorkflowDAO(
+            self.schd.workflow_db_mgr.pub_path, is_public=True
+        ) as dao:
+            rows = dao.select_jobs_for_datastore({
+                Tokens(j_id).duplicate(job=None).relative_id
+                for j_id in tproxies
+            })
+        jobs = {}
+        for row in rows:
+            j_id = self.id_.duplicate(
+                cycle=row[0],
+                task=row[1],
+                job=str(row[2]),
+            ).id
+            if j_id in tproxies:
+                j_buf = self._get_db_job(*tproxies[j_id], row)
+                if j_buf is not None:
+                    jobs[j_id] = j_buf
+        return jobs
+
+    def _get_db_job(self, tp_id, tproxy, row) -> Optional[PbJob]:
+        """Return a job element from a DB row (see insert_db_job)."""
         (
             point_string,
             name,
@@ -1634,16 +1988,11 @@ class DataStoreMgr:
             job_id,
             platform_name
         ) = row
-        tp_tokens = self.id_.duplicate(
+        j_id = self.id_.duplicate(
             cycle=point_string,
             task=name,
-        )
-        tproxy: Optional[PbTaskProxy]
-        tp_id, tproxy = self.store_node_fetcher(tp_tokens)
-        if not tproxy:
-            return
-        j_tokens = tp_tokens.duplicate(job=str(submit_num))
-        j_id = j_tokens.id
+            job=str(submit_num),
+        ).id
 
         if run_status is not None:
             if run_status == 0:
@@ -1658,7 +2007,7 @@ class DataStoreMgr:
             else:
                 status = TASK_STATUS_SUBMIT_FAILED
         else:
-            return
+            return None
 
         try:
             update_time = time()
@@ -1688,18 +2037,8 @@ class DataStoreMgr:
         except Exception:
             LOG.exception('could not load job %s' % j_id)
         else:
-            self.added[JOBS][j_id] = j_buf
-            getattr(self.updated[WORKFLOW], JOBS).append(j_id)
-            tp_delta = self.updated[TASK_PROXIES].setdefault(
-                tp_id,
-                PbTaskProxy(
-                    stamp=f'{tp_id}@{update_time}',
-                    id=tp_id,
-                )
-            )
-            tp_delta.job_submits = max((submit_num, tp_delta.job_submits))
-            tp_delta.jobs.append(j_id)
-            self.updates_pending = True
+            return j_buf
+        return None
 
     def update_data_structure(self):
         """Workflow batch updates in the data structure."""
@@ -2608,6 +2947,9 @@ class DataStoreMgr:
             'task': TASK_PROXIES,
             'job': JOBS,
         }[tokens.lowest_token]
+        if node_type == JOBS and self.db_load_task_jobs:
+            # the job may not have been loaded from the DB yet
+            self.load_db_task_jobs()
         node_id = tokens.id
         if node_id in self.added[node_type]:
             return (node_id, self.added[node_type][node_id])
@@ -2646,6 +2988,8 @@ class DataStoreMgr:
         for key, delta in self.deltas.items():
             if delta.ListFields():
                 apply_delta(key, delta, data)
+                if key in self.indexes:
+                    self.indexes[key].apply_delta(delta, data[key])
 
     def apply_delta_checksum(self):
         """Construct checksum on deltas for export."""
@@ -17,8 +17,13 @@
 
 import re
 import contextlib
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
 
 from typing import (
+    Any,
+    Iterator,
+    NamedTuple,
     Set,
     Dict,
     List,
@@ -290,6 +295,10 @@ class GraphParser:
         else:
             self.task_output_opt = {}
 
+        # If set, calls to _set_output_opt are recorded here rather than
+        # being applied (see parse_graphs).
+        self.output_opt_calls: Optional[List[Tuple[Any, ...]]] = None
+
     def parse_graph(self, graph_string: str) -> None:
         """Parse the graph string for a single graph section.
 
@@ -433,8 +442,7 @@ class GraphParser:
             if not self.__class__.REC_PARAMS.search(line):
                 line_set.add(line)
                 continue
-            for line_ in graph_expander.expand(line):
-                line_set.add(line_)
+            line_set.update(graph_expander.iter_expand(line))
 
         # Process chains of dependencies as pairs: left => right.
         # Parameterization can duplicate some dependencies, so use a set.
@@ -751,6 +759,12 @@ class GraphParser:
             fam_member: is this from an expanded family trigger?
 
         """
+        if self.output_opt_calls is not None:
+            # defer to the parent process (see parse_graphs)
+            self.output_opt_calls.append(
+                (name, output, optional, suicide, fam_member))
+            return
+
         if cylc.flow.flags.cylc7_back_compat:
             # Set all outputs optional (set :succeed required elsewhere).
             self.task_output_opt[(name, output)] = (True, True, True)
@@ -928,3 +942,92 @@ class GraphParser:
                 self._set_triggers(mem, suicide, trigs, expr, orig_expr)
                 for output in outputs:
                     self._set_output_opt(mem, output, optional, suicide, fam)
+
+
+class ParsedGraph(NamedTuple):
+    """The result of parsing a graph string in a worker process."""
+    triggers: Dict
+    original: Dict
+    workflow_state_polling_tasks: Dict
+    # Deferred GraphParser._set_output_opt calls.
+    output_opt_calls: List[Tuple[Any, ...]]
+    # Any error raised by the parser (after the above calls were recorded).
+    error: Optional[Exception]
+
+
+# GraphParser args for worker processes (see _init_graph_parse_worker)
+_WORKER_PARSER_ARGS: Tuple[Any, ...] = ()
+
+
+def _init_graph_parse_worker(*args: Any) -> None:
+    global _WORKER_PARSER_ARGS
+    _WORKER_PARSER_ARGS = args
+
+
+def _parse_graph_worker(graph: str) -> ParsedGraph:
+    parser = GraphParser(*_WORKER_PARSER_ARGS)
+    parser.output_opt_calls = []
+    error = None
+    try:
+        parser.parse_graph(graph)
+    except Exception as exc:
+        error = exc
+    return ParsedGraph(
+        parser.triggers,
+        parser.original,
+        parser.workflow_state_polling_tasks,
+        parser.output_opt_calls,
+        error,
+    )
+
+
+def parse_graphs(
+    graphs: List[str],
+    family_map: Dict[str, List[str]],
+    parameters: Optional[Dict],
+    processes: int,
+    task_output_opt: Dict[Tuple[str, str], Tuple[bool, bool, bool]],
+) -> Iterator[GraphParser]:
+    """Parse graph strings concurrently in a pool of worker processes.
+
+    Yields a parser for each graph string, in order, as would be returned
+    by "GraphParser(family_map, parameters, task_output_opt).parse_graph".
+
+    Graph strings are parsed independently but the optional output
+    checks depend on the preceding graph strings. So these checks are
+    recorded by the workers and replayed in order here. Consequently the
+    first error raised is the same as if the graph strings were parsed in
+    turn.
+
+    The worker processes are shut down when the iterator is exhausted or
+    closed.
+
+    """
+    with ProcessPoolExecutor(
+        processes,
+        # don't fork a potentially multi-threaded process
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_graph_parse_worker,
+        initargs=(family_map, parameters),
+    ) as pool:
+        futures: List[Future] = [
+            pool.submit(_parse_graph_worker, graph)
+            for graph in graphs
+        ]
+        try:
+            for future in futures:
+                result: ParsedGraph = future.result()
+                parser = GraphParser(
+                    family_map, parameters, task_output_opt=task_output_opt)
+                parser.triggers = result.triggers
+                parser.original = result.original
+                parser.workflow_state_polling_tasks = (
+                    result.workflow_state_polling_tasks)
+                for call in result.output_opt_calls:
+                    parser._set_output_opt(*call)
+                if result.error:
+                    raise result.error
+                yield parser
+        finally:
+            for future in futures:
+                future.cancel()
@@ -63,11 +63,15 @@ Examples:
 
 import ast
 from collections import namedtuple
+from contextlib import suppress
 from functools import lru_cache
 from io import BytesIO
 import json
+import os
+from pathlib import Path
 import random
-from time import sleep
+from tempfile import NamedTemporaryFile
+from time import time
 import token
 from tokenize import tokenize
 
@@ -78,7 +82,11 @@ from cylc.flow.exceptions import (
     HostSelectException,
     NoHostsError,
 )
-from cylc.flow.hostuserutil import get_fqdn_by_host, is_remote_host
+from cylc.flow.hostuserutil import (
+    get_fqdn_by_host,
+    get_user_home,
+    is_remote_host,
+)
 from cylc.flow.remote import run_cmd, cylc_server_cmd
 from cylc.flow.terminal import parse_dirty_json
 from cylc.flow.util import restricted_evaluator
@@ -101,6 +109,11 @@ RankingExpressionEvaluator = restricted_evaluator(
 
 GLBL_CFG_STR = 'global.cylc[scheduler][run hosts]ranking'
 
+# Host metrics shared between host selections (see _get_metrics)
+METRICS_CACHE_PATH = Path(
+    get_user_home(), '.cylc', 'flow', 'host-metrics.json'
+)
+
 
 def select_workflow_host(cached=True):
     """Return a host as specified in `[workflow hosts]`.
@@ -141,7 +154,10 @@ def select_workflow_host(cached=True):
         blacklist=global_config.get(
             ['scheduler', 'run hosts', 'condemned']
         ),
-        blacklist_name='condemned host'
+        blacklist_name='condemned host',
+        metrics_cache_timeout=global_config.get(
+            ['scheduler', 'run hosts', 'metrics cache timeout']
+        ),
     )
 
 
@@ -149,7 +165,8 @@ def select_host(
     hosts,
     ranking_string=None,
     blacklist=None,
-    blacklist_name=None
+    blacklist_name=None,
+    metrics_cache_timeout=None,
 ):
     """Select a host from the provided list.
 
@@ -184,6 +201,9 @@ def select_host(
         blacklist_name (str):
             The reason for blacklisting these hosts
             (used for exceptions).
+        metrics_cache_timeout (float):
+            Reuse host metrics cached on disk if they are younger than this
+            number of seconds (see `_get_metrics`).
 
     Raises:
         HostSelectException:
@@ -246,7 +266,7 @@ def select_host(
     # filter and sort by rankings
     metrics = list({x for x, _ in rankings})  # required metrics
     results, data = _get_metrics(  # get data from each host
-        hosts, metrics, data)
+        hosts, metrics, data, cache_timeout=metrics_cache_timeout)
     hosts = list(results)  # some hosts might not be contactable
 
     # stop here if we don't need to proceed
@@ -507,13 +527,100 @@ def _deserialise(metrics, data):
     return data
 
 
-def _get_metrics(hosts, metrics, data=None):
+def _load_metrics_cache(path=None):
+    """Return the host metrics cache.
+
+    The cache is of the form `{host: {metric: [time, result]}}` where metric
+    is the JSON representation of the metric, e.g. '["cpu_percent"]'.
+
+    Examples:
+        >>> _load_metrics_cache('/no/such/file')
+        {}
+
+    """
+    try:
+        with open(path or METRICS_CACHE_PATH) as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _save_metrics_cache(results, path=None):
+    """Add metrics results to the host metrics cache.
+
+    The cache file may be shared by many concurrent host selections so is
+    updated by atomic replacement, failure to write it is not an error.
+
+    Args:
+        results (dict):
+            {host: {metric: result}} where metric is the JSON representation
+            of the metric and result the raw (JSON) result.
+        path:
+            Path to the cache file, defaults to METRICS_CACHE_PATH.
+
+    """
+    path = Path(path or METRICS_CACHE_PATH)
+    now = time()
+    cache = _load_metrics_cache(path)
+    for host, host_results in results.items():
+        entry = cache.setdefault(host, {})
+        for metric, result in host_results.items():
+            entry[metric] = [now, result]
+    # housekeep entries which could not be used by anything
+    cache = {
+        host: entry
+        for host, entry in cache.items()
+        if any(now - time_ < 86400 for time_, _ in entry.values())
+    }
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            'w', dir=path.parent, prefix=f'.{path.name}.', delete=False
+        ) as tmp_file:
+            json.dump(cache, tmp_file)
+        os.replace(tmp_file.name, path)
+
+
+def _get_cached_metrics(hosts, metrics, cache_timeout, path=None):
+    """Return results for hosts with fresh cached results for all metrics.
+
+    Examples:
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as tmp_dir:
+        ...     path = Path(tmp_dir, 'cache.json')
+        ...     _save_metrics_cache({'a': {'["cpu_count"]': 4}}, path)
+        ...     _get_cached_metrics(['a', 'b'], [('cpu_count',)], 60, path)
+        {'a': [4]}
+
+    Returns:
+        dict - {host: [result, ...]} in the order of metrics.
+
+    """
+    cache = _load_metrics_cache(path)
+    now = time()
+    keys = [json.dumps(metric) for metric in metrics]
+    cached = {}
+    for host in hosts:
+        entry = cache.get(host, {})
+        with suppress(KeyError, TypeError, ValueError):
+            items = [entry[key] for key in keys]
+            if all(now - time_ < cache_timeout for time_, _ in items):
+                cached[host] = [result for _, result in items]
+    return cached
+
+
+def _get_metrics(hosts, metrics, data=None, cache_timeout=None):
     """Retrieve host metrics using SSH if necessary.
 
     Note hosts will not appear in the returned results if:
     * They are not contactable.
     * There is an error in the command which returns the results.
 
+    The metrics commands are run on all hosts concurrently.
+
     Args:
         hosts (list):
             List of host fqdns.
@@ -521,6 +628,10 @@ def _get_metrics(hosts, metrics, data=None):
             List in the form [(function, arg1, arg2, ...), ...]
         data (dict):
             Used for logging success/fail outcomes of the form {host: {}}
+        cache_timeout (float):
+            If set, use results from the host metrics cache which are
+            younger than this number of seconds, and add new results to the
+            cache.
 
     Examples:
         Command failure (no such attribute of psutil):
@@ -536,6 +647,17 @@ def _get_metrics(hosts, metrics, data=None):
     if not data:
         data = {host: {} for host in hosts}
 
+    if cache_timeout:
+        for host, results in _get_cached_metrics(
+            hosts, metrics, cache_timeout
+        ).items():
+            host_stats[host] = dict(zip(
+                metrics,
+                _deserialise(metrics, results)
+            ))
+            data[host]['returncode'] = 0
+        hosts = [host for host in hosts if host not in host_stats]
+
     # Start up commands on hosts
     cmd = ['psutil']
     kwargs = {
@@ -553,26 +675,32 @@ def _get_metrics(hosts, metrics, data=None):
             proc_map[host] = run_cmd(['cylc'] + cmd, **kwargs)
 
     # Collect results from commands
-    while proc_map:
-        for host, proc in list(proc_map.copy().items()):
-            if proc.poll() is None:
-                continue
-            del proc_map[host]
-            out, err = (stream.strip() for stream in proc.communicate())
-            if proc.wait():
-                # Command failed
-                LOG.warning(
-                    'Error evaluating ranking expression on'
-                    f' {host}: \n{err}'
-                )
-            else:
-                host_stats[host] = dict(zip(
-                    metrics,
-                    # convert JSON dicts -> namedtuples
-                    _deserialise(metrics, parse_dirty_json(out))
-                ))
-            data[host]['returncode'] = proc.returncode
-        sleep(0.01)
+    # (the commands are already running in parallel so waiting on each in
+    # turn takes as long as the slowest)
+    new_results = {}
+    for host, proc in proc_map.items():
+        out, err = (stream.strip() for stream in proc.communicate())
+        if proc.wait():
+            # Command failed
+            LOG.warning(
+                'Error evaluating ranking expression on'
+                f' {host}: \n{err}'
+            )
+        else:
+            results = parse_dirty_json(out)
+            new_results[host] = {
+                json.dumps(metric): result
+                for metric, result in zip(metrics, results)
+            }
+            host_stats[host] = dict(zip(
+                metrics,
+                # convert JSON dicts -> namedtuples
+                _deserialise(metrics, results)
+            ))
+        data[host]['returncode'] = proc.returncode
+
+    if cache_timeout and new_results:
+        _save_metrics_cache(new_results)
     return host_stats, data
 
 
@@ -16,9 +16,12 @@
 """Package for network interfaces to Cylc scheduler objects."""
 
 import asyncio
+from functools import lru_cache
 import getpass
 import json
-from typing import Optional, Tuple
+import os
+from typing import Iterable, List, Optional, Tuple
+import zlib
 
 import zmq
 import zmq.asyncio
@@ -45,6 +48,18 @@ from cylc.flow.workflow_files import (
 API = 5  # cylc API version
 MSG_TIMEOUT = "TIMEOUT"
 
+# compressed response encoding, clients list the encodings they accept in
+# the "accept_encoding" field of the request metadata
+ZLIB = 'zlib'
+# responses smaller than this (bytes) are not worth compressing
+COMPRESSION_THRESHOLD = 32 * 1024
+# zlib compression level, favour speed (most of the reduction in size comes
+# at the lowest levels)
+COMPRESSION_LEVEL = 1
+# the number of CurveZMQ certificates to keep in memory (each workflow has a
+# client and server key)
+CERTIFICATE_CACHE_SIZE = 256
+
 
 def encode_(message):
     """Convert the structure holding a message field from JSON to a string."""
@@ -61,6 +76,75 @@ def decode_(message):
     return msg
 
 
+def compress_(response: bytes, accept_encoding: Iterable[str]) -> List[bytes]:
+    """Return the message frames to send a response with.
+
+    Responses over the size threshold are compressed if the client accepts
+    it, in which case the encoding is sent in a frame before the response.
+
+    Examples:
+        >>> compress_(b'x', [ZLIB])
+        [b'x']
+        >>> frames = compress_(b'x' * COMPRESSION_THRESHOLD, [ZLIB])
+        >>> frames[0], len(frames[1]) < COMPRESSION_THRESHOLD
+        (b'zlib', True)
+        >>> len(compress_(b'x' * COMPRESSION_THRESHOLD, [])[0])
+        32768
+
+    """
+    if len(response) >= COMPRESSION_THRESHOLD and ZLIB in accept_encoding:
+        return [
+            ZLIB.encode('utf-8'),
+            zlib.compress(response, COMPRESSION_LEVEL),
+        ]
+    return [response]
+
+
+def decompress_(frames: List[bytes]) -> bytes:
+    """Return the response from the message frames sent by compress_.
+
+    Examples:
+        >>> decompress_(compress_(b'x' * COMPRESSION_THRESHOLD, [ZLIB])) == (
+        ...     b'x' * COMPRESSION_THRESHOLD
+        ... )
+        True
+        >>> decompress_([b'x'])
+        b'x'
+
+    """
+    if len(frames) == 1:
+        return frames[0]
+    encoding, response = frames
+    if encoding.decode('utf-8') == ZLIB:
+        return zlib.decompress(response)
+    raise ValueError(f'Unsupported response encoding: {encoding!r}')
+
+
+@lru_cache(maxsize=CERTIFICATE_CACHE_SIZE)
+def _load_certificate(
+    path: str, mtime_ns: int
+) -> Tuple[bytes, Optional[bytes]]:
+    return zmq.auth.load_certificate(path)
+
+
+def load_certificate(path: str) -> Tuple[bytes, Optional[bytes]]:
+    """Load a CurveZMQ certificate.
+
+    Certificates are cached until the file is modified, so connecting to a
+    workflow repeatedly doesn't re-read and parse its keys every time.
+
+    Returns:
+        (public key, private key), the private key is None for public
+        certificates.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file doesn't contain a public key.
+
+    """
+    return _load_certificate(path, os.stat(path).st_mtime_ns)
+
+
 def get_location(workflow: str) -> Tuple[str, int, int]:
     """Extract host and port from a workflow's contact file.
 
@@ -234,7 +318,7 @@ class ZMQSocketBase:
             workflow_srv_dir=workflow_srv_dir)
         error_msg = "Failed to find user's private key, so cannot connect."
         try:
-            client_public_key, client_priv_key = zmq.auth.load_certificate(
+            client_public_key, client_priv_key = load_certificate(
                 client_priv_key_info.full_key_path)
         except (OSError, ValueError):
             raise ClientError(error_msg)
@@ -251,7 +335,7 @@ class ZMQSocketBase:
             # for the latter item if not there (as for all public key files)
             # so it is OK to use; there is no method to load only the
             # public key.
-            server_public_key = zmq.auth.load_certificate(
+            server_public_key = load_certificate(
                 srv_pub_key_info.full_key_path)[0]
             self.socket.curve_serverkey = server_public_key
         except (OSError, ValueError):  # ValueError raised w/ no public key
@@ -36,12 +36,18 @@ from cylc.flow.exceptions import (
 )
 from cylc.flow.hostuserutil import get_fqdn_by_host
 from cylc.flow.network import (
+    ZLIB,
     encode_,
     decode_,
+    decompress_,
     get_location,
     ZMQSocketBase
 )
 from cylc.flow.network.client_factory import CommsMeth
+from cylc.flow.network.graphql import (
+    PERSISTED_QUERY_NOT_FOUND,
+    get_document_hash,
+)
 from cylc.flow.network.server import PB_METHOD_MAP
 from cylc.flow.workflow_files import (
     detect_old_contact_file,
@@ -205,6 +211,10 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
             the event of a communication timeout.
         header:
             Request "header" data to attach to each request.
+        persisted_queries:
+            Hashes of the GraphQL requests sent to the workflow, repeat
+            requests send the hash in place of the full request.
+            None if the workflow does not support persisted queries.
 
     Usage:
         Call endpoints using ``ZMQClient.__call__``.
@@ -232,6 +242,11 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
     socket: zmq.asyncio.Socket
     loop: asyncio.AbstractEventLoop
 
+    # the maximum number of persisted query hashes to remember
+    PERSISTED_QUERIES_MAX = 100
+    # the error returned by workflows which don't support persisted queries
+    PERSISTED_QUERIES_UNSUPPORTED = "unexpected keyword argument 'query_hash'"
+
     def __init__(
         self,
         workflow: str,
@@ -246,6 +261,7 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         # convert to milliseconds:
         self.timeout *= 1000
         self.poller: Any = None
+        self.persisted_queries: Optional[Dict[str, None]] = {}
         # Connect the ZMQ socket on instantiation
         self.start(self.host, self.port, srv_public_key_loc)
         # gather header info post start
@@ -261,7 +277,8 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         self.socket.setsockopt(zmq.LINGER, int(self.DEFAULT_TIMEOUT))
 
         # create a poller to handle timeouts
-        self.poller = zmq.Poller()
+        # (asynchronous so that concurrent requests don't block one another)
+        self.poller = zmq.asyncio.Poller()
         self.poller.register(self.socket, zmq.POLLIN)
 
     async def async_request(
@@ -276,6 +293,50 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         Has the same arguments and return values as ``serial_request``.
 
         """
+        if (
+            command != 'graphql'
+            or not args
+            or not args.get('request_string')
+            or self.persisted_queries is None
+        ):
+            return await self._send_request(command, args, timeout, req_meta)
+
+        query_hash = get_document_hash(args['request_string'])
+        if query_hash in self.persisted_queries:
+            # the workflow should have this request cached, send the hash
+            hash_args = dict(args, query_hash=query_hash)
+            del hash_args['request_string']
+            try:
+                response = await self._send_request(
+                    command, hash_args, timeout, req_meta
+                )
+            except ClientError as exc:
+                if (
+                    isinstance(exc, WorkflowStopped)
+                    or self.PERSISTED_QUERIES_UNSUPPORTED not in exc.message
+                ):
+                    raise
+                # workflow does not support persisted queries (old version)
+                self.persisted_queries = None
+            else:
+                if response != [PERSISTED_QUERY_NOT_FOUND]:
+                    return response
+        response = await self._send_request(command, args, timeout, req_meta)
+        if self.persisted_queries is not None:
+            self.persisted_queries.pop(query_hash, None)
+            self.persisted_queries[query_hash] = None
+            while len(self.persisted_queries) > self.PERSISTED_QUERIES_MAX:
+                del self.persisted_queries[next(iter(self.persisted_queries))]
+        return response
+
+    async def _send_request(
+        self,
+        command: str,
+        args: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        req_meta: Optional[Dict[str, Any]] = None
+    ) -> object:
+        """Send a request and return the response data."""
         timeout = (float(timeout) * 1000 if timeout else None) or self.timeout
         if not args:
             args = {}
@@ -296,8 +357,8 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         self.socket.send_string(message)
 
         # receive response
-        if self.poller.poll(timeout):
-            res = await self.socket.recv()
+        if await self.poller.poll(timeout):
+            res = decompress_(await self.socket.recv_multipart())
         else:
             self.timeout_handler()
             raise ClientTimeout(
@@ -359,6 +420,7 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
                     os.getenv(
                         "CLIENT_COMMS_METH",
                         default=CommsMeth.ZMQ.value
-                    )
+                    ),
+                'accept_encoding': [ZLIB],
             }
         }
@@ -14,12 +14,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from contextvars import ContextVar
 from enum import Enum
 import os
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 
 if TYPE_CHECKING:
-    from cylc.flow.network.client import WorkflowRuntimeClientBase
+    import zmq.asyncio
+
+    from cylc.flow.network.client import (
+        WorkflowRuntimeClient,
+        WorkflowRuntimeClientBase,
+    )
+
+
+# the ClientFactory in use by the current asyncio task (if any)
+CLIENT_FACTORY: 'ContextVar[Optional[ClientFactory]]' = ContextVar(
+    'CLIENT_FACTORY',
+    default=None,
+)
 
 
 class CommsMeth(Enum):
@@ -58,6 +71,70 @@ def get_runtime_client(
 
 
 def get_client(workflow, timeout=None):
-    """Get communication method and return correct WorkflowRuntimeClient"""
+    """Get communication method and return correct WorkflowRuntimeClient
+
+    If a ClientFactory has been set for the current context, ZMQ clients are
+    obtained from it.
+    """
+    comms_method = get_comms_method()
+    factory = CLIENT_FACTORY.get()
+    if factory is not None and comms_method == CommsMeth.ZMQ:
+        return factory.get_client(workflow, timeout=timeout)
+    return get_runtime_client(comms_method, workflow, timeout=timeout)
+
+
+class ClientFactory:
+    """Provides ZMQ clients for communicating with many workflows at once.
+
+    Clients share a single ZMQ context rather than each creating their own
+    (each context starts its own IO thread). Clients are reused for repeated
+    requests to the same workflow until released.
+
+    Set CLIENT_FACTORY to use the factory for calls to get_client.
+
+    """
+
+    def __init__(self):
+        self._context: 'Optional[zmq.asyncio.Context]' = None
+        self._clients: Dict[
+            Tuple[str, Union[float, str, None]],
+            'WorkflowRuntimeClient'
+        ] = {}
+
+    def get_client(
+        self,
+        workflow: str,
+        timeout: Union[float, str, None] = None,
+    ) -> 'WorkflowRuntimeClient':
+        """Return a client for a workflow.
+
+        Raises:
+            WorkflowStopped: If the workflow is not running.
+
+        """
+        from cylc.flow.network.client import WorkflowRuntimeClient
+        if self._context is None:
+            import zmq.asyncio
+            self._context = zmq.asyncio.Context()
+        key = (workflow, timeout)
+        if key not in self._clients:
+            self._clients[key] = WorkflowRuntimeClient(
+                workflow,
+                timeout=timeout,
+                context=self._context,
+            )
+        return self._clients[key]
+
+    def release(self, workflow: str) -> None:
+        """Stop any clients for a workflow."""
+        for key in [key for key in self._clients if key[0] == workflow]:
+            self._clients.pop(key).stop(stop_loop=False)
 
-    return get_runtime_client(get_comms_method(), workflow, timeout=timeout)
+    def close(self) -> None:
+        """Stop all clients and terminate the ZMQ context."""
+        for client in self._clients.values():
+            client.stop(stop_loop=False)
+        self._clients.clear()
+        if self._context is not None:
+            self._context.term()
+            self._context = None
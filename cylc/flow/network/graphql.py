@@ -19,10 +19,12 @@ GraphQL Middleware defined here also.
 
 """
 
+from collections import OrderedDict
 from functools import partial
+from hashlib import sha256
 from inspect import isclass, iscoroutinefunction
 import logging
-from typing import TYPE_CHECKING, Any, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 from graphene.utils.str_converters import to_snake_case
 from graphql.execution.utils import (
@@ -33,7 +35,9 @@ from graphql.language.base import parse, print_ast
 from graphql.language import ast
 from graphql.backend.base import GraphQLBackend, GraphQLDocument
 from graphql.backend.core import execute_and_validate
+from graphql.execution import ExecutionResult
 from graphql.utils.base import type_from_ast
+from graphql.validation import validate
 from graphql.type.definition import get_named_type
 from promise import Promise
 from rx import Observable
@@ -41,7 +45,7 @@ from rx import Observable
 from cylc.flow.network.schema import NODE_MAP
 
 if TYPE_CHECKING:
-    from graphql.execution import ExecutionResult
+    from graphql.error import GraphQLError
     from graphql.language.ast import Document
     from graphql.type.schema import GraphQLSchema
 
@@ -52,6 +56,19 @@ STRIP_ARG = 'strip_null'
 NULL_VALUE = None
 EMPTY_VALUES: Tuple[list, dict] = ([], {})
 STRIP_OPS = {'query', 'subscription'}
+# Returned in place of a result when a persisted query isn't in the cache.
+PERSISTED_QUERY_NOT_FOUND = 'PersistedQueryNotFound'
+
+
+def get_document_hash(document_string: str) -> str:
+    """Return the ID of a request document for use as a persisted query.
+
+    Examples:
+        >>> get_document_hash('query { workflows { id } }')[:16]
+        'd89294350288d488'
+
+    """
+    return sha256(document_string.encode('utf-8')).hexdigest()
 
 
 def grow_tree(tree, path, leaves=None):
@@ -269,6 +286,23 @@ def execute_and_validate_and_strip(
     return result
 
 
+def execute_validated_and_strip(
+    schema: 'GraphQLSchema',
+    document_ast: 'Document',
+    validation_errors: List['GraphQLError'],
+    *args: Any,
+    **kwargs: Any
+) -> Union['ExecutionResult', Observable]:
+    """Wrapper around ``execute_and_validate_and_strip()`` for documents
+    which have already been validated."""
+    if validation_errors and kwargs.get('validate', True):
+        return ExecutionResult(errors=validation_errors, invalid=True)
+    kwargs['validate'] = False
+    return execute_and_validate_and_strip(
+        schema, document_ast, *args, **kwargs
+    )
+
+
 class CylcGraphQLBackend(GraphQLBackend):
     """Return a GraphQL document using the default
     graphql executor with optional null-stripping of result.
@@ -276,6 +310,11 @@ class CylcGraphQLBackend(GraphQLBackend):
     The null value stripping of result is triggered by the presence
     of argument & value "stripNull: true" in any field.
 
+    Parsed and validated documents are cached (least recently used first
+    out) so that repeated requests don't need to be parsed and validated
+    again. The cached documents can also be looked up by their hash (see
+    get_document_hash) to support persisted queries.
+
     This is a modification of GraphQLCoreBackend found within:
         https://github.com/graphql-python/graphql-core-legacy
     (graphql-core==2.3.2)
@@ -283,11 +322,21 @@ class CylcGraphQLBackend(GraphQLBackend):
     Args:
 
         executor (object): Executor used in evaluating the resolvers.
+        cache_size (int): The maximum number of documents to cache.
 
     """
 
-    def __init__(self, executor=None):
+    def __init__(self, executor=None, cache_size=0):
         self.execute_params = {"executor": executor}
+        self.cache_size = cache_size
+        self.documents: 'OrderedDict[str, GraphQLDocument]' = OrderedDict()
+
+    def get_document(self, document_hash: str) -> Optional[GraphQLDocument]:
+        """Return a cached document by its hash if present."""
+        document = self.documents.get(document_hash)
+        if document is not None:
+            self.documents.move_to_end(document_hash)
+        return document
 
     def document_from_string(self, schema, document_string):
         """Parse string and setup request document for execution.
@@ -305,20 +354,35 @@ class CylcGraphQLBackend(GraphQLBackend):
 
         """
         if isinstance(document_string, ast.Document):
-            document_ast = document_string
+            return self._create_document(schema, document_string)
+        if not isinstance(document_string, str):
+            logger.error("The query must be a string")
+            return self._create_document(schema, parse(document_string))
+        document_hash = get_document_hash(document_string)
+        document = self.get_document(document_hash)
+        if document is None or document.schema is not schema:
+            document = self._create_document(
+                schema, parse(document_string), document_string
+            )
+            if self.cache_size:
+                self.documents[document_hash] = document
+                while len(self.documents) > self.cache_size:
+                    self.documents.popitem(last=False)
+        return document
+
+    def _create_document(self, schema, document_ast, document_string=None):
+        """Validate a parsed document and setup for execution."""
+        if document_string is None:
             document_string = print_ast(document_ast)
-        else:
-            if not isinstance(document_string, str):
-                logger.error("The query must be a string")
-            document_ast = parse(document_string)
         return GraphQLDocument(
             schema=schema,
             document_string=document_string,
             document_ast=document_ast,
             execute=partial(
-                execute_and_validate_and_strip,
+                execute_validated_and_strip,
                 schema,
                 document_ast,
+                validate(schema, document_ast),
                 **self.execute_params
             ),
         )
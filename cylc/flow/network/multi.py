@@ -19,6 +19,11 @@ from functools import partial
 
 from cylc.flow.async_util import unordered_map
 from cylc.flow.id_cli import parse_ids_async
+from cylc.flow.network.client_factory import CLIENT_FACTORY, ClientFactory
+
+
+# the maximum number of workflows to operate on at once
+MAX_CONCURRENT_WORKFLOWS = 100
 
 
 def call_multi(*args, **kwargs):
@@ -57,6 +62,11 @@ async def call_multi_async(
             Override the default stdout output.
             This function is provided with the return value of fcn.
 
+    Note:
+        Clients obtained by fcn (via get_client) share a ZMQ context, and
+        are stopped when fcn returns. At most MAX_CONCURRENT_WORKFLOWS
+        calls are run at once.
+
     """
     # parse ids
     workflow_args, multi_mode = await parse_ids_async(
@@ -85,18 +95,39 @@ async def call_multi_async(
 
     # run coros
     results = []
-    async for (workflow_id, *args), result in unordered_map(
-        fcn,
-        (
-            (workflow_id, *args)
-            for workflow_id, args in workflow_args.items()
-        ),
-    ):
-        reporter(workflow_id, result)
-        results.append(result)
+    factory = ClientFactory()
+    # NOTE: tasks inherit the context they are created in
+    token = CLIENT_FACTORY.set(factory)
+    try:
+        async for (workflow_id, *args), result in unordered_map(
+            partial(
+                _call,
+                fcn,
+                factory,
+                asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS),
+            ),
+            (
+                (workflow_id, *args)
+                for workflow_id, args in workflow_args.items()
+            ),
+        ):
+            reporter(workflow_id, result)
+            results.append(result)
+    finally:
+        CLIENT_FACTORY.reset(token)
+        factory.close()
     return results
 
 
+async def _call(fcn, factory, semaphore, workflow_id, *args):
+    """Call fcn for a workflow then stop any clients it used."""
+    async with semaphore:
+        try:
+            return await fcn(workflow_id, *args)
+        finally:
+            factory.release(workflow_id)
+
+
 def _report_multi(report, workflow, result):
     print(workflow)
     report(result)
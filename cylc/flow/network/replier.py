@@ -21,7 +21,7 @@ from typing import TYPE_CHECKING, Optional
 import zmq
 
 from cylc.flow import LOG
-from cylc.flow.network import encode_, decode_, ZMQSocketBase
+from cylc.flow.network import compress_, encode_, decode_, ZMQSocketBase
 
 if TYPE_CHECKING:
     from cylc.flow.network.server import WorkflowRuntimeServer
@@ -46,6 +46,8 @@ class WorkflowReplier(ZMQSocketBase):
         * Expects requests of the format: {"command": CMD, "args": {...}}
         * Sends responses of the format: {"data": {...}}
         * Sends errors in the format: {"error": {"message": MSG}}
+        * Large responses are compressed if the client accepts it
+          (see cylc.flow.network.compress_).
 
     """
 
@@ -114,6 +116,7 @@ class WorkflowReplier(ZMQSocketBase):
                         }
                     }
                 ).encode()
+                self.socket.send(response)
             else:
                 # success case - serve the request
                 res = self.server.receiver(message)
@@ -122,4 +125,11 @@ class WorkflowReplier(ZMQSocketBase):
                     response = res['data']
                 else:
                     response = encode_(res).encode()
-            self.socket.send(response)
+                self.socket.send_multipart(
+                    compress_(
+                        response,
+                        (message.get('meta') or {}).get(
+                            'accept_encoding', []
+                        ),
+                    )
+                )
@@ -18,6 +18,7 @@
 
 from abc import ABCMeta, abstractmethod
 import asyncio
+from collections import ChainMap, deque
 from contextlib import suppress
 from fnmatch import fnmatchcase
 import logging
@@ -26,10 +27,12 @@ from time import time
 from typing import (
     Any,
     AsyncGenerator,
+    Deque,
     Dict,
     List,
     NamedTuple,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
     Union,
@@ -41,8 +44,8 @@ from graphene.utils.str_converters import to_snake_case
 
 from cylc.flow import LOG
 from cylc.flow.data_store_mgr import (
-    EDGES, FAMILY_PROXIES, TASK_PROXIES, WORKFLOW,
-    DELTA_ADDED, create_delta_store
+    EDGES, FAMILY_PROXIES, JOBS, TASK_PROXIES, WORKFLOW,
+    DELTA_ADDED, create_delta_store, merge_delta_store
 )
 from cylc.flow.id import Tokens
 from cylc.flow.network.schema import (
@@ -51,13 +54,14 @@ from cylc.flow.network.schema import (
     NodesEdges,
     PROXY_NODES,
     SUB_RESOLVERS,
+    paginate_elements,
     sort_elements,
 )
 
 if TYPE_CHECKING:
     from uuid import UUID
     from graphql import ResolveInfo
-    from cylc.flow.data_store_mgr import DataStoreMgr
+    from cylc.flow.data_store_mgr import DataStoreMgr, ElementIndex
     from cylc.flow.scheduler import Scheduler
 
     DeltaQueue = queue.Queue[Tuple[str, str, dict]]
@@ -77,6 +81,43 @@ DELTA_SLEEP_INTERVAL = 0.5
 # Delay before carrying on with the next delta,
 # roughly DELTA_PROC_WAIT*DELTA_SLEEP_INTERVAL seconds (if queue is empty).
 DELTA_PROC_WAIT = 10
+# Topic of the delta sent when a workflow shuts down.
+DELTA_SHUTDOWN = 'shutdown'
+
+
+def queue_delta(
+    flow_queue: Deque[list], w_id: str, topic: str, delta_store: dict
+) -> None:
+    """Queue a delta for a subscriber.
+
+    If the last delta queued for the workflow is still waiting, the new delta
+    is merged into it, so the deltas for a slow subscriber are combined rather
+    than accumulating.
+
+    Args:
+        flow_queue:
+            The deltas waiting to be yielded for the workflow, as
+            [topic, delta_store, merged] where merged is True for delta stores
+            created by merging.
+        w_id:
+            The workflow ID.
+        topic:
+            The delta topic.
+        delta_store:
+            The delta store.
+
+    """
+    if flow_queue and DELTA_SHUTDOWN not in {flow_queue[-1][0], topic}:
+        last = flow_queue[-1]
+        if not last[2]:
+            # delta stores are shared between subscriptions, so merge into
+            # a new one
+            merged = create_delta_store(workflow_id=w_id)
+            merge_delta_store(merged, last[1])
+            last[1:] = [merged, True]
+        merge_delta_store(last[1], delta_store)
+    else:
+        flow_queue.append([topic, delta_store, False])
 
 
 def filter_none(dictionary):
@@ -282,6 +323,10 @@ def node_filter(node, node_type, args, state):
             args.get('is_queued') is None
             or (node.is_queued == args['is_queued'])
         )
+        and (
+            args.get('is_runahead') is None
+            or (node.is_runahead == args['is_runahead'])
+        )
         and (
             args.get('mindepth', -1) < 0
             or node.depth >= args['mindepth']
@@ -306,6 +351,52 @@ def node_filter(node, node_type, args, state):
     )
 
 
+def get_indexed_ids(index: 'ElementIndex', args) -> Optional[List[str]]:
+    """Return the IDs of elements which may match the args using an index.
+
+    The elements must still be filtered using node_filter, this only narrows
+    down the elements to filter.
+
+    Returns None if the args can't be narrowed down using the index.
+    """
+    candidates = []
+    if args.get('states'):
+        candidates.append(index.get('state', args['states']))
+    for flag in ('is_held', 'is_queued', 'is_runahead'):
+        if flag in index.fields and args.get(flag) is not None:
+            candidates.append(index.get(flag, [args[flag]]))
+    if args.get('ids'):
+        ids: Optional[Set[str]] = set()
+        for item in iter_uniq(args['ids']):
+            if item.is_null:
+                # doesn't match anything
+                continue
+            if (
+                item['job']
+                or not (item['cycle'] or item['task'])
+                or any(
+                    char in (item[token] or '')
+                    for token in ('cycle', 'task')
+                    for char in '*?['
+                )
+            ):
+                # globs can't be looked up in the index
+                ids = None
+                break
+            matches = []
+            if item['cycle']:
+                matches.append(index.get('cycle_point', [item['cycle']]))
+            if item['task']:
+                matches.append(index.get('name', [item['task']]))
+            ids.update(set.intersection(*matches))
+        if ids is not None:
+            candidates.append(ids)
+    if not candidates:
+        return None
+    candidates.sort(key=len)
+    return index.sort(set.intersection(*candidates))
+
+
 def get_flow_data_from_ids(data_store, native_ids):
     """Return workflow data by id."""
     w_ids = []
@@ -320,9 +411,16 @@ def get_flow_data_from_ids(data_store, native_ids):
     ]
 
 
-def get_data_elements(flow, nat_ids, element_type):
-    """Return data elements by id."""
+def get_data_elements(flow, nat_ids, element_type, fallback=None):
+    """Return data elements by id.
+
+    Args:
+        fallback: Elements to use for IDs which aren't in the flow.
+
+    """
     flow_element = flow[element_type]
+    if fallback:
+        flow_element = ChainMap(flow_element, fallback)
     return [
         flow_element[n_id]
         for n_id in nat_ids
@@ -393,20 +491,42 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                 ][node_type][node.id].state
             )
 
+    def get_index(self, flow, node_type) -> Optional['ElementIndex']:
+        """Return the index of a workflow's data elements if available."""
+        return None
+
+    def iter_flow_nodes(self, flow, node_type, args):
+        """Return the nodes of a workflow which may match args.
+
+        Uses the data store indexes to avoid scanning every node where
+        possible.
+        """
+        elements = flow[node_type]
+        if not ('sub_id' in args and args['delta_store']):
+            index = self.get_index(flow, node_type)
+            if index is not None:
+                ids = get_indexed_ids(index, args)
+                if ids is not None:
+                    return (elements[id_] for id_ in ids if id_ in elements)
+        return elements.values()
+
     async def get_nodes_all(self, node_type, args):
         """Return nodes from all workflows, filter by args."""
         return sort_elements(
-            [
-                node
-                for flow in await self.get_workflows_data(args)
-                for node in flow[node_type].values()
-                if node_filter(
-                    node,
-                    node_type,
-                    args,
-                    self.get_node_state(node, node_type)
-                )
-            ],
+            paginate_elements(
+                (
+                    node
+                    for flow in await self.get_workflows_data(args)
+                    for node in self.iter_flow_nodes(flow, node_type, args)
+                    if node_filter(
+                        node,
+                        node_type,
+                        args,
+                        self.get_node_state(node, node_type)
+                    )
+                ),
+                args,
+            ),
             args,
         )
 
@@ -428,19 +548,31 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
             node_types = [TASK_PROXIES, FAMILY_PROXIES]
         else:
             node_types = [node_type]
+        # older jobs may not be held in the data store
+        load_jobs = node_type == JOBS and not (
+            'sub_id' in args and args['delta_store']
+        )
         return sort_elements(
-            [
-                node
-                for flow in flow_data
-                for node_type in node_types
-                for node in get_data_elements(flow, nat_ids, node_type)
-                if node_filter(
-                    node,
-                    node_type,
-                    args,
-                    self.get_node_state(node, node_type)
-                )
-            ],
+            paginate_elements(
+                (
+                    node
+                    for flow in flow_data
+                    for node_type in node_types
+                    for node in get_data_elements(
+                        flow,
+                        nat_ids,
+                        node_type,
+                        self.get_db_jobs(flow, nat_ids) if load_jobs else None,
+                    )
+                    if node_filter(
+                        node,
+                        node_type,
+                        args,
+                        self.get_node_state(node, node_type)
+                    )
+                ),
+                args,
+            ),
             args,
         )
 
@@ -461,15 +593,35 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
             return (
                 flow[TASK_PROXIES].get(n_id) or
                 flow[FAMILY_PROXIES].get(n_id))
-        return flow[node_type].get(n_id)
+        node = flow[node_type].get(n_id)
+        if node is None and node_type == JOBS and not (
+            'sub_id' in args and args.get('delta_store')
+        ):
+            # older jobs may not be held in the data store
+            node = self.get_db_jobs(flow, [n_id]).get(n_id)
+        return node
+
+    def get_db_jobs(self, flow, job_ids) -> Dict[str, Any]:
+        """Return jobs which are not held in the data store.
+
+        Not supported by default.
+
+        Args:
+            flow: The workflow data.
+            job_ids: The IDs of the jobs requested.
+
+        """
+        return {}
 
     # edges
     async def get_edges_all(self, args):
         """Return edges from all workflows, filter by args."""
         return sort_elements(
-            [e
-             for flow in await self.get_workflows_data(args)
-             for e in flow.get(EDGES).values()],
+            paginate_elements(
+                (e
+                 for flow in await self.get_workflows_data(args)
+                 for e in flow.get(EDGES).values()),
+                args),
             args)
 
     async def get_edges_by_ids(self, args):
@@ -486,9 +638,11 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                 self.data_store_mgr.data, nat_ids)
 
         return sort_elements(
-            [edge
-             for flow in flow_data
-             for edge in get_data_elements(flow, nat_ids, EDGES)],
+            paginate_elements(
+                (edge
+                 for flow in flow_data
+                 for edge in get_data_elements(flow, nat_ids, EDGES)),
+                args),
             args)
 
     async def get_nodes_edges(self, root_nodes, args):
@@ -571,7 +725,7 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
 
         counters: Dict[str, int] = {}
         delta_yield_queue: DeltaQueue = queue.Queue()
-        flow_delta_queues: Dict[str, queue.Queue[Tuple[str, dict]]] = {}
+        flow_delta_queues: Dict[str, Deque[list]] = {}
         try:
             # Iterate over the queue yielding deltas
             w_ids = workflow_ids
@@ -605,31 +759,39 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                     elif w_id in self.delta_store[sub_id]:
                         del self.delta_store[sub_id][w_id]
                 try:
+                    # Take all deltas received, those arriving while the
+                    # previous delta is being processed are merged.
                     with suppress(queue.Empty):
-                        w_id, topic, delta_store = deltas_queue.get(False)
-
-                        if w_id not in flow_delta_queues:
-                            counters[w_id] = 0
-                            flow_delta_queues[w_id] = queue.Queue()
-                        flow_delta_queues[w_id].put((topic, delta_store))
+                        while True:
+                            w_id, topic, delta_store = deltas_queue.get(False)
+
+                            if w_id not in flow_delta_queues:
+                                counters[w_id] = 0
+                                flow_delta_queues[w_id] = deque()
+                            queue_delta(
+                                flow_delta_queues[w_id],
+                                w_id,
+                                topic,
+                                delta_store,
+                            )
 
                     # Only yield deltas from the same workflow if previous
                     # delta has finished processing.
                     for flow_id, flow_queue in flow_delta_queues.items():
-                        if flow_queue.empty():
+                        if not flow_queue:
                             continue
                         elif flow_id in delta_processing_flows:
                             if counters[flow_id] < DELTA_PROC_WAIT:
                                 continue
                             delta_processing_flows.remove(flow_id)
                         counters[flow_id] = 0
-                        topic, delta_store = flow_queue.get()
+                        topic, delta_store, _ = flow_queue.popleft()
                         delta_yield_queue.put((flow_id, topic, delta_store))
 
                     w_id, topic, delta_store = delta_yield_queue.get(False)
 
                     # Handle shutdown delta, don't ignore.
-                    if topic == 'shutdown':
+                    if topic == DELTA_SHUTDOWN:
                         delta_store['shutdown'] = True
                     else:
                         # ignore deltas that are more frequent than interval.
@@ -692,6 +854,29 @@ class Resolvers(BaseResolvers):
         super().__init__(data)
         self.schd = schd
 
+    def get_index(self, flow, node_type) -> Optional['ElementIndex']:
+        """Return the index of a workflow's data elements if available.
+
+        The scheduler data store maintains indexes of its workflow.
+        """
+        if flow is self.data_store_mgr.data.get(
+            self.data_store_mgr.workflow_id
+        ):
+            return self.data_store_mgr.indexes.get(node_type)
+        return None
+
+    def get_db_jobs(self, flow, job_ids) -> Dict[str, Any]:
+        """Return jobs which are not held in the data store.
+
+        The scheduler only holds the most recent jobs of each task in its
+        data store, older jobs are loaded from the database.
+        """
+        if flow is self.data_store_mgr.data.get(
+            self.data_store_mgr.workflow_id
+        ):
+            return self.data_store_mgr.get_db_jobs(job_ids)
+        return {}
+
     # Mutations
     async def mutator(
         self,
@@ -43,11 +43,21 @@ e.g. :py:func:`contact_info`.
 .. autofunction:: title
 .. autofunction:: workflow_params
 
+Long-lived processes which scan repeatedly can pass a :py:class:`ScanCache`
+to :py:func:`scan`, :py:func:`contact_info` and :py:func:`graphql_query` to
+avoid re-reading unchanged directories and contact files and to reuse
+clients between scans.
+
+.. autoclass:: ScanCache
+
 """
 
 import asyncio
+from contextlib import suppress
+import os
 from pathlib import Path
 import re
+from time import time_ns
 from typing import (
     AsyncGenerator,
     Dict,
@@ -55,9 +65,11 @@ from typing import (
     List,
     Optional,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 from packaging.version import parse as parse_version
 from packaging.specifiers import SpecifierSet
@@ -102,6 +114,134 @@ REQUIRED_FIELDS = [
     ContactFileFields.NAME
 ]
 
+# the maximum number of workflows to query at once
+MAX_CONCURRENT_QUERIES = 50
+
+_QUERY_SEMAPHORES: (
+    'WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]'
+) = WeakKeyDictionary()
+
+T = TypeVar('T')
+
+
+def _query_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent queries in this event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _QUERY_SEMAPHORES:
+        _QUERY_SEMAPHORES[loop] = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    return _QUERY_SEMAPHORES[loop]
+
+
+class ScanCache:
+    """Cache of the files read and clients opened by scan pipes.
+
+    Directory listings and contact files are cached against their
+    modification times, so repeat scans only need to "stat" unchanged
+    entries. Clients are reused until the workflow's contact file changes
+    (i.e. the workflow is restarted) or the cache is used from a different
+    event loop. Call close() to stop them.
+    """
+
+    # Filesystem timestamps may be coarse so entries which were modified this
+    # recently (seconds) when read could change again without their
+    # modification time changing. These entries are re-read next time.
+    RACY_INTERVAL = 2
+
+    def __init__(self):
+        self._listings: Dict[Path, Tuple[int, List[Path]]] = {}
+        self._contacts: Dict[Path, Tuple[int, Dict[str, str]]] = {}
+        self._clients: Dict[str, Tuple[int, WorkflowRuntimeClient]] = {}
+
+    def _get(
+        self, cache: Dict[Path, Tuple[int, T]], path: Path
+    ) -> Tuple[int, Optional[T]]:
+        """Return (mtime, cached value or None if out of date)."""
+        mtime = os.stat(path).st_mtime_ns
+        try:
+            cached_mtime, value = cache[path]
+        except KeyError:
+            return mtime, None
+        if cached_mtime != mtime:
+            return mtime, None
+        return mtime, value
+
+    def _put(
+        self,
+        cache: Dict[Path, Tuple[int, T]],
+        path: Path,
+        mtime: int,
+        value: T,
+    ) -> None:
+        if time_ns() - mtime > self.RACY_INTERVAL * 1e9:
+            cache[path] = (mtime, value)
+        else:
+            cache.pop(path, None)
+
+    def _listdir(self, path: Path) -> List[Path]:
+        mtime, listing = self._get(self._listings, path)
+        if listing is None:
+            listing = [Path(path, name) for name in os.listdir(path)]
+            self._put(self._listings, path, mtime, listing)
+        return listing
+
+    async def scandir(self, path: Path) -> List[Path]:
+        """Asynchronous directory listing."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._listdir, path
+        )
+
+    async def load_contact_file(self, flow: dict) -> Dict[str, str]:
+        """Return a workflow's contact file data."""
+        path = flow['path'] / SERVICE / CONTACT
+        mtime, contact = self._get(self._contacts, path)
+        if contact is None:
+            contact = await load_contact_file_async(
+                flow['name'], run_dir=flow['path']
+            )
+            self._put(self._contacts, path, mtime, contact)
+        return dict(contact)
+
+    def get_client(self, flow: dict) -> WorkflowRuntimeClient:
+        """Return a client for a workflow.
+
+        Raises:
+            WorkflowStopped: If the workflow is not running.
+
+        """
+        name = flow['name']
+        try:
+            mtime = os.stat(flow['path'] / SERVICE / CONTACT).st_mtime_ns
+        except FileNotFoundError:
+            self.discard_client(name)
+            raise WorkflowStopped(name) from None
+        if name in self._clients:
+            cached_mtime, client = self._clients[name]
+            if (
+                cached_mtime == mtime
+                # clients are bound to the event loop they were created in
+                and client.loop is asyncio.get_running_loop()
+            ):
+                return client
+            self.discard_client(name)
+        client = WorkflowRuntimeClient(
+            name,
+            # use contact_info data if present for efficiency
+            host=flow.get('CYLC_WORKFLOW_HOST'),
+            port=flow.get('CYLC_WORKFLOW_PORT')
+        )
+        self._clients[name] = (mtime, client)
+        return client
+
+    def discard_client(self, name: str) -> None:
+        """Stop and forget the client for a workflow if there is one."""
+        with suppress(KeyError):
+            self._clients.pop(name)[1].stop(stop_loop=False)
+
+    def close(self) -> None:
+        """Stop all clients."""
+        for name in list(self._clients):
+            self.discard_client(name)
+
 
 def dir_is_flow(listing: Iterable[Path]) -> Optional[bool]:
     """Return True if a Path contains a flow at the top level.
@@ -169,7 +309,8 @@ def dir_is_flow(listing: Iterable[Path]) -> Optional[bool]:
 @pipe
 async def scan_multi(
     dirs: Iterable[Path],
-    max_depth: Optional[int] = None
+    max_depth: Optional[int] = None,
+    cache: Optional[ScanCache] = None,
 ) -> AsyncGenerator[dict, None]:
     """List flows from multiple directories.
 
@@ -185,7 +326,8 @@ async def scan_multi(
         async for flow in scan(
             run_dir=dir_,
             scan_dir=dir_,
-            max_depth=max_depth
+            max_depth=max_depth,
+            cache=cache,
         ):
             # set the flow name as the full path
             flow['name'] = dir_ / flow['name']
@@ -196,7 +338,8 @@ async def scan_multi(
 async def scan(
     run_dir: Optional[Path] = None,
     scan_dir: Optional[Path] = None,
-    max_depth: Optional[int] = None
+    max_depth: Optional[int] = None,
+    cache: Optional[ScanCache] = None,
 ) -> AsyncGenerator[Dict[str, Union[str, Path]], None]:
     """List flows installed on the filesystem.
 
@@ -215,6 +358,8 @@ async def scan(
 
             * ``max_depth=1`` will pick up top-level workflows (e.g. ``foo``).
             * ``max_depth=2`` will pick up nested workflows (e.g. ``foo/bar``).
+        cache:
+            Re-use unchanged directory listings from previous scans.
 
     Yields:
         dict - Dictionary containing information about the flow.
@@ -229,10 +374,11 @@ async def scan(
         max_depth = glbl_cfg().get(['install', 'max depth'])
 
     running: List[asyncio.tasks.Task] = []
+    _listdir = scandir if cache is None else cache.scandir
 
     # wrapper for scandir to preserve context
     async def _scandir(path: Path, depth: int) -> Tuple[Path, int, List[Path]]:
-        contents = await scandir(path)
+        contents = await _listdir(path)
         return path, depth, contents
 
     def _scan_subdirs(listing: List[Path], depth: int) -> None:
@@ -246,7 +392,7 @@ async def scan(
 
     # perform the first directory listing
     try:
-        scan_dir_listing = await scandir(scan_dir)
+        scan_dir_listing = await _listdir(scan_dir)
     except FileNotFoundError:
         return
     if scan_dir != cylc_run_dir and dir_is_flow(scan_dir_listing):
@@ -324,7 +470,7 @@ async def is_active(flow, is_active):
 
 
 @pipe
-async def contact_info(flow):
+async def contact_info(flow, cache=None):
     """Read information from the contact file.
 
     Requires:
@@ -333,11 +479,16 @@ async def contact_info(flow):
     Args:
         flow (dict):
             Flow information dictionary, provided by scan through the pipe.
+        cache (ScanCache):
+            Re-use unchanged contact files from previous scans.
 
     """
-    flow.update(
-        await load_contact_file_async(flow['name'], run_dir=flow['path'])
-    )
+    if cache is None:
+        flow.update(
+            await load_contact_file_async(flow['name'], run_dir=flow['path'])
+        )
+    else:
+        flow.update(await cache.load_contact_file(flow))
     return flow
 
 
@@ -400,7 +551,7 @@ async def api_version(flow, requirement):
     return parse_version(flow[ContactFileFields.API]) in requirement
 
 
-def format_query(fields, filters=None):
+def format_query(fields, filters=None, cache=None):
     ret = ''
     stack = [(None, fields)]
     while stack:
@@ -427,11 +578,16 @@ def format_query(fields, filters=None):
         else:
             for field in fields:
                 ret += f'\n{field}'
-    return (ret + '\n',), {'filters': filters}
+    return (ret + '\n',), {'filters': filters, 'cache': cache}
 
 
 @pipe(preproc=format_query)
-async def graphql_query(flow: dict, fields: Iterable, filters=None):
+async def graphql_query(
+    flow: dict,
+    fields: Iterable,
+    filters=None,
+    cache: Optional[ScanCache] = None,
+):
     """Obtain information from a GraphQL request to the flow.
 
     Requires:
@@ -458,44 +614,49 @@ async def graphql_query(flow: dict, fields: Iterable, filters=None):
 
                # state must be running or paused
                [('state',), ('running', 'paused')]
+        cache:
+            Re-use clients from previous scans.
+
+    Note:
+        At most MAX_CONCURRENT_QUERIES workflows are queried at once.
 
     """
     query = f'query {{ workflows(ids: ["{flow["name"]}"]) {{ {fields} }} }}'
     try:
-
-        client = WorkflowRuntimeClient(
-            flow['name'],
-            # use contact_info data if present for efficiency
-            host=flow.get('CYLC_WORKFLOW_HOST'),
-            port=flow.get('CYLC_WORKFLOW_PORT')
-        )
+        if cache is None:
+            client = WorkflowRuntimeClient(
+                flow['name'],
+                # use contact_info data if present for efficiency
+                host=flow.get('CYLC_WORKFLOW_HOST'),
+                port=flow.get('CYLC_WORKFLOW_PORT')
+            )
+        else:
+            client = cache.get_client(flow)
     except WorkflowStopped:
         LOG.warning(f'Workflow not running: {flow["name"]}')
         return False
     try:
-        ret = cast(
-            'dict',
-            await client.async_request(
-                'graphql',
-                {
-                    'request_string': query,
-                    'variables': {}
-                }
+        async with _query_semaphore():
+            ret = cast(
+                'dict',
+                await client.async_request(
+                    'graphql',
+                    {
+                        'request_string': query,
+                        'variables': {}
+                    }
+                )
             )
-        )
     except WorkflowStopped:
         LOG.warning(f'Workflow not running: {flow["name"]}')
-        return False
     except ClientTimeout:
         LOG.exception(
             f'Timeout: name: {flow["name"]}, '
             f'host: {client.host}, '
             f'port: {client.port}'
         )
-        return False
     except ClientError as exc:
         LOG.exception(exc)
-        return False
     else:
         # stick the result into the flow object
         for item in ret:
@@ -517,6 +678,13 @@ async def graphql_query(flow: dict, fields: Iterable, filters=None):
                     return False
 
         return flow
+    finally:
+        if cache is None:
+            client.stop(stop_loop=False)
+    # the request failed, the client may be connected to a stale port
+    if cache is not None:
+        cache.discard_client(flow['name'])
+    return False
 
 
 @pipe
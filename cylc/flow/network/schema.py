@@ -18,6 +18,7 @@
 
 from copy import deepcopy
 from functools import partial
+import heapq
 import json
 from operator import attrgetter
 from typing import (
@@ -97,6 +98,40 @@ def sort_elements(elements, args):
     return elements
 
 
+# The maximum number of elements which can be requested in one page.
+PAGE_SIZE_MAX = 10000
+
+
+def paginate_elements(elements, args):
+    """Return a page of elements selected by the "first" & "after" args.
+
+    Pages are ordered by element ID, "after" is the ID of the last element
+    of the previous page (which needn't exist any more). The elements are
+    returned unchanged if neither argument is provided.
+
+    Only the requested page is held in memory, so elements can be passed in
+    as a generator.
+    """
+    first = args.get('first')
+    after = args.get('after')
+    if first is None and after is None:
+        return list(elements)
+    if args.get('sort'):
+        raise ValueError(
+            '"sort" cannot be combined with "first" or "after",'
+            ' pages are ordered by ID'
+        )
+    if first is None:
+        first = PAGE_SIZE_MAX
+    elif not 0 < first <= PAGE_SIZE_MAX:
+        raise ValueError(
+            f'"first" must be between 1 and {PAGE_SIZE_MAX}, got {first}'
+        )
+    if after:
+        elements = (element for element in elements if element.id > after)
+    return heapq.nsmallest(first, elements, key=attrgetter('id'))
+
+
 PROXY_NODES = 'proxy_nodes'
 
 # Mapping of GraphQL types to field names:
@@ -139,6 +174,8 @@ JOB_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_JOB_ARGS = {
@@ -149,6 +186,8 @@ ALL_JOB_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 DEF_ARGS = {
@@ -157,6 +196,8 @@ DEF_ARGS = {
     'mindepth': Int(default_value=-1),
     'maxdepth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_DEF_ARGS = {
@@ -167,6 +208,8 @@ ALL_DEF_ARGS = {
     'mindepth': Int(default_value=-1),
     'maxdepth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 PROXY_ARGS = {
@@ -181,6 +224,8 @@ PROXY_ARGS = {
     'maxdepth': Int(default_value=-1),
     'graph_depth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_PROXY_ARGS = {
@@ -197,6 +242,8 @@ ALL_PROXY_ARGS = {
     'maxdepth': Int(default_value=-1),
     'graph_depth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 EDGE_ARGS = {
@@ -205,12 +252,16 @@ EDGE_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_EDGE_ARGS = {
     'workflows': graphene.List(ID, default_value=[]),
     'exworkflows': graphene.List(ID, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 NODES_EDGES_ARGS = {
@@ -29,7 +29,10 @@ from cylc.flow import LOG, workflow_files
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.network.authorisation import authorise
 from cylc.flow.network.graphql import (
-    CylcGraphQLBackend, IgnoreFieldMiddleware, instantiate_middleware
+    PERSISTED_QUERY_NOT_FOUND,
+    CylcGraphQLBackend,
+    IgnoreFieldMiddleware,
+    instantiate_middleware,
 )
 from cylc.flow.network.publisher import WorkflowPublisher
 from cylc.flow.network.replier import WorkflowReplier
@@ -126,6 +129,8 @@ class WorkflowRuntimeServer:
 
     OPERATE_SLEEP_INTERVAL = 0.2
     STOP_SLEEP_INTERVAL = 0.2
+    # the number of parsed GraphQL documents to cache
+    GRAPHQL_CACHE_SIZE = 100
 
     def __init__(self, schd):
 
@@ -147,6 +152,9 @@ class WorkflowRuntimeServer:
         self.middleware = [
             IgnoreFieldMiddleware,
         ]
+        self.graphql_backend = CylcGraphQLBackend(
+            cache_size=self.GRAPHQL_CACHE_SIZE
+        )
 
         self.publish_queue: 'Queue[Iterable[tuple]]' = Queue()
         self.waiting_to_stop = False
@@ -355,7 +363,8 @@ class WorkflowRuntimeServer:
         self,
         request_string: Optional[str] = None,
         variables: Optional[Dict[str, Any]] = None,
-        meta: Optional[Dict[str, Any]] = None
+        meta: Optional[Dict[str, Any]] = None,
+        query_hash: Optional[str] = None,
     ):
         """Return the GraphQL schema execution result.
 
@@ -363,10 +372,21 @@ class WorkflowRuntimeServer:
             request_string: GraphQL request passed to Graphene.
             variables: Dict of variables passed to Graphene.
             meta: Dict containing auth user etc.
+            query_hash:
+                The hash of a previously sent request to use in place of
+                request_string (see cylc.flow.network.graphql
+                .get_document_hash). If the request is no longer cached,
+                [PERSISTED_QUERY_NOT_FOUND] is returned and the client
+                should send the full request_string.
 
         Returns:
             object: Execution result, or a list with errors.
         """
+        if request_string is None and query_hash is not None:
+            document = self.graphql_backend.get_document(query_hash)
+            if document is None:
+                return [PERSISTED_QUERY_NOT_FOUND]
+            request_string = document.document_string
         try:
             executed: 'ExecutionResult' = schema.execute(
                 request_string,
@@ -375,7 +395,7 @@ class WorkflowRuntimeServer:
                     'resolvers': self.resolvers,
                     'meta': meta or {},
                 },
-                backend=CylcGraphQLBackend(),
+                backend=self.graphql_backend,
                 middleware=list(instantiate_middleware(self.middleware)),
                 executor=AsyncioExecutor(),
                 validate=True,  # validate schema (dev only? default is True)
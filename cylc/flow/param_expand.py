@@ -15,9 +15,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Parameter expansion for runtime namespace names and graph strings.
 
-Uses recursion to achieve nested looping over any number of parameters.  In its
+Loops over the Cartesian product of any number of parameters, yielding results
+lazily (see itertools.product). The equivalent recursive method, in its
 simplest form (without allowing for parameter offsets and specific values, and
-with input already expressed as a string template) the method looks like this:
+with input already expressed as a string template) looks like this:
 
 #------------------------------------------------------------------------------
 def expand(template, params, results, values=None):
@@ -57,12 +58,12 @@ foo_m1=>bar_m1_n2
 """
 
 from contextlib import suppress
+from itertools import product
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from cylc.flow.exceptions import ParamExpandError
 from cylc.flow.task_id import TaskID
-from cylc.flow.parsec.OrderedDict import OrderedDictWithDefaults
 
 # To split runtime heading name lists.
 REC_NAMES = re.compile(r'(?:[^,<]|<[^>]*>)+')
@@ -90,6 +91,11 @@ def item_in_iterable(item, itt):
     return int(item) in (int(i) for i in itt)
 
 
+def _escape_format(text):
+    """Escape text for use in a str.format template."""
+    return text.replace('{', '{{').replace('}', '}}')
+
+
 class NameExpander:
     """Handle parameter expansion in runtime namespace headings."""
 
@@ -118,8 +124,14 @@ class NameExpander:
              ('foo_i1_j0', {i:'1', j:'0'}),
              ('foo_i1_j1', {i:'1', j:'1'})]
         """
+        return list(self.iter_expand(runtime_heading))
+
+    def iter_expand(
+        self, runtime_heading: str
+    ) -> Iterator[Tuple[str, dict]]:
+        """Yield the expanded names and parameter values of "expand" lazily.
+        """
         # Create a string template and values to pass to the expansion method.
-        results = []
         for name in REC_NAMES.findall(runtime_heading):
             tmpl = ''
             spec_vals = {}
@@ -166,41 +178,38 @@ class NameExpander:
                     name = ''
             if tmpl:
                 tmpl += name
-                self._expand_name(results, tmpl, used_params, spec_vals)
+                yield from self._expand_name(tmpl, used_params, spec_vals)
             else:
-                results.append((name.strip(), {}))
-        return results
+                yield (name.strip(), {})
 
-    def _expand_name(self, results, tmpl, params, spec_vals=None):
-        """Recursively expand tmpl for any number of parameters.
+    @staticmethod
+    def _expand_name(tmpl, params, spec_vals=None):
+        """Expand tmpl for any number of parameters.
 
         tmpl is a string template, e.g. 'foo_m%(m)s_n%(n)s' for two
             parameters m and n.
-        params is a list of tuples (name, max-val) for each parameter
+        params is a list of tuples (name, values) for each parameter
             to be looped over.
         spec_vals is a map of values for parameters that are not to be looped
             over because they've been assigned a specific value.
 
         E.g. for "foo<m=0,n>" tmpl is "foo_m%(m)s_n%(n)s", params is
-        [('n', 2)], and spec_values {'m': 0}.
+        [('n', [0, 1])], and spec_values {'m': 0}.
 
-        results contains the expanded names and corresponding parameter values,
-        as described above in the calling method.
+        Yields the expanded names and corresponding parameter values, as
+        described above in the "expand" method.
         """
         if spec_vals is None:
             spec_vals = {}
-        if not params:
-            # Inner loop.
+        pnames = [pname for pname, _ in params]
+        for param_vals in product(*(values for _, values in params)):
             current_values = dict(spec_vals)
+            current_values.update(zip(pnames, param_vals))
             try:
-                results.append((tmpl % current_values, current_values))
+                yield (tmpl % current_values, current_values)
             except KeyError as exc:
                 raise ParamExpandError('parameter %s is not '
                                        'defined.' % str(exc.args[0]))
-        else:
-            for param_val in params[0][1]:
-                spec_vals[params[0][0]] = param_val
-                self._expand_name(results, tmpl, params[1:], spec_vals)
 
     @staticmethod
     def _parse_task_name_string(task_str: str) -> Tuple[List[str], str]:
@@ -357,7 +366,15 @@ class GraphExpander:
         (Here the offset node must be the first in a line, and if m-1 evaluates
         to less than 0 the node will be removed to leave just "sim<m,n>").
         """
-        line_set = set()
+        return set(self.iter_expand(line))
+
+    def iter_expand(self, line: str) -> Iterator[str]:
+        """Yield the expanded lines of "expand" lazily.
+
+        The line is compiled once into literal text and parameter groups, so
+        only the parameter substitutions are computed in the inner loop.
+        Lines may be yielded more than once.
+        """
         used_pnames = []
         for p_group in set(REC_P_GROUP.findall(line)):
             for item in p_group.split(','):
@@ -379,60 +396,119 @@ class GraphExpander:
                                 pname, p_group))
                 if pname not in used_pnames:
                     used_pnames.append(pname)
-        used_params = [(p, self.param_cfg[p]) for p in used_pnames]
-        self._expand_graph(line, dict(used_params), used_params, line_set)
-        return line_set
-
-    def _expand_graph(self, line, all_params,
-                      param_list, line_set, values=None):
-        """Expand line into line_set for any number of parameters.
-
-        line is a graph string line as described above in the calling method.
-        param_list is a list of tuples (name, max-val) for each parameter.
-        results is a set to hold each expanded line.
+        fmt, fields = self._compile(line, used_pnames)
+        try:
+            for indices in product(
+                *(range(len(self.param_cfg[pname])) for pname in used_pnames)
+            ):
+                yield fmt.format(*[
+                    table[indices[loop_index]] if loop_index is not None
+                    else self._format_group(table, indices)
+                    for loop_index, table in fields
+                ])
+        except KeyError as exc:
+            raise ParamExpandError('parameter %s is not '
+                                   'defined.' % str(exc.args[0]))
+
+    def _compile(self, line, used_pnames):
+        """Compile a graph line into a format string and its fields.
+
+        line is a graph string line as described above in "expand".
+        used_pnames is the list of parameters looped over, in loop order.
+
+        Literal text and specific parameter values (e.g. "<m=0>") go straight
+        into the format string. Each field is a tuple of the loop index of a
+        parameter and its formatted values by loop index, pre-computed with
+        any offset applied, so no string formatting is needed in the inner
+        loop. If a parameter template can't be formatted alone (it refers to
+        other parameters) the field is (None, group) instead, to be formatted
+        in the inner loop by _format_group.
         """
-        if values is None:
-            values = {}
-        if not param_list:
-            # Inner loop.
-            for p_group in set(REC_P_GROUP.findall(line)):
-                # Parameters must be expanded in the order found.
-                param_values = OrderedDictWithDefaults()
-                tmpl = ''
-                for item in p_group.split(','):
-                    pname, offs = REC_P_OFFS.match(item).groups()
-                    if offs is None:
-                        param_values[pname] = values[pname]
-                    elif offs.startswith('='):
-                        # Specific value.
-                        try:
-                            # Template may require an integer
-                            param_values[pname] = int(offs[1:])
-                        except ValueError:
-                            param_values[pname] = offs[1:]
-                    else:
-                        # Index offset.
-                        plist = all_params[pname]
-                        cur_idx = plist.index(values[pname])
-                        off_idx = cur_idx + int(offs)
-                        if 0 <= off_idx < len(plist):
-                            offval = plist[off_idx]
-                        else:
-                            offval = self._REMOVE
-                        param_values[pname] = offval
-                for pname in param_values:
-                    tmpl += self.param_tmpl_cfg[pname]
-                try:
-                    repl = tmpl % param_values
-                except KeyError as exc:
-                    raise ParamExpandError('parameter %s is not '
-                                           'defined.' % str(exc.args[0]))
-                line = line.replace('<' + p_group + '>', repl)
-            if line:
-                line_set.add(line)
-        else:
-            # Recurse through index ranges.
-            for param_val in param_list[0][1]:
-                values[param_list[0][0]] = param_val
-                self._expand_graph(line, all_params,
-                                   param_list[1:], line_set, values)
+        fmt = ''
+        fields = []
+        field_indices = {}
+        for i, part in enumerate(REC_P_GROUP.split(line)):
+            if i % 2 == 0:
+                # Literal text between groups.
+                fmt += _escape_format(part)
+                continue
+            # Parameters must be expanded in the order found.
+            slots = {}
+            for item in part.split(','):
+                pname, offs = REC_P_OFFS.match(item).groups()
+                if offs is not None and offs.startswith('='):
+                    # Specific value.
+                    try:
+                        # Template may require an integer
+                        slots[pname] = (pname, int(offs[1:]), None, 0)
+                    except ValueError:
+                        slots[pname] = (pname, offs[1:], None, 0)
+                else:
+                    # Loop value, possibly with an index offset.
+                    slots[pname] = (
+                        pname,
+                        self.param_cfg[pname],
+                        used_pnames.index(pname),
+                        int(offs) if offs else 0,
+                    )
+            try:
+                pieces = [self._compile_slot(*slot) for slot in slots.values()]
+            except KeyError:
+                tmpl = ''.join(self.param_tmpl_cfg[pname] for pname in slots)
+                pieces = [(part, (None, (tmpl, list(slots.values()))))]
+            for piece in pieces:
+                if isinstance(piece, str):
+                    fmt += _escape_format(piece)
+                    continue
+                key, field = piece
+                if key not in field_indices:
+                    field_indices[key] = len(fields)
+                    fields.append(field)
+                fmt += '{%d}' % field_indices[key]
+        return fmt, fields
+
+    def _compile_slot(self, pname, values, loop_index, offset):
+        """Compile a parameter in a group.
+
+        Returns the formatted value for specific values, else a tuple of a
+        unique key and the field (see _compile).
+        """
+        tmpl = self.param_tmpl_cfg[pname]
+        if loop_index is None:
+            return tmpl % {pname: values}
+        removed = tmpl % {pname: self._REMOVE}
+        return (
+            (pname, offset),
+            (
+                loop_index,
+                [
+                    tmpl % {pname: values[index + offset]}
+                    if 0 <= index + offset < len(values)
+                    else removed
+                    for index in range(len(values))
+                ]
+            )
+        )
+
+    @classmethod
+    def _format_group(cls, group, indices):
+        """Return the expansion of a parameter group.
+
+        group is a tuple of the group template and a list of (name, values,
+        loop-index, offset) for each parameter in it. Loop-index is None for
+        specific values, in which case values holds the value itself.
+        indices holds the current index of each parameter looped over.
+        Values offset out of range are replaced by _REMOVE.
+        """
+        tmpl, slots = group
+        param_values = {}
+        for pname, values, loop_index, offset in slots:
+            if loop_index is None:
+                param_values[pname] = values
+                continue
+            index = indices[loop_index] + offset
+            if 0 <= index < len(values):
+                param_values[pname] = values[index]
+            else:
+                param_values[pname] = cls._REMOVE
+        return tmpl % param_values
@@ -72,13 +72,17 @@ class ParsecConfig:
         self.manyparents = self._get_namespace_parents()
         self.options = options
 
-    def loadcfg(self, rcfile, title=""):
+    def loadcfg(self, rcfile, title="", use_cache=False):
         """Parse a config file, upgrade or deprecate items if necessary,
         validate it against the spec, and if this is not the first load,
-        combine/override with the existing loaded config."""
+        combine/override with the existing loaded config.
+
+        If use_cache is True, the processed file may be reused from the
+        on-disk cache (see cylc.flow.parsec.fileparse.parse)."""
 
         sparse = parse(
-            rcfile, self.output_fname, self.tvars, opts=self.options)
+            rcfile, self.output_fname, self.tvars, opts=self.options,
+            use_cache=use_cache)
 
         if self.upgrader is not None:
             self.upgrader(sparse, title)
@@ -30,15 +30,21 @@ parsec config file parsing:
       value type is known).
 """
 
+from contextlib import suppress
 from copy import deepcopy
+from hashlib import sha256
+import json
 import os
 from pathlib import Path
 import re
 import sys
+from tempfile import NamedTemporaryFile
+from time import time
 import typing as t
 
 from cylc.flow import __version__
-from cylc.flow import LOG
+from cylc.flow import LOG, iter_entry_points
+from cylc.flow.hostuserutil import get_user_home
 from cylc.flow.parsec.exceptions import (
     FileParseError, ParsecError, TemplateVarLanguageClash
 )
@@ -48,7 +54,7 @@ from cylc.flow.plugins import run_plugins
 from cylc.flow.parsec.util import itemstr
 from cylc.flow.templatevars import get_template_vars_from_db
 from cylc.flow.workflow_files import (
-    get_workflow_source_dir, check_flow_file)
+    WorkflowFiles, get_workflow_source_dir, check_flow_file)
 
 if t.TYPE_CHECKING:
     from optparse import Values
@@ -115,6 +121,25 @@ EXTRA_VARS_TEMPLATE: t.Dict[str, t.Any] = {
     TEMPLATING_DETECTED: None
 }
 
+# Processed configurations cached by "parse(..., use_cache=True)"
+CONFIG_CACHE_DIR = Path(get_user_home(), '.cylc', 'flow', 'config-cache')
+# Remove cache entries which have not been used for this long (seconds)
+CONFIG_CACHE_MAX_AGE = 7 * 86400
+# Directories which are not part of the workflow definition
+_CONFIG_CACHE_IGNORE_DIRS = {
+    '__pycache__',
+    WorkflowFiles.RUN_N,
+    WorkflowFiles.LogDir.DIRNAME,
+    WorkflowFiles.SHARE_DIR,
+    WorkflowFiles.WORK_DIR,
+    WorkflowFiles.Install.DIRNAME,
+}
+# Environment variables which are always part of the cache key (in addition
+# to those referenced by name in the workflow files)
+_CONFIG_CACHE_ENV_PREFIX = 'CYLC_'
+# Things which look like environment variable names
+_CONFIG_CACHE_ENV_NAME = re.compile(rb'[A-Za-z_][A-Za-z0-9_]*')
+
 
 def get_cylc_env_vars() -> t.Dict[str, str]:
     """Return a restricted dict of CYLC_ environment variables for templating.
@@ -531,6 +556,130 @@ def read_and_proc(
     return [fl.rstrip() for fl in flines]
 
 
+def _get_config_cache_key(
+    fpath: str,
+    template_vars: t.Optional[t.Dict[str, t.Any]],
+    opts: t.Any,
+) -> str:
+    """Return a key for the processed config file.
+
+    This is a hash of everything the output of "read_and_proc" depends on:
+
+    * The contents of the files in the workflow directory (excluding
+      hidden and run directories).
+    * The template variables (including those stored in the workflow
+      database) and options.
+    * The CYLC_* environment variables and any others whose names appear
+      in the workflow files (i.e. those the templating can read).
+    * The global configuration.
+    * The versions of Cylc, Python and any pre-configure plugins.
+
+    """
+    from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
+    template_vars = _prepend_old_templatevars(fpath, dict(template_vars or {}))
+    fpath = os.path.abspath(_get_fpath_for_source(fpath, opts))
+    hash_ = sha256()
+
+    def _update(item: t.Any) -> None:
+        hash_.update(repr(item).encode())
+        hash_.update(b'\0')
+
+    _update(__version__)
+    _update(sys.version)
+    _update([
+        (
+            entry_point.name,
+            entry_point.value,
+            getattr(entry_point.dist, 'version', None),
+        )
+        for entry_point in iter_entry_points('cylc.pre_configure')
+    ])
+    _update(glbl_cfg().get(sparse=True))
+    _update(fpath)
+    _update(template_vars)
+    _update(sorted(vars(opts).items()) if opts else None)
+
+    names: t.Set[bytes] = set()
+    for root, dirs, files in os.walk(os.path.dirname(fpath)):
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if not name.startswith('.')
+            and name not in _CONFIG_CACHE_IGNORE_DIRS
+        )
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            _update(path)
+            try:
+                with open(path, 'rb') as handle:
+                    content = handle.read()
+            except OSError:
+                _update(None)
+            else:
+                hash_.update(content)
+                names.update(_CONFIG_CACHE_ENV_NAME.findall(content))
+
+    _update(sorted(
+        (key, value)
+        for key, value in os.environ.items()
+        if (
+            key.startswith(_CONFIG_CACHE_ENV_PREFIX)
+            or key.encode() in names
+        )
+    ))
+    return hash_.hexdigest()
+
+
+def _load_config_cache(
+    key: str,
+    cache_dir: 'Union[str, Path, None]' = None,
+) -> t.Optional[t.List[str]]:
+    """Return the cached processed config lines for key, if present.
+
+    Examples:
+        >>> _load_config_cache('no-such-key', '/no/such/dir')
+
+    """
+    path = Path(cache_dir or CONFIG_CACHE_DIR, f'{key}.json')
+    try:
+        with open(path) as cache_file:
+            flines = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(flines, list):
+        return None
+    # record that the entry has been used (for housekeeping)
+    with suppress(OSError):
+        os.utime(path)
+    return flines
+
+
+def _save_config_cache(
+    key: str,
+    flines: t.List[str],
+    cache_dir: 'Union[str, Path, None]' = None,
+) -> None:
+    """Cache processed config lines.
+
+    The cache may be shared by many concurrent processes so entries are
+    written by atomic replacement, failure to write them is not an error.
+    """
+    cache_dir = Path(cache_dir or CONFIG_CACHE_DIR)
+    now = time()
+    with suppress(OSError):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # housekeep entries which have not been used recently
+        for path in cache_dir.glob('*.json'):
+            with suppress(OSError):
+                if now - path.stat().st_mtime > CONFIG_CACHE_MAX_AGE:
+                    path.unlink()
+        with NamedTemporaryFile(
+            'w', dir=cache_dir, prefix=f'.{key}.', delete=False
+        ) as tmp_file:
+            json.dump(flines, tmp_file)
+        os.replace(tmp_file.name, cache_dir / f'{key}.json')
+
+
 def hashbang_and_plugin_templating_clash(
     templating: str, flines: t.List[str]
 ) -> t.Optional[str]:
@@ -583,11 +732,25 @@ def parse(
     output_fname: t.Optional[str] = None,
     template_vars: t.Optional[t.Dict[str, t.Any]] = None,
     opts: t.Any = None,
+    use_cache: bool = False,
 ) -> OrderedDictWithDefaults:
-    """Parse file items line-by-line into a corresponding nested dict."""
+    """Parse file items line-by-line into a corresponding nested dict.
+
+    If use_cache is True, the processed file is cached on disk and reused
+    if none of its inputs have changed (see _get_config_cache_key).
+    """
 
     # read and process the file (jinja2, include-files, line continuation)
-    flines = read_and_proc(fpath, template_vars, opts=opts)
+    flines = None
+    if use_cache:
+        cache_key = _get_config_cache_key(fpath, template_vars, opts)
+        flines = _load_config_cache(cache_key)
+        if flines is not None:
+            LOG.debug('Using cached processed configuration: %s', cache_key)
+    if flines is None:
+        flines = read_and_proc(fpath, template_vars, opts=opts)
+        if use_cache:
+            _save_config_cache(cache_key, flines)
     if output_fname:
         with open(output_fname, 'w') as handle:
             handle.write('\n'.join(flines) + '\n')
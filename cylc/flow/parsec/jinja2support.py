@@ -32,6 +32,7 @@ from jinja2 import (
     BaseLoader,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     StrictUndefined,
     TemplateNotFound,
@@ -40,6 +41,7 @@ from jinja2 import (
 from cylc.flow import LOG
 from cylc.flow.parsec.exceptions import Jinja2Error
 from cylc.flow.parsec.fileparse import get_cylc_env_vars
+from cylc.flow.workflow_files import WorkflowFiles
 
 TRACEBACK_LINENO = re.compile(
     r'\s+?File "(?P<file>.*)", line (?P<line>\d+), in .*template'
@@ -144,7 +146,28 @@ def _load_jinja2_extensions():
     return jinja2_extensions
 
 
-def jinja2environment(dir_=None):
+def get_bytecode_cache(dir_: str) -> t.Optional[FileSystemBytecodeCache]:
+    """Return a cache for compiled templates of an installed workflow.
+
+    The cache lives in the workflow service directory so is only available
+    for installed workflows (i.e. not for source directories).
+
+    Cached templates are keyed by template name and invalidated when the
+    template source changes.
+    """
+    srv_dir = os.path.join(dir_, WorkflowFiles.Service.DIRNAME)
+    if not os.path.isdir(srv_dir):
+        return None
+    cache_dir = os.path.join(srv_dir, WorkflowFiles.Service.JINJA2_CACHE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as exc:
+        LOG.debug(f'Jinja2 cache unavailable: {exc}')
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+
+def jinja2environment(dir_=None, bytecode_cache=None):
     """Set up and return Jinja2 environment."""
     if dir_ is None:
         dir_ = os.getcwd()
@@ -154,7 +177,8 @@ def jinja2environment(dir_=None):
     env = Environment(  # nosec
         loader=ChoiceLoader([FileSystemLoader(dir_), PyModuleLoader()]),
         undefined=StrictUndefined,
-        extensions=['jinja2.ext.do'])
+        extensions=['jinja2.ext.do'],
+        bytecode_cache=bytecode_cache)
 
     # Load Jinja2 filters using setuptools
     for scope, extensions in _load_jinja2_extensions().items():
@@ -199,6 +223,23 @@ def jinja2environment(dir_=None):
     return env
 
 
+def from_string(env: Environment, source: str, name: str):
+    """Return a template from source, using the bytecode cache if available.
+
+    Equivalent to env.from_string(source), which would not use the cache
+    (only templates loaded by name, e.g. includes, use it by default).
+    """
+    if env.bytecode_cache is None:
+        return env.from_string(source)
+    bucket = env.bytecode_cache.get_bucket(env, name, None, source)
+    code = bucket.code
+    if code is None:
+        code = env.compile(source)
+        bucket.code = code
+        env.bytecode_cache.set_bucket(bucket)
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
+
 def get_error_lines(
     base_template_file: str,
     template_lines: t.List[str],
@@ -275,8 +316,9 @@ def jinja2process(
     # AND TYPEERROR (e.g. for not using "|int" filter on number inputs.
     # Convert unicode to plain str, ToDo - still needed for parsec?)
     try:
-        env = jinja2environment(dir_)
-        template = env.from_string('\n'.join(flines[1:]))
+        env = jinja2environment(dir_, get_bytecode_cache(dir_))
+        template = from_string(
+            env, '\n'.join(flines[1:]), str(fpath or '<template>'))
         lines = str(template.render(template_vars)).splitlines()
     except TemplateSyntaxError as exc:
         filename = None
@@ -21,7 +21,7 @@ import re
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING, Any, Dict, Iterable,
-    List, Optional, Set, Union, overload
+    List, Optional, Pattern, Set, Tuple, Union, overload
 )
 
 from cylc.flow import LOG
@@ -58,6 +58,9 @@ SINGLE_HOST_JOB_RUNNERS = ['background', 'at']
 HOST_REC_COMMAND = re.compile(r'(`|\$\()\s*(.*)\s*([`)])$')
 PLATFORM_REC_COMMAND = re.compile(r'(\$\()\s*(.*)\s*([)])$')
 
+# Cached platform lookups for the loaded global config.
+_PLATFORM_RESOLVER: Optional['PlatformResolver'] = None
+
 HOST_SELECTION_METHODS = {
     'definition order': lambda goodhosts: goodhosts[0],
     'random': random.choice
@@ -200,73 +203,201 @@ def platform_from_name(
     Raises:
         NoPlatformsError: Platform group has no platforms with usable hosts.
     """
+    return get_platform_resolver(platforms).resolve(platform_name, bad_hosts)
+
+
+def get_platform_resolver(
+    platforms: Optional[Dict[str, Dict[str, Any]]] = None
+) -> 'PlatformResolver':
+    """Return a platform resolver for the global config.
+
+    The resolver is built once and reused for as long as the global config
+    platforms and platform groups are the same objects, i.e. it is rebuilt
+    when the global config is (re)loaded.
+
+    Args:
+        platforms: global.cylc platforms given as a dict, defaults to the
+            global config [platforms] section.
+
+    """
+    global _PLATFORM_RESOLVER
     if platforms is None:
         platforms = glbl_cfg().get(['platforms'])
     platform_groups = glbl_cfg().get(['platform groups'])
+    resolver = _PLATFORM_RESOLVER
+    if resolver is None or not resolver.is_for(platforms, platform_groups):
+        resolver = PlatformResolver(platforms, platform_groups)
+        _PLATFORM_RESOLVER = resolver
+    return resolver
+
+
+class PlatformResolver:
+    """Compiled and indexed lookup of platforms and platform groups.
+
+    Platform (and platform group) names are matched against the names in the
+    global config in reverse definition order, the first match wins. This
+    compiles the regular expressions once, indexes literal names so that they
+    can be resolved without scanning the whole config and memoizes the result
+    of each lookup.
+
+    Platform group selection is not memoized as it depends on the selection
+    method and on the set of bad hosts at the time of the call.
+
+    Args:
+        platforms: The [platforms] global config section.
+        platform_groups: The [platform groups] global config section.
+
+    Raises:
+        PlatformLookupError:
+            If the localhost platform is defined using a regular expression.
 
-    if platform_name is None:
-        platform_name = 'localhost'
+    """
 
-    # The list is reversed to allow user-set platform groups (which are
-    # appended to site set platform groups) to be matched first and override
-    # site defined platform groups.
-    for platform_name_re in reversed(list(platform_groups)):
-        # Platform is member of a group.
-        if re.fullmatch(platform_name_re, platform_name):
+    # Names which can be matched by dictionary lookup rather than regex.
+    LITERAL_NAME = re.compile(r'[\w\-]+')
+    # Substitute commas with or without spaces to allow lists of platforms.
+    LIST_SEP = re.compile(r'\s*(?!{[\s\d]*),(?![\s\d]*})\s*')
+
+    def __init__(
+        self,
+        platforms: Dict[str, Dict[str, Any]],
+        platform_groups: Dict[str, Dict[str, Any]],
+    ) -> None:
+        self.platforms = platforms
+        self.platform_groups = platform_groups
+        for platform_name_re in platforms:
+            if (
+                # If the platform_name_re contains special regex chars
+                re.escape(platform_name_re) != platform_name_re
+                and re.match(platform_name_re, 'localhost')
+            ):
+                raise PlatformLookupError(
+                    'The "localhost" platform cannot be defined using a '
+                    'regular expression. See the documentation for '
+                    '"global.cylc[platforms][localhost]" for more '
+                    'information.'
+                )
+        self._platform_index = self._build_index(
+            (self.LIST_SEP.sub('|', name), name) for name in platforms
+        )
+        self._group_index = self._build_index(
+            (name, name) for name in platform_groups
+        )
+        # platform or group name -> matching config key (or None)
+        self._platform_cache: Dict[str, Optional[str]] = {}
+        self._group_cache: Dict[str, Optional[str]] = {}
+
+    def is_for(
+        self,
+        platforms: Dict[str, Dict[str, Any]],
+        platform_groups: Dict[str, Dict[str, Any]],
+    ) -> bool:
+        """Return True if this resolver was built from these sections."""
+        return (
+            self.platforms is platforms
+            and self.platform_groups is platform_groups
+        )
+
+    @classmethod
+    def _build_index(cls, items):
+        """Index literal names and compile regexes.
+
+        Args:
+            items: Iterable of (regex, config key) in definition order.
+
+        Returns:
+            (literals, patterns) where literals maps names to their
+            (definition index, key) and patterns is a list of
+            (definition index, compiled regex, key) in reverse definition
+            order.
+
+        """
+        literals: Dict[str, Tuple[int, str]] = {}
+        patterns: List[Tuple[int, Pattern, str]] = []
+        for ind, (regex, key) in enumerate(items):
+            if cls.LITERAL_NAME.fullmatch(regex):
+                literals[regex] = (ind, key)
+            else:
+                patterns.append((ind, re.compile(regex), key))
+        patterns.reverse()
+        return literals, patterns
+
+    @staticmethod
+    def _match(index, name: str) -> Optional[str]:
+        """Return the key of the last definition which matches name."""
+        literals, patterns = index
+        literal_ind, key = literals.get(name, (-1, None))
+        for ind, pattern, pattern_key in patterns:
+            if ind < literal_ind:
+                # the literal was defined later, so it takes precedence
+                break
+            if pattern.fullmatch(name):
+                return pattern_key
+        return key
+
+    def get_group_key(self, name: str) -> Optional[str]:
+        """Return the key of the platform group matching name, if any."""
+        try:
+            return self._group_cache[name]
+        except KeyError:
+            key = self._group_cache[name] = self._match(
+                self._group_index, name)
+            return key
+
+    def get_platform_key(self, name: str) -> Optional[str]:
+        """Return the key of the platform matching name, if any."""
+        try:
+            return self._platform_cache[name]
+        except KeyError:
+            key = self._platform_cache[name] = self._match(
+                self._platform_index, name)
+            return key
+
+    def resolve(
+        self,
+        platform_name: Optional[str] = None,
+        bad_hosts: Optional[Set[str]] = None,
+    ) -> Dict[str, Any]:
+        """Return the platform for a platform or platform group name.
+
+        See `platform_from_name`.
+
+        """
+        if platform_name is None:
+            platform_name = 'localhost'
+
+        group_key = self.get_group_key(platform_name)
+        if group_key is not None:
+            # Platform is member of a group.
             platform_name = get_platform_from_group(
-                platform_groups[platform_name_re], group_name=platform_name,
+                self.platform_groups[group_key], group_name=platform_name,
                 bad_hosts=bad_hosts
             )
-            break
 
-    for platform_name_re in platforms:
-        if (
-            # If the platform_name_re contains special regex chars
-            re.escape(platform_name_re) != platform_name_re
-            and re.match(platform_name_re, 'localhost')
-        ):
+        platform_key = self.get_platform_key(platform_name)
+        if platform_key is None:
             raise PlatformLookupError(
-                'The "localhost" platform cannot be defined using a '
-                'regular expression. See the documentation for '
-                '"global.cylc[platforms][localhost]" for more information.'
-            )
-
-    # The list is reversed to allow user-set platforms (which are appended to
-    # than site set platforms) to be matched first and override site defined
-    # platforms.
-    for platform_name_re in reversed(list(platforms)):
-        # We substitute commas with or without spaces to
-        # allow lists of platforms
-        if re.fullmatch(
-            re.sub(
-                r'\s*(?!{[\s\d]*),(?![\s\d]*})\s*',
-                '|',
-                platform_name_re
-            ),
-            platform_name
+                f"No matching platform \"{platform_name}\" found")
+
+        # Deepcopy prevents contaminating platforms with data
+        # from other platforms matching platform_name_re
+        platform_data = deepcopy(self.platforms[platform_key])
+
+        # If hosts are not filled in make remote
+        # hosts the platform name.
+        # Example: `[platforms][workplace_vm_123]<nothing>`
+        #   should create a platform where
+        #   `hosts = ['workplace_vm_123']`
+        # NOTE: Probably don't use .get() due to OrderedDictWithDefaults -
+        # see https://github.com/cylc/cylc-flow/pull/4975
+        if (
+            'hosts' not in platform_data or
+            not platform_data['hosts']
         ):
-            # Deepcopy prevents contaminating platforms with data
-            # from other platforms matching platform_name_re
-            platform_data = deepcopy(platforms[platform_name_re])
-
-            # If hosts are not filled in make remote
-            # hosts the platform name.
-            # Example: `[platforms][workplace_vm_123]<nothing>`
-            #   should create a platform where
-            #   `hosts = ['workplace_vm_123']`
-            # NOTE: Probably don't use .get() due to OrderedDictWithDefaults -
-            # see https://github.com/cylc/cylc-flow/pull/4975
-            if (
-                'hosts' not in platform_data or
-                not platform_data['hosts']
-            ):
-                platform_data['hosts'] = [platform_name]
-            # Fill in the "private" name field.
-            platform_data['name'] = platform_name
-            return platform_data
-
-    raise PlatformLookupError(
-        f"No matching platform \"{platform_name}\" found")
+            platform_data['hosts'] = [platform_name]
+        # Fill in the "private" name field.
+        platform_data['name'] = platform_name
+        return platform_data
 
 
 def get_platform_from_group(
@@ -15,6 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Run command on a remote, (i.e. a remote [user@]host)."""
 
+from collections import deque
+from contextlib import suppress
+from hashlib import sha256
 import os
 from shlex import quote
 from pathlib import Path
@@ -27,8 +30,10 @@ import signal
 #   Subprocess is needed, but we use it with security in mind.
 from subprocess import Popen, PIPE, DEVNULL
 import sys
-from time import sleep
-from typing import Any, Dict, List, Tuple
+from time import sleep, time
+from typing import (
+    Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+)
 
 import cylc.flow.flags
 from cylc.flow import __version__ as CYLC_VERSION, LOG
@@ -194,9 +199,143 @@ DEFAULT_INCLUDES = [
 ]
 
 
+# The server key is installed along with the DEFAULT_INCLUDES
+SERVER_KEY_INCLUDE = '/.service/server.key'
+
+
+class InstallManifestEntry(NamedTuple):
+    """A path installed by file install.
+
+    Files record their size and modification time so that their checksum can
+    be reused while these are unchanged.
+    """
+    checksum: str
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+
+
+def _file_checksum(path: str) -> str:
+    """Return the SHA256 checksum of a file."""
+    hasher = sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(65536), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _file_manifest_entry(
+    path: str, prev_entry: Optional[InstallManifestEntry]
+) -> InstallManifestEntry:
+    """Return the manifest entry for a file.
+
+    The checksum of prev_entry is reused if the file size and modification
+    time are unchanged.
+    """
+    stat = os.stat(path)
+    if (
+        prev_entry is not None
+        and prev_entry.size == stat.st_size
+        and prev_entry.mtime_ns == stat.st_mtime_ns
+    ):
+        return prev_entry
+    return InstallManifestEntry(
+        _file_checksum(path), stat.st_size, stat.st_mtime_ns
+    )
+
+
+def get_install_manifest(
+    src_path: str,
+    rsync_includes=None,
+    prev_manifest: Optional[Dict[str, InstallManifestEntry]] = None,
+) -> Dict[str, InstallManifestEntry]:
+    """Return a content manifest of the files installed by file install.
+
+    This covers the same files as `construct_rsync_over_ssh_cmd`.
+
+    Args:
+        src_path: The workflow run directory.
+        rsync_includes: Configured files and directories to install.
+        prev_manifest:
+            A previous manifest of src_path, file checksums are reused from
+            this for files whose size and modification time are unchanged.
+
+    Returns:
+        {path: entry} for each directory, file or symlink to install, where
+        path is relative to src_path. Directories have the checksum "dir",
+        symlinks "link:<target>".
+
+    """
+    if prev_manifest is None:
+        prev_manifest = {}
+    manifest: Dict[str, InstallManifestEntry] = {}
+    for include in [
+        *DEFAULT_INCLUDES,
+        SERVER_KEY_INCLUDE,
+        *get_includes_to_rsync(rsync_includes),
+    ]:
+        rel_path = include.strip('/')
+        if rel_path.endswith('/***'):
+            rel_path = rel_path[:-len('/***')]
+        path = os.path.join(src_path, rel_path)
+        if os.path.islink(path):
+            manifest[rel_path] = InstallManifestEntry(
+                f'link:{os.readlink(path)}')
+        elif os.path.isfile(path):
+            manifest[rel_path] = _file_manifest_entry(
+                path, prev_manifest.get(rel_path))
+        elif os.path.isdir(path):
+            manifest[rel_path] = InstallManifestEntry('dir')
+            for dirpath, dirnames, filenames in os.walk(path):
+                for name in dirnames + filenames:
+                    item = os.path.join(dirpath, name)
+                    item_rel_path = os.path.relpath(item, src_path)
+                    if os.path.islink(item):
+                        manifest[item_rel_path] = InstallManifestEntry(
+                            f'link:{os.readlink(item)}')
+                    elif name in dirnames:
+                        manifest[item_rel_path] = InstallManifestEntry('dir')
+                    else:
+                        manifest[item_rel_path] = _file_manifest_entry(
+                            item, prev_manifest.get(item_rel_path))
+    return manifest
+
+
+def get_install_manifest_changes(
+    old: Dict[str, InstallManifestEntry], new: Dict[str, InstallManifestEntry]
+) -> Optional[List[str]]:
+    """Return the paths to install to bring a target from old to new.
+
+    Only checksums are compared, so touching a file does not install it.
+
+    Examples:
+        >>> E = InstallManifestEntry
+        >>> get_install_manifest_changes(
+        ...     {'a': E('1')}, {'a': E('1', 1, 2), 'b': E('2')})
+        ['b']
+        >>> get_install_manifest_changes({'a': E('1')}, {'a': E('1')})
+        []
+
+        Paths have been removed so incremental installation is not possible:
+        >>> get_install_manifest_changes({'a': E('1'), 'b': E('2')}, {})
+
+    Returns:
+        A sorted list of new or changed paths, or None if any paths have
+        been removed (which requires a full installation to delete them).
+
+    """
+    if not old or not set(old).issubset(new):
+        return None
+    return sorted(
+        path
+        for path, entry in new.items()
+        if path not in old or old[path].checksum != entry.checksum
+    )
+
+
 def construct_rsync_over_ssh_cmd(
     src_path: str, dst_path: str, platform: Dict[str, Any],
-    rsync_includes=None, bad_hosts=None
+    rsync_includes=None, bad_hosts=None,
+    files_from_stdin: bool = False,
 ) -> Tuple[List[str], str]:
     """Constructs the rsync command used for remote file installation.
 
@@ -208,6 +347,10 @@ def construct_rsync_over_ssh_cmd(
         dst_path: path of target
         platform: contains info relating to platform
         rsync_includes: files and directories to be included in the rsync
+        files_from_stdin:
+            If True, only install the paths (relative to src_path) which the
+            command reads from stdin (see `get_install_manifest_changes`),
+            nothing is deleted.
 
     Raises:
         NoHostsError:
@@ -223,11 +366,20 @@ def construct_rsync_over_ssh_cmd(
     ssh_cmd = platform['ssh command']
     command = platform['rsync command']
     rsync_cmd = shlex.split(command)
+    if files_from_stdin:
+        rsync_cmd.extend([
+            "--rsh=" + ssh_cmd,
+            "--files-from=-",
+            *DEFAULT_RSYNC_OPTS,
+            f"{src_path}/",
+            f"{dst_host}:{dst_path}/",
+        ])
+        return rsync_cmd, dst_host
     rsync_options = [
         "--delete",
         "--rsh=" + ssh_cmd,
         "--include=/.service/",
-        "--include=/.service/server.key"
+        f"--include={SERVER_KEY_INCLUDE}"
     ] + DEFAULT_RSYNC_OPTS
     # Note to future devs - be wary of changing the order of the following
     # rsync options, rsync is very particular about order of in/ex-cludes.
@@ -441,3 +593,127 @@ def cylc_server_cmd(cmd, host=None, **kwargs):
         host=host,
         **kwargs,
     )
+
+
+# The maximum number of remote commands run at once by run_remote_ops
+MAX_PARALLEL_REMOTE_OPS = 16
+
+
+class RemoteOp(NamedTuple):
+    """A command started on a remote platform by run_remote_ops."""
+    proc: 'Popen[str]'
+    platform: Dict[str, Any]
+    host: Optional[str] = None
+
+
+class RemoteOpResult(NamedTuple):
+    """The outcome of a command run by run_remote_ops."""
+    target: str
+    platform: Dict[str, Any]
+    host: Optional[str]
+    proc: 'Popen[str]'
+    ret_code: Optional[int]
+    out: str
+    err: str
+    timed_out: bool = False
+
+
+# Start (or retry) the command for a target, given the result of the previous
+# attempt (None for the first). Return None to give up.
+RemoteOpStarter = Callable[[Optional[RemoteOpResult]], Optional[RemoteOp]]
+
+
+def run_remote_ops(
+    ops: Dict[str, RemoteOpStarter],
+    max_parallel: int = MAX_PARALLEL_REMOTE_OPS,
+    timeout: Optional[float] = None,
+    total_timeout: Optional[float] = None,
+) -> Dict[str, RemoteOpResult]:
+    """Run commands on multiple remote targets concurrently.
+
+    Used for operations which must be run on each install target e.g. remote
+    tidy and remote clean.
+
+    * At most max_parallel commands run at once.
+    * A command which returns 255 (SSH failure) is retried by calling its
+      starter again with the failed result, the starter can return None to
+      give up (e.g. if there are no other hosts / platforms to try).
+    * A command which runs for longer than timeout seconds is terminated.
+    * Any command still running after total_timeout seconds is terminated
+      and no more commands are started.
+
+    Args:
+        ops: {target: starter}
+        max_parallel: The maximum number of commands to run at once.
+        timeout: Deadline in seconds for each command.
+        total_timeout: Deadline in seconds for all commands.
+
+    Returns:
+        {target: result} for each target where a command was run.
+
+    """
+    pending: Deque[str] = deque(ops)
+    running: Dict[str, Tuple[RemoteOp, Optional[float]]] = {}
+    results: Dict[str, RemoteOpResult] = {}
+    # targets where no command was started before the total deadline
+    not_started: List[str] = []
+    total_deadline = (
+        time() + total_timeout if total_timeout is not None else None
+    )
+
+    def _start(target: str, prev: Optional[RemoteOpResult]) -> None:
+        if total_deadline is not None and time() >= total_deadline:
+            if prev is not None:
+                results[target] = prev
+            not_started.append(target)
+            return
+        op = ops[target](prev)
+        if op is None:
+            if prev is not None:
+                results[target] = prev
+            return
+        deadline = time() + timeout if timeout is not None else None
+        if total_deadline is not None:
+            deadline = min(deadline or total_deadline, total_deadline)
+        running[target] = (op, deadline)
+
+    while pending or running:
+        while pending and len(running) < max_parallel:
+            _start(pending.popleft(), None)
+        finished = False
+        for target, (op, deadline) in list(running.items()):
+            ret_code = op.proc.poll()
+            timed_out = False
+            if ret_code is None:
+                if deadline is None or time() < deadline:
+                    continue
+                # command took too long, kill it
+                timed_out = True
+                with suppress(OSError):
+                    op.proc.terminate()
+            finished = True
+            del running[target]
+            out, err = op.proc.communicate()
+            result = RemoteOpResult(
+                target,
+                op.platform,
+                op.host,
+                op.proc,
+                None if timed_out else ret_code,
+                out,
+                err,
+                timed_out,
+            )
+            if ret_code == 255:
+                # SSH failure, the starter may retry elsewhere
+                _start(target, result)
+            else:
+                results[target] = result
+        if not finished:
+            sleep(0.1)
+    if not_started:
+        LOG.warning(
+            'Timed out before running remote commands on: '
+            + ', '.join(not_started)
+        )
+    return results
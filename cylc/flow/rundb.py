@@ -23,6 +23,7 @@ import sqlite3
 import traceback
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Iterable,
     List,
     Set,
@@ -186,6 +187,7 @@ class CylcWorkflowDAO:
     TABLE_BROADCAST_EVENTS = "broadcast_events"
     TABLE_BROADCAST_STATES = "broadcast_states"
     TABLE_INHERITANCE = "inheritance"
+    TABLE_INSTALL_MANIFESTS = "install_manifests"
     TABLE_WORKFLOW_PARAMS = "workflow_params"
     # BACK COMPAT: suite_params
     # This Cylc 7 DB table is needed to allow workflow-state
@@ -228,6 +230,14 @@ class CylcWorkflowDAO:
             ["namespace", {"is_primary_key": True}],
             ["inheritance"],
         ],
+        # The files last installed to each install target by file install.
+        TABLE_INSTALL_MANIFESTS: [
+            ["install_target", {"is_primary_key": True}],
+            ["path", {"is_primary_key": True}],
+            ["checksum"],
+            ["size", {"datatype": "INTEGER"}],
+            ["mtime_ns", {"datatype": "INTEGER"}],
+        ],
         TABLE_WORKFLOW_PARAMS: [
             ["key", {"is_primary_key": True}],
             ["value"],
@@ -772,6 +782,30 @@ class CylcWorkflowDAO:
         '''  # nosec (table name is code constant)
         return {i[0] for i in self.connect().execute(stmt)}
 
+    def select_install_manifest(
+        self, install_target: str
+    ) -> Dict[str, Tuple[str, Optional[int], Optional[int]]]:
+        """Return the last installed file manifest for an install target.
+
+        Returns:
+            {path: (checksum, size, mtime_ns)}
+
+        """
+        stmt = rf'''
+            SELECT
+                path, checksum, size, mtime_ns
+            FROM
+                {self.TABLE_INSTALL_MANIFESTS}
+            WHERE
+                install_target == ?
+        '''  # nosec (table name is code constant)
+        return {
+            path: (checksum, size, mtime_ns)
+            for path, checksum, size, mtime_ns in self.connect().execute(
+                stmt, [install_target]
+            )
+        }
+
     def select_prev_instances(
         self, name: str, point: str
     ) -> List[Tuple[int, bool, Set[int], str]]:
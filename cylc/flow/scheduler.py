@@ -1161,6 +1161,14 @@ class Scheduler:
         else:
             self.reload_pending = 'applying the new config'
             old_tasks = set(self.config.get_task_name_list())
+            changed_tasks = config.reuse_taskdefs(self.config)
+            if changed_tasks is None:
+                LOG.info('Reloading all task definitions.')
+            else:
+                LOG.info(
+                    f'Reloading {len(changed_tasks)} changed task'
+                    ' definition(s).'
+                )
             # Things that can't change on workflow reload:
             self._set_workflow_params(
                 self.workflow_db_mgr.pri_dao.select_workflow_params()
@@ -1188,12 +1196,14 @@ class Scheduler:
             self._update_workflow_state()
 
             # Re-initialise data model on reload
-            self.data_store_mgr.initiate_data_model(self.is_reloaded)
+            self.data_store_mgr.initiate_data_model(
+                self.is_reloaded, changed_tasks
+            )
 
             # Reset the remote init map to trigger fresh file installation
             self.task_job_mgr.task_remote_mgr.remote_init_map.clear()
             self.task_job_mgr.task_remote_mgr.is_reload = True
-            self.pool.reload_taskdefs(config)
+            self.pool.reload_taskdefs(config, changed_tasks)
             # Load jobs from DB
             self.workflow_db_mgr.pri_dao.select_jobs_for_restart(
                 self.data_store_mgr.insert_db_job
@@ -54,7 +54,7 @@ from packaging.specifiers import SpecifierSet
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.exceptions import CylcError
 from cylc.flow.id import tokenise, IDTokens, Tokens
-from cylc.flow.network.scan import scan
+from cylc.flow.network.scan import ScanCache, scan
 from cylc.flow.option_parsers import CylcOptionParser as COP
 from cylc.flow.pathutil import get_workflow_run_job_dir
 from cylc.flow.resources import (
@@ -80,6 +80,9 @@ REQUIRED_SCRIPT_VERSION = '>=1.0.0, <2.0.0'
 # register the psudo "help" and "version" commands
 COMMAND_LIST = list(COMMANDS) + ['help', 'version']
 
+# directory listings, contact files and clients reused between scans
+SCAN_CACHE = ScanCache()
+
 
 def stdin(timeout: int = 2) -> t.Iterator[str]:
     """Yield lines from stdin, stop on configured read timeout.
@@ -383,7 +386,9 @@ async def list_option_values(
 
 async def list_workflows(states: t.Optional[t.Set[str]] = None) -> t.List[str]:
     """List workflows from run directories."""
-    pipe = get_pipe(ScanOptions(states=states or FLOW_STATES), 'None')
+    pipe = get_pipe(
+        ScanOptions(states=states or FLOW_STATES), 'None', cache=SCAN_CACHE
+    )
     ids = []
     async for flow in pipe:
         ids.append(cli_detokenise(Tokens(workflow=flow['name'])))
@@ -394,7 +399,9 @@ async def list_src_workflows(_partial: str) -> t.List[str]:
     """List workflow source directories from "source dirs"."""
     ret = []
     for src_dir in glbl_cfg().get(['install', 'source dirs']):
-        async for src_flow in scan(run_dir=Path(src_dir).expanduser()):
+        async for src_flow in scan(
+            run_dir=Path(src_dir).expanduser(), cache=SCAN_CACHE
+        ):
             ret.append(src_flow['name'])
     return ret
 
@@ -822,11 +829,14 @@ def main(_, opts: 'Values') -> None:
         # this server version is not compatible with the script version
         return
 
-    asyncio.run(
-        server(
-            stdin,
-            complete_cylc,
-            once=opts.once,
-            timeout=opts.timeout
+    try:
+        asyncio.run(
+            server(
+                stdin,
+                complete_cylc,
+                once=opts.once,
+                timeout=opts.timeout
+            )
         )
-    )
+    finally:
+        SCAN_CACHE.close()
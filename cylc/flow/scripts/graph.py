@@ -33,6 +33,9 @@ Examples:
 
     # render the graph to a svg file
     $ cylc graph one -o 'one.svg'
+
+    # write a long graph in dot format as it is generated
+    $ cylc graph one 2000 2010 --stream -o 'one.dot'
 """
 
 import asyncio
@@ -41,7 +44,16 @@ from shutil import which
 from subprocess import Popen, PIPE
 import sys
 from tempfile import NamedTemporaryFile
-from typing import Dict, List, Optional, TYPE_CHECKING, Tuple, Callable
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+)
 
 from cylc.flow.config import WorkflowConfig
 from cylc.flow.exceptions import InputError, CylcError
@@ -270,6 +282,50 @@ def format_graphviz(
     return dot_lines
 
 
+def format_graphviz_stream(
+    opts,
+    graph: Iterable[tuple],
+    max_seen_nodes: int = 10000,
+) -> Iterator[str]:
+    """Write raw graph edges in graphviz format as they are generated.
+
+    Unlike format_graphviz, edges are neither sorted nor de-duplicated and
+    nodes are not grouped by cycle, so memory use is bounded. A "strict"
+    graph is used so that graphviz merges any duplicate edges.
+
+    Args:
+        opts: Command options.
+        graph: Raw edges (see WorkflowConfig.iter_graph_raw).
+        max_seen_nodes:
+            Node labels are written once per node, but only up to this many
+            nodes are remembered.
+
+    """
+    yield 'strict digraph {'
+    yield '  graph [fontname="sans" fontsize="25"]'
+    yield '  node [fontname="sans"]'
+    if opts.transpose:
+        yield '  rankdir="LR"'
+    yield ''
+    seen = set()
+    for left, right, _, suicide, _ in graph:
+        if suicide and not opts.show_suicide:
+            continue
+        for node in (left, right):
+            if node and node not in seen:
+                if len(seen) >= max_seen_nodes:
+                    seen.clear()
+                seen.add(node)
+                tokens = Tokens(node, relative=True)
+                yield (
+                    rf'  "{node}" [label="{tokens["task"]}\n'
+                    rf'{tokens["cycle"]}"]'
+                )
+        if right:
+            yield f'  "{left}" -> "{right}"'
+    yield '}'
+
+
 def format_cylc_reference(
     opts,
     nodes: List[Node],
@@ -381,6 +437,24 @@ def graph_render(opts, workflow_id, start, stop, flow_file) -> int:
     return 0
 
 
+def graph_stream(
+    opts, workflow_id, start, stop, flow_file, write=print,
+) -> int:
+    """Write the workflow graph in graphviz-dot format as it is generated."""
+    config = get_config(workflow_id, opts, flow_file)
+    graph = config.iter_graph_raw(start, stop, opts.grouping)
+    if not opts.output:
+        for line in format_graphviz_stream(opts, graph):
+            write(line)
+        return 0
+    if not opts.output.endswith('.dot'):
+        raise InputError('--stream can only write the "dot" format.')
+    with open(opts.output, 'w+') as dot_file:
+        for line in format_graphviz_stream(opts, graph):
+            dot_file.write(f'{line}\n')
+    return 0
+
+
 def graph_reference(
     opts, workflow_id, start, stop, flow_file, write=print,
 ) -> int:
@@ -506,6 +580,14 @@ def get_option_parser() -> COP:
              'If not given, assume --output-file=-.',
         action='store_true', default=False, dest='reference')
 
+    parser.add_option(
+        '--stream',
+        help='Write the graph in Graphviz "dot" format to stdout (or to the'
+             ' "-o" file) as it is generated. Edges are not sorted and nodes'
+             ' are not grouped, but memory use does not grow with the length'
+             ' of the graph. Use for long cycle point ranges.',
+        action='store_true', default=False, dest='stream')
+
     parser.add_option(
         '--show-suicide',
         help='Show suicide triggers. Not shown by default.',
@@ -551,6 +633,13 @@ async def _main(
         raise InputError('Cannot combine --group and --namespaces.')
     if opts.cycles and opts.namespaces:
         raise InputError('Cannot combine --cycles and --namespaces.')
+    if opts.stream and (
+        opts.namespaces or opts.cycles or opts.reference or opts.diff
+    ):
+        raise InputError(
+            'Cannot combine --stream with --namespaces, --cycles,'
+            ' --reference or --diff.'
+        )
 
     workflow_id, _, flow_file = await parse_id_async(
         workflow_id,
@@ -564,5 +653,7 @@ async def _main(
     if opts.reference:
         return graph_reference(
             opts, workflow_id, start, stop, flow_file)
+    if opts.stream:
+        return graph_stream(opts, workflow_id, start, stop, flow_file)
 
     return graph_render(opts, workflow_id, start, stop, flow_file)
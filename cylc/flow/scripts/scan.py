@@ -438,18 +438,27 @@ def _construct_tree(flows, tree, formatter, opts, write):
         pointer[item] = ''
 
 
-def get_pipe(opts, formatter, scan_dir=None):
-    """Construct a pipe for listing flows."""
+def get_pipe(opts, formatter, scan_dir=None, cache=None):
+    """Construct a pipe for listing flows.
+
+    Args:
+        cache (cylc.flow.network.scan.ScanCache):
+            Re-use files and clients from previous scans.
+
+    """
     if scan_dir:
-        pipe = scan(scan_dir=scan_dir)
+        pipe = scan(scan_dir=scan_dir, cache=cache)
     elif opts.source:
         pipe = scan_multi(
-            Path(path).expanduser()
-            for path in glbl_cfg().get(['install', 'source dirs'])
+            (
+                Path(path).expanduser()
+                for path in glbl_cfg().get(['install', 'source dirs'])
+            ),
+            cache=cache,
         )
         opts.states = {'stopped'}
     else:
-        pipe = scan
+        pipe = scan(cache=cache)
 
     show_running = 'running' in opts.states
     show_paused = 'paused' in opts.states
@@ -469,7 +478,7 @@ def get_pipe(opts, formatter, scan_dir=None):
 
     # get contact file information
     if show_active:
-        pipe |= contact_info
+        pipe |= contact_info(cache=cache)
 
     graphql_fields = {}
     graphql_filters = set()
@@ -486,11 +495,13 @@ def get_pipe(opts, formatter, scan_dir=None):
 
     # add graphql queries / filters to the pipe
     if show_active and graphql_fields:
-        pipe |= graphql_query(graphql_fields, filters=graphql_filters)
+        pipe |= graphql_query(
+            graphql_fields, filters=graphql_filters, cache=cache
+        )
     elif opts.ping:
         # check the flow is running even if not required
         # by display format or filters
-        pipe |= graphql_query({'status': None})
+        pipe |= graphql_query({'status': None}, cache=cache)
 
     # yield results as they are processed
     pipe.preserve_order = False
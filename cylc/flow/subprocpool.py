@@ -15,8 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Manage queueing and pooling of subprocesses for the scheduler."""
 
-from collections import deque
+from collections import Counter, deque
 import json
+from math import ceil
 import os
 import select
 from signal import SIGKILL
@@ -26,7 +27,9 @@ from tempfile import SpooledTemporaryFile
 from threading import RLock
 from time import time
 from subprocess import DEVNULL, run  # nosec
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+)
 
 from cylc.flow import LOG, iter_entry_points
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
@@ -49,6 +52,16 @@ if TYPE_CHECKING:
 _XTRIG_MOD_CACHE: dict = {}
 _XTRIG_FUNC_CACHE: dict = {}
 
+# Priority classes for commands queued in the pool.
+PRIORITY_CONTROL = 'control'  # job kill and poll commands
+PRIORITY_SUBMIT = 'submit'  # job submission
+PRIORITY_REMOTE = 'remote'  # remote init, file install, remote host select
+PRIORITY_XTRIGGER = 'xtrigger'  # xtrigger functions
+PRIORITY_EVENT = 'event'  # event handlers, mail, job log retrieval
+
+# Command keys of the commands which run in the "remote" class.
+REMOTE_CMD_KEYS = {'remote-init', 'file-install', 'remote-host-select'}
+
 
 def _killpg(proc, signal):
     """Kill a process group."""
@@ -156,6 +169,160 @@ def run_function(func_name, json_args, json_kwargs, src_dir):
     sys.stdout.write(json.dumps(res))
 
 
+def get_priority_class(ctx: 'SubProcContext') -> str:
+    """Return the priority class of a command context.
+
+    Examples:
+        >>> from cylc.flow.subprocctx import SubProcContext
+        >>> get_priority_class(SubProcContext('jobs-kill', []))
+        'control'
+        >>> get_priority_class(SubProcContext('jobs-submit', []))
+        'submit'
+        >>> get_priority_class(SubProcContext('remote-init', []))
+        'remote'
+        >>> get_priority_class(SubFuncContext('x', 'wall_clock', [], {}))
+        'xtrigger'
+        >>> get_priority_class(SubProcContext(('handler', 'failed'), []))
+        'event'
+
+    """
+    if isinstance(ctx, SubFuncContext):
+        return PRIORITY_XTRIGGER
+    cmd_key = ctx.cmd_key
+    if not isinstance(cmd_key, str):
+        # event handlers, mail notifications and job log retrieval
+        return PRIORITY_EVENT
+    if cmd_key in {'jobs-kill', 'jobs-poll'}:
+        return PRIORITY_CONTROL
+    if cmd_key == SubProcPool.JOBS_SUBMIT:
+        return PRIORITY_SUBMIT
+    if cmd_key in REMOTE_CMD_KEYS:
+        return PRIORITY_REMOTE
+    return PRIORITY_EVENT
+
+
+class ProcPoolQueueStats:
+    """Queue wait time metrics for a priority class."""
+
+    __slots__ = ('dequeued', 'wait_total', 'wait_max')
+
+    def __init__(self):
+        self.dequeued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def add(self, wait: float) -> None:
+        """Record the queue wait time of a dequeued command."""
+        self.dequeued += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    @property
+    def wait_mean(self) -> float:
+        if not self.dequeued:
+            return 0.0
+        return self.wait_total / self.dequeued
+
+
+class ProcPoolQueue:
+    """Queue of commands waiting to run in the process pool.
+
+    Commands are queued FIFO within their priority class. Classes are
+    dequeued using weighted fair (stride) scheduling: each class carries a
+    virtual "pass" which advances by 1 / weight each time a command is taken
+    from it, and the non-empty class with the lowest pass goes next. Higher
+    weight classes (e.g. job kills and polls) therefore jump ahead of bulk
+    low weight classes (e.g. event handlers) without starving them. A class
+    which has reached its concurrency cap is skipped until one of its
+    commands exits, leaving room in the pool for the other classes.
+
+    Args:
+        classes:
+            Mapping of priority class name to (weight, cap) where cap is the
+            maximum fraction of the pool the class may occupy.
+        size:
+            The process pool size.
+
+    Examples:
+        >>> queue = ProcPoolQueue({'a': (2, 1.0), 'b': (1, 0.5)}, 4)
+        >>> for item in ('b1', 'b2', 'b3', 'a1', 'a2'):
+        ...     queue.put(item[0], [item])
+        >>> len(queue)
+        5
+        >>> [queue.get(Counter())[1][0] for _ in range(5)]
+        ['a1', 'a2', 'b1', 'b2', 'b3']
+
+        Class "b" may only use half of the pool:
+        >>> for item in ('b1', 'b2', 'b3'):
+        ...     queue.put('b', [item])
+        >>> queue.get(Counter({'b': 2})) is None
+        True
+
+    """
+
+    def __init__(
+        self, classes: Dict[str, Tuple[float, float]], size: int
+    ) -> None:
+        self.weights = {name: weight for name, (weight, _) in classes.items()}
+        self.caps = {
+            name: max(1, ceil(size * cap))
+            for name, (_, cap) in classes.items()
+        }
+        self.queues: Dict[str, deque] = {name: deque() for name in classes}
+        self.passes: Dict[str, float] = dict.fromkeys(classes, 0.0)
+        self.stats = {name: ProcPoolQueueStats() for name in classes}
+        # the pass of the most recently dequeued class
+        self.vtime = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def __bool__(self) -> bool:
+        return any(self.queues.values())
+
+    def put(self, pclass: str, item: list) -> None:
+        """Queue an item in a priority class."""
+        queue = self.queues[pclass]
+        if not queue:
+            # don't let a class bank credit while it is idle
+            self.passes[pclass] = max(
+                self.passes[pclass], self.vtime + 1 / self.weights[pclass]
+            )
+        queue.append((time(), item))
+
+    def get(self, running: Dict[str, int]) -> Optional[Tuple[str, list]]:
+        """Return the next (class, item) to run, or None.
+
+        Args:
+            running: The number of running commands in each class.
+
+        """
+        pclass = None
+        for name, queue in self.queues.items():
+            if (
+                queue
+                and running[name] < self.caps[name]
+                and (
+                    pclass is None
+                    or self.passes[name] < self.passes[pclass]
+                )
+            ):
+                pclass = name
+        if pclass is None:
+            return None
+        queued_time, item = self.queues[pclass].popleft()
+        self.stats[pclass].add(time() - queued_time)
+        self.vtime = self.passes[pclass]
+        self.passes[pclass] += 1 / self.weights[pclass]
+        return pclass, item
+
+    def drain(self) -> Iterator[list]:
+        """Remove and yield all queued items."""
+        for queue in self.queues.values():
+            while queue:
+                yield queue.popleft()[1]
+
+
 class SubProcPool:
     """Manage queueing and pooling of subprocesses.
 
@@ -180,12 +347,27 @@ class SubProcPool:
     only be written to the workflow log by the callback function when the
     command exits (and only if the callback function has the logic to do so).
 
+    Queued commands are grouped into priority classes (see
+    `get_priority_class`) which are dequeued in weighted fair order, so that
+    e.g. a flood of event handlers cannot hold up job kills, polls or
+    submissions.
+
     """
 
     ERR_WORKFLOW_STOPPING = 'workflow stopping, command not run'
     JOBS_SUBMIT = 'jobs-submit'
     POLLREAD = select.POLLIN | select.POLLPRI
     RET_CODE_WORKFLOW_STOPPING = 999
+    # Priority class: (weight, maximum fraction of the pool)
+    PRIORITY_CLASSES = {
+        PRIORITY_CONTROL: (8, 1.0),
+        PRIORITY_SUBMIT: (4, 1.0),
+        PRIORITY_REMOTE: (4, 1.0),
+        PRIORITY_XTRIGGER: (2, 0.5),
+        PRIORITY_EVENT: (1, 0.5),
+    }
+    # Interval (seconds) between logging queue stats (at DEBUG level)
+    QUEUE_STATS_LOG_INTERVAL = 300
 
     def __init__(self):
         self.size = glbl_cfg().get(['scheduler', 'process pool size'])
@@ -195,8 +377,9 @@ class SubProcPool:
         self.stopping = False  # No more job submit if True
         # .stopping may be set by an API command in a different thread
         self.stopping_lock = RLock()
-        self.queuings = deque()
+        self.queuings = ProcPoolQueue(self.PRIORITY_CLASSES, self.size)
         self.runnings = []
+        self.queue_stats_log_time = time() + self.QUEUE_STATS_LOG_INTERVAL
         try:
             self.pipepoller = select.poll()
         except AttributeError:  # select.poll not implemented for this OS
@@ -301,11 +484,18 @@ class SubProcPool:
         self.runnings[:] = runnings
         # Create more child processes, if items in queue and space in pool
         stopping = self._is_stopping()
+        running_counts = Counter(
+            get_priority_class(running[1]) for running in self.runnings
+        )
         while self.queuings and len(self.runnings) < self.size:
-            (
+            next_ = self.queuings.get(running_counts)
+            if next_ is None:
+                # remaining classes are at their concurrency caps
+                break
+            pclass, (
                 ctx, bad_hosts, callback, callback_args,
                 callback_255, callback_255_args
-            ) = self.queuings.popleft()
+            ) = next_
             if stopping and ctx.cmd_key == self.JOBS_SUBMIT:
                 ctx.err = self.ERR_WORKFLOW_STOPPING
                 ctx.ret_code = self.RET_CODE_WORKFLOW_STOPPING
@@ -317,10 +507,13 @@ class SubProcPool:
                 )
                 if proc is not None:
                     ctx.timeout = time() + self.proc_pool_timeout
+                    running_counts[pclass] += 1
                     self.runnings.append([
                         proc, ctx, bad_hosts, callback, callback_args,
                         callback_255, callback_255_args
                     ])
+        if time() >= self.queue_stats_log_time:
+            self.log_queue_stats()
 
     def put_command(
         self, ctx, bad_hosts=None, callback=None, callback_args=None,
@@ -348,13 +541,44 @@ class SubProcPool:
                 callback_255=callback_255, callback_255_args=callback_255_args
             )
         else:
-            self.queuings.append(
+            self.queuings.put(
+                get_priority_class(ctx),
                 [
                     ctx, bad_hosts, callback, callback_args,
                     callback_255, callback_255_args
                 ]
             )
 
+    def get_queue_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return queue length, running count and wait times per class."""
+        running_counts = Counter(
+            get_priority_class(running[1]) for running in self.runnings
+        )
+        return {
+            pclass: {
+                'queued': len(self.queuings.queues[pclass]),
+                'running': running_counts[pclass],
+                'dequeued': stats.dequeued,
+                'wait mean': stats.wait_mean,
+                'wait max': stats.wait_max,
+            }
+            for pclass, stats in self.queuings.stats.items()
+        }
+
+    def log_queue_stats(self) -> None:
+        """Log the queue stats of each priority class (at DEBUG level)."""
+        self.queue_stats_log_time = time() + self.QUEUE_STATS_LOG_INTERVAL
+        LOG.debug(
+            'Process pool queue stats:\n' + '\n'.join(
+                f'  {pclass}: queued={stats["queued"]}'
+                f' running={stats["running"]}'
+                f' dequeued={stats["dequeued"]}'
+                f' wait mean={stats["wait mean"]:.2f}s'
+                f' wait max={stats["wait max"]:.2f}s'
+                for pclass, stats in self.get_queue_stats().items()
+            )
+        )
+
     @classmethod
     def run_command(cls, ctx):
         """Execute command in ctx and capture its output and exit status.
@@ -378,8 +602,8 @@ class SubProcPool:
         """Drain queue, and kill and process remaining child processes."""
         self.close()
         # Drain queue
-        while self.queuings:
-            ctx = self.queuings.popleft()[0]
+        for item in self.queuings.drain():
+            ctx = item[0]
             ctx.err = self.ERR_WORKFLOW_STOPPING
             ctx.ret_code = self.RET_CODE_WORKFLOW_STOPPING
             self._run_command_exit(ctx)
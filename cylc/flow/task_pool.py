@@ -375,19 +375,19 @@ class TaskPool:
         else:
             # Recompute possible points.
             for sequence in self.config.sequences:
+                if not count_cycles:
+                    # PT0H allows only the base cycle point to run.
+                    sequence_points.update(
+                        sequence.get_points(base_point, base_point + limit)
+                    )
+                    continue
                 seq_point = sequence.get_first_point(base_point)
                 count = 1
                 while seq_point is not None:
-                    if count_cycles:
-                        # P0 allows only the base cycle point to run.
-                        if count > 1 + ilimit:
-                            # this point may be beyond the runahead limit
-                            break
-                    else:
-                        # PT0H allows only the base cycle point to run.
-                        if seq_point > base_point + limit:
-                            # this point can not be beyond the runahead limit
-                            break
+                    # P0 allows only the base cycle point to run.
+                    if count > 1 + ilimit:
+                        # this point may be beyond the runahead limit
+                        break
                     count += 1
                     sequence_points.add(seq_point)
                     seq_point = sequence.get_next_point(seq_point)
@@ -970,7 +970,11 @@ class TaskPool:
         if max_offset != orig and self.compute_runahead(force=True):
             self.release_runahead_tasks()
 
-    def reload_taskdefs(self, config: 'WorkflowConfig') -> None:
+    def reload_taskdefs(
+        self,
+        config: 'WorkflowConfig',
+        changed_tasks: Optional[Set[str]] = None,
+    ) -> None:
         """Reload the definitions of task proxies in the pool.
 
         Orphaned tasks (whose definitions were removed from the workflow):
@@ -979,6 +983,14 @@ class TaskPool:
           subsequent outputs
         Otherwise: replace task definitions but copy over existing outputs etc.
 
+        Args:
+            config:
+                The reloaded workflow config.
+            changed_tasks:
+                Names of tasks whose definitions were changed by the reload
+                (see WorkflowConfig.reuse_taskdefs). Proxies of other tasks
+                are left as they are. If None, all are replaced.
+
         """
         self.config = config
         self.stop_point = config.stop_point or config.final_point
@@ -1017,6 +1029,12 @@ class TaskPool:
                         f"[{itask}] will not spawn children "
                         "- task definition removed"
                     )
+            elif (
+                changed_tasks is not None
+                and itask.tdef.name not in changed_tasks
+            ):
+                # Task definition unchanged (and reused by the new config).
+                continue
             else:
                 new_task = TaskProxy(
                     self.tokens,
@@ -22,7 +22,6 @@ This module provides logic to:
 - Implement basic host select functionality.
 """
 
-from collections import deque
 from contextlib import suppress
 from pathlib import Path
 import os
@@ -30,13 +29,10 @@ from shlex import quote
 import re
 from subprocess import Popen, PIPE, DEVNULL
 import tarfile
-from time import sleep, time
 from typing import (
     Any,
-    Deque,
     Dict,
     List,
-    NamedTuple,
     Optional,
     Set,
     TYPE_CHECKING,
@@ -68,7 +64,17 @@ from cylc.flow.platforms import (
     get_localhost_install_target,
     log_platform_event,
 )
-from cylc.flow.remote import construct_rsync_over_ssh_cmd, construct_ssh_cmd
+from cylc.flow.remote import (
+    InstallManifestEntry,
+    RemoteOp,
+    RemoteOpResult,
+    RemoteOpStarter,
+    construct_rsync_over_ssh_cmd,
+    construct_ssh_cmd,
+    get_install_manifest,
+    get_install_manifest_changes,
+    run_remote_ops,
+)
 from cylc.flow.subprocctx import SubProcContext
 from cylc.flow.util import format_cmd
 from cylc.flow.workflow_files import (
@@ -94,12 +100,6 @@ REMOTE_INIT_255 = 'REMOTE INIT 255'
 REMOTE_FILE_INSTALL_255 = 'REMOTE FILE INSTALL 255'
 
 
-class RemoteTidyQueueTuple(NamedTuple):
-    platform: Dict[str, Any]
-    host: str
-    proc: 'Popen[str]'
-
-
 class TaskRemoteMgr:
     """Manage task remote initialisation, tidy, selection."""
 
@@ -117,6 +117,11 @@ class TaskRemoteMgr:
         self.is_reload = False
         self.is_restart = False
         self.db_mgr = db_mgr
+        # Install targets which file install has completed for in this run
+        self.file_installed_targets: Set[str] = set()
+        # The file install manifest of the current (or last) install round
+        self.install_manifest: Optional[
+            Dict[str, InstallManifestEntry]] = None
 
     def _subshell_eval(
         self, eval_str: str, command_pattern: re.Pattern
@@ -365,14 +370,48 @@ class TaskRemoteMgr:
             platforms_used, install_targets)
 
         # Issue all SSH commands in parallel
-        queue: Deque[RemoteTidyQueueTuple] = deque()
-        for install_target, platforms in install_targets_map.items():
-            if install_target == get_localhost_install_target():
-                continue
+        ops = {
+            install_target: self._remote_tidy_starter(
+                install_target, platforms)
+            for install_target, platforms in install_targets_map.items()
+            if install_target != get_localhost_install_target()
+        }
+        # Timeout any commands which haven't completed after 10 seconds
+        results = run_remote_ops(ops, total_timeout=10.0)
+        for install_target in ops:
+            result = results.get(install_target)
+            if result and (result.timed_out or result.ret_code):
+                LOG.warning(
+                    PlatformError(
+                        PlatformError.MSG_TIDY,
+                        result.platform['name'],
+                        cmd=cast('List[str]', result.proc.args),
+                        ret_code=result.ret_code,
+                        out=result.out,
+                        err=result.err,
+                    )
+                )
+
+    def _remote_tidy_starter(
+        self,
+        install_target: str,
+        platforms: List[Dict[str, Any]],
+    ) -> RemoteOpStarter:
+        """Return a function to start "cylc remote-tidy" for an install target.
+
+        Tries each platform in turn until a host can be found. If a command
+        fails with 255 (SSH failure) its host is marked bad and the command is
+        retried on another host.
+        """
+        def _start(prev: Optional[RemoteOpResult]) -> Optional[RemoteOp]:
+            if prev is not None:
+                # 255 error has to be handled here because remote tidy doesn't
+                # use SubProcPool.
+                self.bad_hosts.add(cast('str', prev.host))
             for platform in platforms:
                 try:
                     cmd, host = self.construct_remote_tidy_ssh_cmd(platform)
-                except NoHostsError as exc:
+                except (NoHostsError, PlatformLookupError) as exc:
                     LOG.warning(
                         PlatformError(
                             f'{PlatformError.MSG_TIDY}\n{exc}',
@@ -381,83 +420,21 @@ class TaskRemoteMgr:
                     )
                 else:
                     log_platform_event('remote tidy', platform, host)
-                    queue.append(
-                        RemoteTidyQueueTuple(
-                            platform,
-                            host,
-                            Popen(  # nosec
-                                cmd, stdout=PIPE, stderr=PIPE, stdin=DEVNULL,
-                                text=True
-                            )  # * command constructed by internal interface
-                        )
+                    return RemoteOp(
+                        Popen(  # nosec
+                            cmd, stdout=PIPE, stderr=PIPE, stdin=DEVNULL,
+                            text=True
+                        ),  # * command constructed by internal interface
+                        platform,
+                        host,
                     )
-                    break
-            else:
+            if prev is None:
                 LOG.error(
                     NoPlatformsError(
                         install_target, 'install target', 'remote tidy'))
-        # Wait for commands to complete for a max of 10 seconds
-        timeout = time() + 10.0
-        while queue and time() < timeout:
-            item = queue.popleft()
-            if item.proc.poll() is None:  # proc still running
-                queue.append(item)
-                continue
-            out, err = item.proc.communicate()
-            # 255 error has to be handled here because remote tidy doesn't
-            # use SubProcPool.
-            if item.proc.returncode == 255:
-                timeout = time() + 10.0
-                self.bad_hosts.add(item.host)
-                try:
-                    retry_cmd, retry_host = self.construct_remote_tidy_ssh_cmd(
-                        item.platform
-                    )
-                except (NoHostsError, PlatformLookupError) as exc:
-                    LOG.warning(
-                        PlatformError(
-                            f'{PlatformError.MSG_TIDY}\n{exc}',
-                            item.platform['name']
-                        )
-                    )
-                else:
-                    queue.append(
-                        item._replace(
-                            host=retry_host,
-                            proc=Popen(  # nosec
-                                retry_cmd, stdout=PIPE, stderr=PIPE,
-                                stdin=DEVNULL, text=True
-                            )  # * command constructed by internal interface
-                        )
-                    )
-            elif item.proc.returncode:
-                LOG.warning(
-                    PlatformError(
-                        PlatformError.MSG_TIDY,
-                        item.platform['name'],
-                        cmd=cast('List[str]', item.proc.args),
-                        ret_code=item.proc.returncode,
-                        out=out,
-                        err=err
-                    )
-                )
-            sleep(0.1)
-        # Terminate any remaining commands
-        for item in queue:
-            with suppress(OSError):
-                item.proc.terminate()
-            out, err = item.proc.communicate()
-            if item.proc.wait():
-                LOG.warning(
-                    PlatformError(
-                        PlatformError.MSG_TIDY,
-                        item.platform['name'],
-                        cmd=cast('List[str]', item.proc.args),
-                        ret_code=item.proc.returncode,
-                        out=out,
-                        err=err,
-                    )
-                )
+            return None
+
+        return _start
 
     def _subshell_eval_callback(self, proc_ctx, cmd_str):
         """Callback when subshell eval command exits"""
@@ -546,24 +523,68 @@ class TaskRemoteMgr:
                 bin/
                 etc/
                 lib/
+
+        A manifest of the installed files is recorded for each install target
+        in the workflow database. The first installation to a target in each
+        scheduler run installs everything as the state of the remote is
+        unknown (e.g. the remote run directory may have been removed). After
+        that, if nothing has changed since the last successful installation
+        the installation is skipped, if files have only been added or changed
+        then only those files are sent.
+
+        The manifest is shared by targets installed at the same time, file
+        checksums are reused while file sizes and modification times are
+        unchanged.
         """
         install_target = platform['install target']
+        new_round = not any(
+            status == REMOTE_FILE_INSTALL_IN_PROGRESS
+            for target, status in self.remote_init_map.items()
+            if target != install_target
+        )
         self.remote_init_map[install_target] = REMOTE_FILE_INSTALL_IN_PROGRESS
         src_path = get_workflow_run_dir(self.workflow)
         dst_path = get_remote_workflow_run_dir(self.workflow)
-        install_target = platform['install target']
+        with self.db_mgr.get_pri_dao() as pri_dao:
+            old_manifest = {
+                path: InstallManifestEntry(*entry)
+                for path, entry in pri_dao.select_install_manifest(
+                    install_target
+                ).items()
+            }
+        if new_round or self.install_manifest is None:
+            self.install_manifest = get_install_manifest(
+                src_path,
+                self.rsync_includes,
+                self.install_manifest or old_manifest,
+            )
+        manifest = self.install_manifest
+        changes = None
+        if install_target in self.file_installed_targets:
+            changes = get_install_manifest_changes(old_manifest, manifest)
+        if changes == []:
+            log_platform_event(
+                'remote file install complete (no changes)', platform)
+            self.remote_init_map[install_target] = REMOTE_FILE_INSTALL_DONE
+            self.ready = True
+            return
         try:
             cmd, host = construct_rsync_over_ssh_cmd(
                 src_path,
                 dst_path,
                 platform,
                 self.rsync_includes,
-                bad_hosts=self.bad_hosts
+                bad_hosts=self.bad_hosts,
+                files_from_stdin=changes is not None,
             )
             ctx = SubProcContext(
                 'file-install',
                 cmd,
-                host
+                host,
+                stdin_str=(
+                    '\n'.join(changes) + '\n' if changes is not None
+                    else None
+                ),
             )
         except NoHostsError as exc:
             LOG.error(
@@ -582,11 +603,13 @@ class TaskRemoteMgr:
                 ctx,
                 bad_hosts=self.bad_hosts,
                 callback=self._file_install_callback,
-                callback_args=[platform, install_target],
+                callback_args=[platform, install_target, manifest],
                 callback_255=self._file_install_callback_255,
             )
 
-    def _file_install_callback_255(self, ctx, platform, install_target):
+    def _file_install_callback_255(
+        self, ctx, platform, install_target, manifest
+    ):
         """Callback when file installation exits.
 
         Sets remote_init_map to REMOTE_FILE_INSTALL_255.
@@ -594,11 +617,15 @@ class TaskRemoteMgr:
         self.remote_init_map[install_target] = REMOTE_FILE_INSTALL_255
         self.ready = True
 
-    def _file_install_callback(self, ctx, platform, install_target):
+    def _file_install_callback(
+        self, ctx, platform, install_target, manifest
+    ):
         """Callback when file installation exits.
 
         Sets remote_init_map to REMOTE_FILE_INSTALL_DONE on success and to
         REMOTE_FILE_INSTALL_FAILED on error.
+
+        On success, record the installed file manifest.
          """
         install_log_dir = get_workflow_file_install_log_dir(
             self.workflow)
@@ -624,6 +651,8 @@ class TaskRemoteMgr:
         if ctx.ret_code == 0:
             # Both file installation and remote init success
             log_platform_event('remote file install complete', platform)
+            self.db_mgr.put_install_manifest(install_target, manifest)
+            self.file_installed_targets.add(install_target)
             self.remote_init_map[install_target] = REMOTE_FILE_INSTALL_DONE
             self.ready = True
             return
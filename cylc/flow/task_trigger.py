@@ -37,7 +37,8 @@ class TaskTrigger:
 
     __slots__ = ['task_name', 'cycle_point_offset', 'output',
                  'offset_is_irregular', 'offset_is_absolute',
-                 'offset_is_from_icp', 'initial_point']
+                 'offset_is_from_icp', 'initial_point',
+                 '_fixed_point', '_child_offset']
 
     def __init__(self, task_name, cycle_point_offset, output,
                  offset_is_irregular=False, offset_is_absolute=False,
@@ -57,6 +58,34 @@ class TaskTrigger:
                 self.cycle_point_offset.startswith(c)
                 for c in ['P', '+', '-', 'T'])):
             self.offset_is_absolute = False
+        # Point-independent values, computed on first use (the cycling mode
+        # is not necessarily known on construction).
+        self._fixed_point = None
+        self._child_offset = None
+
+    def _get_fixed_point(self):
+        """Return the point of an absolute or initial point relative offset.
+        """
+        if self._fixed_point is None:
+            if self.offset_is_absolute:
+                self._fixed_point = get_point(
+                    self.cycle_point_offset).standardise()
+            else:
+                self._fixed_point = get_point_relative(
+                    self.cycle_point_offset, self.initial_point)
+        return self._fixed_point
+
+    def _get_child_offset(self):
+        """Return the (reversed) offset from a parent point to its child."""
+        if self._child_offset is None:
+            if self.offset_is_irregular:
+                # Change offset sign to find children
+                #   e.g. -P1D+PT18H to +P1D-PT18H
+                self._child_offset = self.cycle_point_offset.translate(
+                    self.cycle_point_offset.maketrans('-+', '+-'))
+            else:
+                self._child_offset = get_interval(self.cycle_point_offset)
+        return self._child_offset
 
     def get_parent_point(self, from_point):
         """Return the specific parent point of this trigger.
@@ -70,11 +99,9 @@ class TaskTrigger:
         """
         if self.cycle_point_offset is None:
             point = from_point
-        elif self.offset_is_absolute:
-            point = get_point(self.cycle_point_offset).standardise()
+        elif self.offset_is_absolute or self.offset_is_from_icp:
+            point = self._get_fixed_point()
         else:
-            if self.offset_is_from_icp:
-                from_point = self.initial_point
             # works with offset_is_irregular or not:
             point = get_point_relative(self.cycle_point_offset, from_point)
         return point
@@ -98,13 +125,9 @@ class TaskTrigger:
             # foo.2 should spawn bar.1; then we auto-spawn bar.2,3,...
             point = seq.get_start_point()
         elif self.offset_is_irregular:
-            # Change offset sign to find children
-            #   e.g. -P1D+PT18H to +P1D-PT18H
-            point = get_point_relative(
-                self.cycle_point_offset.translate(
-                    self.cycle_point_offset.maketrans('-+', '+-')), from_point)
+            point = get_point_relative(self._get_child_offset(), from_point)
         else:
-            point = from_point - get_interval(self.cycle_point_offset)
+            point = from_point - self._get_child_offset()
         return point
 
     def get_point(self, point):
@@ -117,11 +140,8 @@ class TaskTrigger:
             cylc.flow.cycling.PointBase: cycle point of the dependency.
 
         """
-        if self.offset_is_absolute:
-            point = get_point(self.cycle_point_offset).standardise()
-        elif self.offset_is_from_icp:
-            point = get_point_relative(
-                self.cycle_point_offset, self.initial_point)
+        if self.offset_is_absolute or self.offset_is_from_icp:
+            point = self._get_fixed_point()
         elif self.cycle_point_offset:
             point = get_point_relative(self.cycle_point_offset, point)
         return point
@@ -17,6 +17,7 @@
 """Task definition."""
 
 from collections import deque
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 import cylc.flow.flags
@@ -33,27 +34,55 @@ if TYPE_CHECKING:
     from cylc.flow.cycling import PointBase
 
 
+def _get_graph_children_table(tdef):
+    """Return the point-independent graph children of this task.
+
+    [(sequence, output, child-name, trigger, is-absolute), ...]
+    """
+    if tdef.graph_children_table is None:
+        tdef.graph_children_table = [
+            (
+                seq,
+                output,
+                name,
+                trigger,
+                trigger.offset_is_absolute or trigger.offset_is_from_icp,
+            )
+            for seq, dout in tdef.graph_children.items()
+            for output, downs in dout.items()
+            for name, trigger in downs
+        ]
+    return tdef.graph_children_table
+
+
+def _cache_result(cache, point, result):
+    """Add a result to a per-point cache, discarding the oldest if full."""
+    if len(cache) >= TaskDef.MAX_LEN_GRAPH_CACHE:
+        del cache[next(iter(cache))]
+    cache[point] = result
+
+
 def generate_graph_children(tdef, point):
-    """Determine graph children of this task at point."""
+    """Determine graph children of this task at point.
+
+    Results are cached per point so must not be modified.
+    """
+    with suppress(KeyError):
+        return tdef.graph_children_cache[point]
     graph_children = {}
     for seq, dout in tdef.graph_children.items():
-        for output, downs in dout.items():
-            if output not in graph_children:
-                graph_children[output] = []
-            for name, trigger in downs:
-                child_point = trigger.get_child_point(point, seq)
-                is_abs = (
-                    trigger.offset_is_absolute or
-                    trigger.offset_is_from_icp
-                )
-                if is_abs and trigger.get_parent_point(point) != point:
-                    # If 'foo[^] => bar' only spawn off of '^'.
-                    continue
-                if seq.is_valid(child_point):
-                    # E.g.: foo should trigger only on T06:
-                    #   PT6H = "waz"
-                    #   T06 = "waz[-PT6H] => foo"
-                    graph_children[output].append((name, child_point, is_abs))
+        for output in dout:
+            graph_children[output] = []
+    for seq, output, name, trigger, is_abs in _get_graph_children_table(tdef):
+        child_point = trigger.get_child_point(point, seq)
+        if is_abs and trigger.get_parent_point(point) != point:
+            # If 'foo[^] => bar' only spawn off of '^'.
+            continue
+        if seq.is_valid(child_point):
+            # E.g.: foo should trigger only on T06:
+            #   PT6H = "waz"
+            #   T06 = "waz[-PT6H] => foo"
+            graph_children[output].append((name, child_point, is_abs))
 
     if tdef.sequential:
         # Add next-instance child.
@@ -69,6 +98,7 @@ def generate_graph_children(tdef, point):
             graph_children[TASK_OUTPUT_SUCCEEDED].append(
                 (tdef.name, min(nexts), False))
 
+    _cache_result(tdef.graph_children_cache, point, graph_children)
     return graph_children
 
 
@@ -76,7 +106,11 @@ def generate_graph_parents(tdef, point, taskdefs):
     """Determine concrete graph parents of task tdef at point.
 
     Infer parents be reversing upstream triggers that lead to point/task.
+
+    Results are cached per point so must not be modified.
     """
+    with suppress(KeyError):
+        return tdef.graph_parents_cache[point]
     graph_parents = {}
     for seq, triggers in tdef.graph_parents.items():
         if not seq.is_valid(point):
@@ -121,6 +155,7 @@ def generate_graph_parents(tdef, point, taskdefs):
                 graph_parents[seq] = []
             graph_parents[seq].append((tdef.name, min(prevs), False))
 
+    _cache_result(tdef.graph_parents_cache, point, graph_parents)
     return graph_parents
 
 
@@ -135,10 +170,14 @@ class TaskDef:
         "workflow_polling_cfg", "expiration_offset",
         "namespace_hierarchy", "dependencies", "outputs", "param_var",
         "graph_children", "graph_parents", "has_abs_triggers",
-        "external_triggers", "xtrig_labels", "name", "elapsed_times"]
+        "external_triggers", "xtrig_labels", "name", "elapsed_times",
+        "graph_children_table", "graph_children_cache",
+        "graph_parents_cache"]
 
     # Store the elapsed times for a maximum of 10 cycles
     MAX_LEN_ELAPSED_TIMES = 10
+    # Cache graph children/parents for a maximum of 16 cycles
+    MAX_LEN_GRAPH_CACHE = 16
 
     def __init__(self, name, rtcfg, run_mode, start_point, initial_point):
         if not TaskID.is_valid_name(name):
@@ -163,6 +202,10 @@ class TaskDef:
         self.outputs = {}  # {output: (message, is_required)}
         self.graph_children = {}
         self.graph_parents = {}
+        # Caches for generate_graph_children/parents, {point: result}.
+        self.graph_children_table = None
+        self.graph_children_cache = {}
+        self.graph_parents_cache = {}
         self.param_var = {}
         self.external_triggers = []
         self.xtrig_labels = {}  # {sequence: [labels]}
@@ -224,6 +267,7 @@ class TaskDef:
         self.graph_children.setdefault(
             sequence, {}).setdefault(
                 trigger.output, []).append((taskname, trigger))
+        self.clear_graph_caches()
 
     def add_graph_parent(self, trigger, parent, sequence):
         """Record task instances that I depend on.
@@ -234,6 +278,59 @@ class TaskDef:
         if sequence not in self.graph_parents:
             self.graph_parents[sequence] = set()
         self.graph_parents[sequence].add((parent, trigger))
+        self.clear_graph_caches()
+
+    def clear_graph_caches(self):
+        """Clear cached graph children/parents (after a graph change)."""
+        self.graph_children_table = None
+        self.graph_children_cache.clear()
+        self.graph_parents_cache.clear()
+
+    def get_signature(self):
+        """Return a comparable summary of this task definition.
+
+        Task definitions with equal signatures are interchangeable (run time
+        state such as elapsed times is not included). Used to find the
+        tasks changed by a reload.
+        """
+        return (
+            self.run_mode,
+            self.rtconfig,
+            str(self.start_point),
+            str(self.initial_point),
+            self.sequences,
+            self.used_in_offset_trigger,
+            self.sequential,
+            self.workflow_polling_cfg,
+            str(self.expiration_offset),
+            self.namespace_hierarchy,
+            [
+                (sequence, sorted(str(dep) for dep in dependencies))
+                for sequence, dependencies in self.dependencies.items()
+            ],
+            self.outputs,
+            self.param_var,
+            [
+                (
+                    sequence,
+                    {
+                        output: sorted(str(child) for child in children)
+                        for output, children in outputs.items()
+                    }
+                )
+                for sequence, outputs in self.graph_children.items()
+            ],
+            [
+                (sequence, sorted(str(parent) for parent in parents))
+                for sequence, parents in self.graph_parents.items()
+            ],
+            self.has_abs_triggers,
+            self.external_triggers,
+            [
+                (sequence, sorted(labels))
+                for sequence, labels in self.xtrig_labels.items()
+            ],
+        )
 
     def add_dependency(self, dependency, sequence):
         """Add a dependency to a named sequence.
@@ -268,6 +365,7 @@ class TaskDef:
         """Add a sequence."""
         if sequence not in self.sequences:
             self.sequences.append(sequence)
+            self.clear_graph_caches()
 
     def describe(self):
         """Return title and description of the current task."""
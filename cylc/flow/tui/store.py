@@ -0,0 +1,325 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A local mirror of a workflow's data store for Tui.
+
+The mirror is loaded from the scheduler once ("pb_entire_workflow") then kept
+up to date by the deltas the scheduler publishes, so Tui does not need to
+poll the scheduler for the full workflow on every update.
+"""
+
+from contextlib import suppress
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+import zmq
+
+from cylc.flow.data_messages_pb2 import (  # type: ignore
+    PbEntireWorkflow,
+)
+from cylc.flow.data_store_mgr import (
+    FAMILY_PROXIES,
+    JOBS,
+    TASK_PROXIES,
+    TASKS,
+    WORKFLOW,
+    apply_delta,
+    generate_checksum,
+)
+from cylc.flow.network import get_location
+from cylc.flow.network.subscriber import (
+    WorkflowSubscriber,
+    process_delta_msg,
+)
+
+if TYPE_CHECKING:
+    from cylc.flow.network.client import WorkflowRuntimeClientBase
+
+
+# the data store topics Tui uses (it doesn't display edges or families)
+TOPICS = (WORKFLOW, TASKS, TASK_PROXIES, FAMILY_PROXIES, JOBS)
+
+# the topic published by the scheduler when it shuts down
+SHUTDOWN = 'shutdown'
+
+
+class WorkflowStore:
+    """A local mirror of a workflow's data store.
+
+    Provides the workflow data in the form returned by the Tui GraphQL query
+    (see cylc.flow.tui.data.QUERY). Data for each task and family is only
+    recomputed when a delta changes it.
+
+    Args:
+        client:
+            Client connected to the workflow.
+        subscriber:
+            Subscriber connected to the workflow's publisher, if not
+            provided one will be created.
+
+    """
+
+    def __init__(
+        self,
+        client: 'WorkflowRuntimeClientBase',
+        subscriber: Optional[WorkflowSubscriber] = None,
+    ):
+        self.client = client
+        if subscriber is None:
+            # NOTE: subscribe before loading the workflow so that we don't
+            # miss any deltas published in the meantime
+            host, _, pub_port = get_location(client.workflow)
+            subscriber = WorkflowSubscriber(
+                client.workflow,
+                host=host,
+                port=pub_port,
+                topics=[
+                    topic.encode('utf-8')
+                    for topic in (*TOPICS, SHUTDOWN)
+                ],
+            )
+        self.subscriber = subscriber
+        self.data: Dict = {}
+        # the time of the last delta applied for each topic
+        self.delta_times: Dict[str, float] = {}
+        # incremented whenever the data changes
+        self.version = 0
+        # set when the workflow shuts down
+        self.stopped = False
+        # element data in GraphQL form by ID
+        self._task_proxies: Dict[str, dict] = {}
+        self._family_proxies: Dict[str, dict] = {}
+        # the last result of get_data
+        self._data_cache = (None, None)
+
+    async def sync(self) -> None:
+        """Load the entire workflow from the scheduler."""
+        pb_data = PbEntireWorkflow()
+        pb_data.ParseFromString(
+            await self.client.async_request('pb_entire_workflow')
+        )
+        self.data = {
+            WORKFLOW: pb_data.workflow,
+            TASKS: {task.id: task for task in pb_data.tasks},
+            TASK_PROXIES: {
+                proxy.id: proxy for proxy in pb_data.task_proxies
+            },
+            FAMILY_PROXIES: {
+                proxy.id: proxy for proxy in pb_data.family_proxies
+            },
+            JOBS: {job.id: job for job in pb_data.jobs},
+        }
+        self.delta_times = {
+            topic: pb_data.workflow.last_updated for topic in TOPICS
+        }
+        self._task_proxies.clear()
+        self._family_proxies.clear()
+        self.version += 1
+
+    async def update(self) -> None:
+        """Apply any deltas received since the last update.
+
+        If the deltas don't reconcile with the local data (e.g. if messages
+        have been dropped), the workflow is re-loaded.
+        """
+        resync = False
+        while True:
+            try:
+                btopic, msg = await self.subscriber.socket.recv_multipart(
+                    flags=zmq.NOBLOCK
+                )
+            except zmq.ZMQError:
+                # no more messages
+                break
+            topic, delta = process_delta_msg(btopic, msg, None)
+            if topic == SHUTDOWN:
+                self.stopped = True
+                return
+            if topic in self.delta_times and not self._apply(topic, delta):
+                resync = True
+        if resync:
+            await self.sync()
+
+    def _apply(self, topic, delta) -> bool:
+        """Apply a delta to the local data.
+
+        Returns False if the local data is out of sync with the scheduler.
+        """
+        if delta.reloaded:
+            # the workflow has been reloaded, this delta contains all
+            # elements of this type
+            if topic == WORKFLOW:
+                self.data[WORKFLOW].Clear()
+            else:
+                self.data[topic].clear()
+            self._task_proxies.clear()
+            self._family_proxies.clear()
+            self.delta_times[topic] = 0.0
+        elif delta.time < self.delta_times[topic]:
+            # this delta is already included in the local data
+            return True
+        apply_delta(topic, delta, self.data)
+        self.delta_times[topic] = delta.time
+        self.version += 1
+        if topic == WORKFLOW:
+            return True
+        self._invalidate(
+            topic,
+            [
+                *(element.id for element in delta.added),
+                *(element.id for element in delta.updated),
+            ],
+            delta.pruned,
+        )
+        return (
+            not delta.HasField('checksum')
+            or delta.checksum == generate_checksum(
+                element.stamp for element in self.data[topic].values()
+            )
+        )
+
+    def _invalidate(
+        self,
+        topic: str,
+        changed: Iterable[str],
+        pruned: Iterable[str],
+    ) -> None:
+        """Discard the GraphQL form of elements affected by a delta."""
+        if topic == TASK_PROXIES:
+            for id_ in (*changed, *pruned):
+                self._task_proxies.pop(id_, None)
+        elif topic == JOBS:
+            # job IDs are the task proxy ID plus the submit number
+            for id_ in (*changed, *pruned):
+                self._task_proxies.pop(id_.rsplit('/', 1)[0], None)
+        elif topic == TASKS:
+            for id_ in changed:
+                with suppress(KeyError):
+                    for proxy_id in self.data[TASKS][id_].proxies:
+                        self._task_proxies.pop(proxy_id, None)
+        elif topic == FAMILY_PROXIES:
+            for id_ in changed:
+                with suppress(KeyError):
+                    family = self.data[FAMILY_PROXIES][id_]
+                    # the first parent of child elements may have just arrived
+                    for child_id in family.child_tasks:
+                        self._task_proxies.pop(child_id, None)
+                    for child_id in family.child_families:
+                        self._family_proxies.pop(child_id, None)
+            for id_ in (*changed, *pruned):
+                self._family_proxies.pop(id_, None)
+
+    def get_data(self, task_states: Iterable[str]) -> dict:
+        """Return the workflow data in the form of the Tui GraphQL query.
+
+        Args:
+            task_states:
+                Only return tasks and families in these states.
+
+        """
+        task_states = frozenset(task_states)
+        key = (self.version, task_states)
+        if self._data_cache[0] == key:
+            return self._data_cache[1]
+
+        workflow = self.data[WORKFLOW]
+        task_proxies = []
+        for id_, proxy in self.data[TASK_PROXIES].items():
+            if proxy.state not in task_states:
+                continue
+            if id_ not in self._task_proxies:
+                self._task_proxies[id_] = self._get_task_proxy(proxy)
+            task_proxies.append(self._task_proxies[id_])
+        family_proxies = []
+        cycle_points = []
+        for id_, proxy in self.data[FAMILY_PROXIES].items():
+            if proxy.state not in task_states:
+                continue
+            if id_ not in self._family_proxies:
+                self._family_proxies[id_] = self._get_family_proxy(proxy)
+            if proxy.name == 'root':
+                cycle_points.append(self._family_proxies[id_])
+            else:
+                family_proxies.append(self._family_proxies[id_])
+
+        ret = {
+            'id': workflow.id,
+            'name': workflow.name,
+            'port': workflow.port,
+            'status': workflow.status,
+            'stateTotals': dict(workflow.state_totals),
+            'taskProxies': task_proxies,
+            'familyProxies': family_proxies,
+            'cyclePoints': cycle_points,
+        }
+        self._data_cache = (key, ret)
+        return ret
+
+    def _get_first_parent(self, proxy) -> Optional[dict]:
+        family = self.data[FAMILY_PROXIES].get(proxy.first_parent)
+        if family is None:
+            return None
+        return {'id': family.id, 'name': family.name}
+
+    def _get_task_proxy(self, proxy) -> dict:
+        jobs = [
+            self.data[JOBS][job_id]
+            for job_id in dict.fromkeys(proxy.jobs)
+            if job_id in self.data[JOBS]
+        ]
+        jobs.sort(key=lambda job: job.submit_num, reverse=True)
+        task = self.data[TASKS].get(proxy.task)
+        return {
+            'id': proxy.id,
+            'name': proxy.name,
+            'cyclePoint': proxy.cycle_point,
+            'state': proxy.state,
+            'isHeld': proxy.is_held,
+            'isQueued': proxy.is_queued,
+            'isRunahead': proxy.is_runahead,
+            'firstParent': self._get_first_parent(proxy),
+            'jobs': [
+                {
+                    'id': job.id,
+                    'submitNum': job.submit_num,
+                    'state': job.state,
+                    'platform': job.platform,
+                    'jobRunnerName': job.job_runner_name,
+                    'jobId': job.job_id,
+                    'startedTime': job.started_time,
+                    'finishedTime': job.finished_time,
+                }
+                for job in jobs
+            ],
+            'task': {
+                'meanElapsedTime': task.mean_elapsed_time if task else None,
+            },
+        }
+
+    def _get_family_proxy(self, proxy) -> dict:
+        return {
+            'id': proxy.id,
+            'name': proxy.name,
+            'cyclePoint': proxy.cycle_point,
+            'state': proxy.state,
+            'isHeld': proxy.is_held,
+            'isQueued': proxy.is_queued,
+            'isRunahead': proxy.is_runahead,
+            'firstParent': self._get_first_parent(proxy),
+        }
+
+    def close(self) -> None:
+        """Disconnect from the workflow's publisher."""
+        self.subscriber.stop(stop_loop=False)
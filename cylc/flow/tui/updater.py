@@ -23,7 +23,6 @@ from asyncio import (
     gather,
 )
 from contextlib import suppress
-from copy import deepcopy
 from getpass import getuser
 from multiprocessing import Queue
 from time import time
@@ -37,8 +36,13 @@ from cylc.flow.exceptions import (
     WorkflowStopped,
 )
 from cylc.flow.id import Tokens
-from cylc.flow.network.client_factory import get_client
+from cylc.flow.network.client_factory import (
+    CommsMeth,
+    get_client,
+    get_comms_method,
+)
 from cylc.flow.network.scan import (
+    ScanCache,
     filter_name,
     graphql_query,
     is_active,
@@ -50,8 +54,10 @@ from cylc.flow.task_state import (
 from cylc.flow.tui.data import (
     QUERY
 )
+from cylc.flow.tui.store import WorkflowStore
 from cylc.flow.tui.util import (
-    compute_tree,
+    add_node,
+    compute_workflow_tree,
     suppress_logging,
 )
 from cylc.flow.workflow_status import (
@@ -89,7 +95,9 @@ class Updater():
     """The bit of Tui which provides the data.
 
     It lists workflows using the "scan" interface, and provides detail using
-    the "GraphQL" interface.
+    a local mirror of each workflow's data store which is kept up to date
+    by the deltas the scheduler publishes (or using the "GraphQL" interface
+    if the ZMQ publisher is not available).
 
     """
 
@@ -105,11 +113,17 @@ class Updater():
     def __init__(self, client_timeout=3):
         # Cylc comms clients for each workflow we're connected to
         self._clients = {}
+        # local data stores for each workflow we're connected to
+        self._stores = {}
+        # the tree for each workflow and the data it was computed from
+        self._trees = {}
 
         # iterate over this to get a list of workflows
         self._scan_pipe = None
         # the new pipe if the workflow filter options are changed
         self.__scan_pipe = None
+        # directory listings, contact files and clients reused between scans
+        self._scan_cache = ScanCache()
 
         # task/workflow filters
         self.filters = None  # note set on self.run()
@@ -155,20 +169,40 @@ class Updater():
         """
         with suppress_logging():
             self._update_filters(filters)
-            while True:
-                ret = await self._update()
-                if ret == self.SIGNAL_TERMINATE:
-                    break
-                self.update_queue.put(ret)
+            try:
+                while True:
+                    ret = await self._update()
+                    if ret == self.SIGNAL_TERMINATE:
+                        break
+                    self.update_queue.put(ret)
+            finally:
+                self._close()
+
+    def _close(self):
+        """Close all workflow connections."""
+        for w_id in {*self._clients, *self._stores}:
+            self._disconnect(w_id)
+        self._scan_cache.close()
 
     def _subscribe(self, w_id):
         if w_id not in self._clients:
             self._clients[w_id] = None
 
     def _unsubscribe(self, w_id):
+        self._disconnect(w_id)
         if w_id in self._clients:
             self._clients.pop(w_id)
 
+    def _disconnect(self, w_id):
+        """Close the client and local data store for a workflow."""
+        client = self._clients.get(w_id)
+        if client:
+            client.stop(stop_loop=False)
+            self._clients[w_id] = None
+        store = self._stores.pop(w_id, None)
+        if store:
+            store.close()
+
     def _update_filters(self, filters):
         if (
             not self.filters
@@ -177,11 +211,11 @@ class Updater():
             # update the scan pipe
             self.__scan_pipe = (
                 # scan all workflows
-                scan
+                scan(cache=self._scan_cache)
                 | filter_name(filters['workflows']['id'])
                 # if the workflow is active, retrieve its status
                 | is_active(True, filter_stop=False)
-                | graphql_query({'status': None})
+                | graphql_query({'status': None}, cache=self._scan_cache)
             )
 
         self.filters = filters
@@ -214,7 +248,9 @@ class Updater():
 
     async def _run_update(self, data):
         # copy the scanned data so it can be reused for future updates
-        data = deepcopy(data)
+        data = {
+            'workflows': [dict(workflow) for workflow in data['workflows']]
+        }
 
         # connect to schedulers if needed
         self._connect(data)
@@ -230,7 +266,27 @@ class Updater():
             )
         )
 
-        return compute_tree(data)
+        return self._compute_tree(data)
+
+    def _compute_tree(self, data):
+        """Compute the Tui tree.
+
+        The tree for each workflow is only recomputed if its data has
+        changed.
+        """
+        root_node = add_node('root', 'root', {}, data={})
+        trees = {}
+        for flow in data['workflows']:
+            # workflows provided by a local store are unchanged if the
+            # version is unchanged
+            version = flow.get('_tui_version')
+            old_version, flow_node = self._trees.get(flow['id'], (None, None))
+            if version is None or version != old_version:
+                flow_node = compute_workflow_tree(flow)
+            trees[flow['id']] = (version, flow_node)
+            root_node['children'].append(flow_node)
+        self._trees = trees
+        return root_node
 
     async def _update_workflow(self, w_id, client, data):
         if not client:
@@ -238,25 +294,43 @@ class Updater():
             # e.g. workflow is shut down
             return
 
+        # list of task states we want to see
+        task_states = [
+            state
+            for state, is_on in self.filters['tasks'].items()
+            if is_on
+        ]
         try:
-            # fetch the data from the workflow
-            workflow_update = await client.async_request(
-                'graphql',
-                {
-                    'request_string': QUERY,
-                    'variables': {
-                        # list of task states we want to see
-                        'taskStates': [
-                            state
-                            for state, is_on in self.filters['tasks'].items()
-                            if is_on
-                        ]
-                    }
+            if get_comms_method() == CommsMeth.ZMQ:
+                # fetch the data from the workflow's local store
+                store = self._stores.get(w_id)
+                if store is None:
+                    store = WorkflowStore(client)
+                    self._stores[w_id] = store
+                    await store.sync()
+                else:
+                    await store.update()
+                if store.stopped:
+                    raise WorkflowStopped(w_id)
+                workflow_data = {
+                    **store.get_data(task_states),
+                    '_tui_version': (store.version, tuple(task_states)),
                 }
-            )
+            else:
+                # fetch the data from the workflow
+                workflow_update = await client.async_request(
+                    'graphql',
+                    {
+                        'request_string': QUERY,
+                        'variables': {
+                            'taskStates': task_states,
+                        }
+                    }
+                )
+                workflow_data = workflow_update['workflows'][0]
         except WorkflowStopped:
             # remove the client on any error, we'll reconnect next time
-            self._clients[w_id] = None
+            self._disconnect(w_id)
             for workflow in data['workflows']:
                 if workflow['id'] == w_id:
                     break
@@ -272,7 +346,7 @@ class Updater():
         except (CylcError, ZMQError) as exc:
             # something went wrong :(
             # remove the client on any error, we'll reconnect next time
-            self._clients[w_id] = None
+            self._disconnect(w_id)
             for workflow in data['workflows']:
                 if workflow['id'] == w_id:
                     workflow['_tui_data'] = (
@@ -282,7 +356,6 @@ class Updater():
 
         else:
             # the data arrived, add it to the update
-            workflow_data = workflow_update['workflows'][0]
             for workflow in data['workflows']:
                 if workflow['id'] == workflow_data['id']:
                     workflow.update(workflow_data)
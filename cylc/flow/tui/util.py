@@ -142,85 +142,95 @@ def compute_tree(data):
     root_node = add_node('root', 'root', {}, data={})
 
     for flow in data['workflows']:
-        nodes = {}
-        flow_node = add_node(
-            'workflow', flow['id'], nodes, data=flow)
-        root_node['children'].append(flow_node)
-
-        # populate cycle nodes
-        for cycle in flow.get('cyclePoints', []):
-            cycle['id'] = idpop(cycle['id'])  # strip the family off of the id
-            cycle_node = add_node('cycle', cycle['id'], nodes, data=cycle)
-            flow_node['children'].append(cycle_node)
-
-        # populate family nodes
-        for family in flow.get('familyProxies', []):
-            add_node('family', family['id'], nodes, data=family)
-
-        # create cycle/family tree
-        for family in flow.get('familyProxies', []):
+        root_node['children'].append(compute_workflow_tree(flow))
+
+    return root_node
+
+
+def compute_workflow_tree(flow):
+    """Digest GraphQL data for one workflow to produce a tree.
+
+    Note, the data is not modified so may be re-used for later updates.
+    """
+    nodes = {}
+    flow_node = add_node(
+        'workflow', flow['id'], nodes, data=flow)
+
+    # populate cycle nodes
+    for cycle in flow.get('cyclePoints', []):
+        # strip the family off of the id
+        cycle = {**cycle, 'id': idpop(cycle['id'])}
+        cycle_node = add_node('cycle', cycle['id'], nodes, data=cycle)
+        flow_node['children'].append(cycle_node)
+
+    # populate family nodes
+    for family in flow.get('familyProxies', []):
+        add_node('family', family['id'], nodes, data=family)
+
+    # create cycle/family tree
+    for family in flow.get('familyProxies', []):
+        family_node = add_node(
+            'family', family['id'], nodes)
+        first_parent = family['firstParent']
+        if (
+            first_parent
+            and first_parent['name'] != 'root'
+        ):
+            parent_node = add_node(
+                'family', first_parent['id'], nodes)
+            parent_node['children'].append(family_node)
+        else:
+            add_node(
+                'cycle', idpop(family['id']), nodes
+            )['children'].append(family_node)
+
+    # add leaves
+    for task in flow.get('taskProxies', []):
+        # If there's no first parent, the child will have been deleted
+        # during/after API query resolution. So ignore.
+        if not task['firstParent']:
+            continue
+        task_node = add_node(
+            'task', task['id'], nodes, data=task)
+        if task['firstParent']['name'] == 'root':
             family_node = add_node(
-                'family', family['id'], nodes)
-            first_parent = family['firstParent']
-            if (
-                first_parent
-                and first_parent['name'] != 'root'
-            ):
-                parent_node = add_node(
-                    'family', first_parent['id'], nodes)
-                parent_node['children'].append(family_node)
-            else:
-                add_node(
-                    'cycle', idpop(family['id']), nodes
-                )['children'].append(family_node)
-
-        # add leaves
-        for task in flow.get('taskProxies', []):
-            # If there's no first parent, the child will have been deleted
-            # during/after API query resolution. So ignore.
-            if not task['firstParent']:
-                continue
-            task_node = add_node(
-                'task', task['id'], nodes, data=task)
-            if task['firstParent']['name'] == 'root':
-                family_node = add_node(
-                    'cycle', idpop(task['id']), nodes)
-            else:
-                family_node = add_node(
-                    'family', task['firstParent']['id'], nodes)
-            family_node['children'].append(task_node)
-            for job in task['jobs']:
-                job_node = add_node(
-                    'job', job['id'], nodes, data=job)
-                job_info_node = add_node(
-                    'job_info', job['id'] + '_info', nodes, data=job)
-                job_node['children'] = [job_info_node]
-                task_node['children'].append(job_node)
-
-        # sort
-        for (type_, _), node in nodes.items():
-            if type_ != 'task':
-                # NOTE: jobs are sorted by submit-num in the GraphQL query
-                node['children'].sort(
-                    key=lambda x: NaturalSort(x['id_'])
-                )
-
-        # spring nodes
-        if 'port' not in flow:
-            # the "port" field is only available via GraphQL
-            # so we are not connected to this workflow yet
-            flow_node['children'].append(
-                add_node(
-                    '#spring',
-                    '#spring',
-                    nodes,
-                    data={
-                        'id': flow.get('_tui_data', 'Loading ...'),
-                    }
-                )
+                'cycle', idpop(task['id']), nodes)
+        else:
+            family_node = add_node(
+                'family', task['firstParent']['id'], nodes)
+        family_node['children'].append(task_node)
+        for job in task['jobs']:
+            job_node = add_node(
+                'job', job['id'], nodes, data=job)
+            job_info_node = add_node(
+                'job_info', job['id'] + '_info', nodes, data=job)
+            job_node['children'] = [job_info_node]
+            task_node['children'].append(job_node)
+
+    # sort
+    for (type_, _), node in nodes.items():
+        if type_ != 'task':
+            # NOTE: jobs are sorted by submit-num in the GraphQL query
+            node['children'].sort(
+                key=lambda x: NaturalSort(x['id_'])
             )
 
-    return root_node
+    # spring nodes
+    if 'port' not in flow:
+        # the "port" field is only available from the workflow itself
+        # so we are not connected to this workflow yet
+        flow_node['children'].append(
+            add_node(
+                '#spring',
+                '#spring',
+                nodes,
+                data={
+                    'id': flow.get('_tui_data', 'Loading ...'),
+                }
+            )
+        )
+
+    return flow_node
 
 
 class NaturalSort:
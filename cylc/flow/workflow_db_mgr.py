@@ -89,6 +89,7 @@ class WorkflowDatabaseManager:
     TABLE_BROADCAST_EVENTS = CylcWorkflowDAO.TABLE_BROADCAST_EVENTS
     TABLE_BROADCAST_STATES = CylcWorkflowDAO.TABLE_BROADCAST_STATES
     TABLE_INHERITANCE = CylcWorkflowDAO.TABLE_INHERITANCE
+    TABLE_INSTALL_MANIFESTS = CylcWorkflowDAO.TABLE_INSTALL_MANIFESTS
     TABLE_WORKFLOW_PARAMS = CylcWorkflowDAO.TABLE_WORKFLOW_PARAMS
     TABLE_WORKFLOW_FLOWS = CylcWorkflowDAO.TABLE_WORKFLOW_FLOWS
     TABLE_WORKFLOW_TEMPLATE_VARS = CylcWorkflowDAO.TABLE_WORKFLOW_TEMPLATE_VARS
@@ -117,6 +118,7 @@ class WorkflowDatabaseManager:
 
         self.db_deletes_map: Dict[str, List[DbArgDict]] = {
             self.TABLE_BROADCAST_STATES: [],
+            self.TABLE_INSTALL_MANIFESTS: [],
             self.TABLE_WORKFLOW_PARAMS: [],
             self.TABLE_TASK_POOL: [],
             self.TABLE_TASK_ACTION_TIMERS: [],
@@ -129,6 +131,7 @@ class WorkflowDatabaseManager:
             self.TABLE_BROADCAST_EVENTS: [],
             self.TABLE_BROADCAST_STATES: [],
             self.TABLE_INHERITANCE: [],
+            self.TABLE_INSTALL_MANIFESTS: [],
             self.TABLE_WORKFLOW_PARAMS: [],
             self.TABLE_WORKFLOW_FLOWS: [],
             self.TABLE_WORKFLOW_TEMPLATE_VARS: [],
@@ -306,6 +309,26 @@ class WorkflowDatabaseManager:
                 "namespace": namespace,
                 "inheritance": json.dumps(value)})
 
+    def put_install_manifest(
+        self,
+        install_target: str,
+        manifest: Dict[str, Tuple[str, Optional[int], Optional[int]]],
+    ) -> None:
+        """Put the file manifest installed to an install target.
+
+        Args:
+            install_target: The install target.
+            manifest: {path: (checksum, size, mtime_ns)}
+
+        """
+        self.db_deletes_map[self.TABLE_INSTALL_MANIFESTS].append({
+            "install_target": install_target})
+        self.db_inserts_map[self.TABLE_INSTALL_MANIFESTS].extend(
+            {"install_target": install_target, "path": path,
+             "checksum": checksum, "size": size, "mtime_ns": mtime_ns}
+            for path, (checksum, size, mtime_ns) in manifest.items()
+        )
+
     def put_workflow_params(self, schd: 'Scheduler') -> None:
         """Put various workflow parameters from schd in runtime database.
 
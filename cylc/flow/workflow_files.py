@@ -233,6 +233,12 @@ class WorkflowFiles:
         Contains information about the execution and status of a workflow.
         """
 
+        JINJA2_CACHE = 'jinja2-cache'
+        """Contains compiled Jinja2 templates.
+
+        Used to avoid recompiling unchanged templates on reload / restart.
+        """
+
         PUBLIC_FILE_EXTENSION = '.key'
         PRIVATE_FILE_EXTENSION = '.key_secret'
         """Keyword identifiers used to form the certificate names.
@@ -17,7 +17,10 @@
 """Test cylc.flow.client.WorkflowRuntimeClient."""
 import pytest
 
+from cylc.flow.exceptions import WorkflowStopped
+from cylc.flow.network import ZLIB, decompress_
 from cylc.flow.network.client import WorkflowRuntimeClient
+from cylc.flow.network.graphql import get_document_hash
 from cylc.flow.network.server import PB_METHOD_MAP
 
 
@@ -28,6 +31,7 @@ async def harness(mod_flow, mod_scheduler, mod_run, mod_one_conf):
     async with mod_run(schd):
         client = WorkflowRuntimeClient(id_)
         yield schd, client
+        client.stop(stop_loop=False)
 
 
 async def test_graphql(harness):
@@ -43,6 +47,60 @@ async def test_graphql(harness):
     assert schd.workflow in workflow['id']
 
 
+async def test_graphql_persisted_query(harness, monkeypatch):
+    """It should send the hash of repeated requests."""
+    schd, client = harness
+    request_string = 'query { workflows { status } }'
+    requests = []
+
+    def _send_request(command, args, *_):
+        requests.append(args)
+        return send_request(command, args, *_)
+
+    send_request = client._send_request
+    monkeypatch.setattr(client, '_send_request', _send_request)
+
+    for _ in range(2):
+        ret = await client.async_request(
+            'graphql',
+            {'request_string': request_string}
+        )
+        assert len(ret['workflows']) == 1
+    assert requests == [
+        {'request_string': request_string},
+        {'query_hash': get_document_hash(request_string)},
+    ]
+
+    # if the workflow forgets the query, it should send the full request
+    schd.server.graphql_backend.documents.clear()
+    requests.clear()
+    await client.async_request('graphql', {'request_string': request_string})
+    assert requests == [
+        {'query_hash': get_document_hash(request_string)},
+        {'request_string': request_string},
+    ]
+
+
+async def test_graphql_persisted_query_stopped(
+    flow, scheduler, start, one_conf
+):
+    """It should raise WorkflowStopped if the workflow stops between
+    repeated requests."""
+    id_ = flow(one_conf)
+    schd = scheduler(id_)
+    request = {'request_string': 'query { workflows { id } }'}
+    async with start(schd):
+        client = WorkflowRuntimeClient(id_, timeout=1)
+        await client.async_request('graphql', request)
+    try:
+        with pytest.raises(WorkflowStopped):
+            await client.async_request('graphql', request)
+        # it should still use persisted queries
+        assert client.persisted_queries is not None
+    finally:
+        client.stop(stop_loop=False)
+
+
 async def test_protobuf(harness):
     """It should return True if running."""
     schd, client = harness
@@ -50,3 +108,36 @@ async def test_protobuf(harness):
     pb_data = PB_METHOD_MAP['pb_entire_workflow']()
     pb_data.ParseFromString(ret)
     assert schd.workflow in pb_data.workflow.id
+
+
+@pytest.mark.parametrize('accept_encoding', [[], [ZLIB]])
+async def test_compression(harness, monkeypatch, accept_encoding):
+    """It should compress responses if the client accepts it."""
+    schd, client = harness
+    monkeypatch.setattr('cylc.flow.network.COMPRESSION_THRESHOLD', 0)
+    monkeypatch.setattr(client, 'persisted_queries', None)
+    monkeypatch.setitem(
+        client.header['meta'], 'accept_encoding', accept_encoding
+    )
+    frames = []
+
+    def _decompress(_frames):
+        frames.extend(_frames)
+        return decompress_(_frames)
+
+    monkeypatch.setattr('cylc.flow.network.client.decompress_', _decompress)
+
+    ret = await client.async_request(
+        'graphql',
+        {'request_string': 'query { workflows { id } }'}
+    )
+    assert schd.workflow in ret['workflows'][0]['id']
+    ret = await client.async_request('pb_entire_workflow')
+    pb_data = PB_METHOD_MAP['pb_entire_workflow']()
+    pb_data.ParseFromString(ret)
+    assert schd.workflow in pb_data.workflow.id
+
+    if accept_encoding:
+        assert frames[0::2] == [ZLIB.encode()] * 2
+    else:
+        assert len(frames) == 2
@@ -17,6 +17,7 @@
 import pytest
 from typing import TYPE_CHECKING
 
+from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.data_store_mgr import (
     FAMILY_PROXIES,
     JOBS,
@@ -25,6 +26,8 @@ from cylc.flow.data_store_mgr import (
     WORKFLOW
 )
 from cylc.flow.id import Tokens
+from cylc.flow.network.client import WorkflowRuntimeClient
+from cylc.flow.rundb import CylcWorkflowDAO
 from cylc.flow.task_state import (
     TASK_STATUS_FAILED,
     TASK_STATUS_SUCCEEDED,
@@ -316,3 +319,161 @@ def test_delta_task_prerequisite(harness):
         p.satisfied
         for t in schd.data_store_mgr.updated[TASK_PROXIES].values()
         for p in t.prerequisites})
+
+
+async def test_max_task_jobs(
+    flow, scheduler, start, one_conf, job_db_row, monkeypatch
+):
+    """Only the most recent jobs of each task should be held in the store.
+
+    Older jobs should remain listed against the task and be loaded from the
+    DB on request.
+    """
+    monkeypatch.setattr('cylc.flow.data_store_mgr.MAX_TASK_JOBS', 2)
+    schd: 'Scheduler' = scheduler(flow(one_conf))
+    async with start(schd):
+        itask = schd.pool.get_tasks()[0]
+        w_tokens = schd.tokens
+        job_ids = [
+            w_tokens.duplicate(
+                cycle=str(itask.point),
+                task=itask.tdef.name,
+                job=f'0{submit_num}',
+            ).id
+            for submit_num in range(1, 4)
+        ]
+        for submit_num in range(1, 4):
+            schd.workflow_db_mgr.put_insert_task_jobs(
+                itask,
+                {
+                    'submit_num': submit_num,
+                    'time_submit': job_db_row[3],
+                    'submit_status': 0,
+                    'job_runner_name': 'background',
+                    'platform_name': 'localhost',
+                },
+            )
+            schd.data_store_mgr.insert_job(
+                itask.tdef.name,
+                itask.point,
+                'submitted',
+                {
+                    **job_config(schd),
+                    'submit_num': submit_num,
+                    'task_id': itask.identity,
+                },
+            )
+            schd.data_store_mgr.update_data_structure()
+        schd.workflow_db_mgr.process_queued_ops()
+
+        data = schd.data_store_mgr.data[schd.data_store_mgr.workflow_id]
+        tp_id = w_tokens.duplicate(
+            cycle=str(itask.point),
+            task=itask.tdef.name,
+        ).id
+        tproxy = data[TASK_PROXIES][tp_id]
+        # all jobs are listed against the task
+        assert list(tproxy.jobs) == job_ids
+        # but only the most recent jobs are held in the store
+        assert set(data[JOBS]) == set(job_ids[1:])
+
+        # older jobs are loaded from the DB
+        jobs = schd.data_store_mgr.get_db_jobs(job_ids)
+        assert list(jobs) == job_ids[:1]
+        assert jobs[job_ids[0]].submit_num == 1
+        assert jobs[job_ids[0]].state == 'submitted'
+        assert job_ids[0] not in data[JOBS]
+
+        # and included in GraphQL queries (resolved in the server thread)
+        client = WorkflowRuntimeClient(schd.workflow)
+        try:
+            ret = await client.async_request(
+                'graphql',
+                {
+                    'request_string': '''
+                        query ($tpId: ID!, $jobId: ID!) {
+                            taskProxy (id: $tpId) {
+                                jobs { id submitNum }
+                            }
+                            job (id: $jobId) { id }
+                        }
+                    ''',
+                    'variables': {'tpId': tp_id, 'jobId': job_ids[0]},
+                }
+            )
+        finally:
+            client.stop(stop_loop=False)
+        assert sorted(
+            job['submitNum'] for job in ret['taskProxy']['jobs']
+        ) == [1, 2, 3]
+        assert ret['job'] == {'id': job_ids[0]}
+
+
+async def test_load_db_task_jobs(
+    flow, scheduler, start, job_db_row, monkeypatch
+):
+    """The job history of restarted tasks should be loaded at once.
+
+    It should be loaded before any of their jobs are looked up (e.g. by
+    task messages processed before the data store is next updated).
+    """
+    monkeypatch.setattr('cylc.flow.data_store_mgr.MAX_TASK_JOBS', 2)
+    id_ = flow({'scheduling': {'graph': {'R1': 'a & b & c'}}})
+    schd: 'Scheduler' = scheduler(id_)
+    async with start(schd):
+        for itask in schd.pool.get_tasks():
+            itask.submit_num = 2
+            itask.state.time_updated = job_db_row[3]
+            for submit_num in (1, 2):
+                schd.workflow_db_mgr.put_insert_task_jobs(
+                    itask,
+                    {
+                        'submit_num': submit_num,
+                        'time_submit': job_db_row[3],
+                        'submit_status': 0,
+                        'job_runner_name': 'background',
+                        'platform_name': 'localhost',
+                    },
+                )
+        schd.workflow_db_mgr.put_task_pool(schd.pool)
+        schd.workflow_db_mgr.process_queued_ops()
+
+    calls = []
+    select_jobs = CylcWorkflowDAO.select_jobs_for_datastore
+
+    def _select_jobs(self, task_ids):
+        calls.append(set(task_ids))
+        return select_jobs(self, task_ids)
+
+    monkeypatch.setattr(
+        CylcWorkflowDAO, 'select_jobs_for_datastore', _select_jobs
+    )
+    schd = scheduler(id_)
+    async with start(schd):
+        data_store_mgr = schd.data_store_mgr
+        w_tokens = schd.tokens
+        # a job message arrives before the data store is updated
+        data_store_mgr.delta_job_state(
+            w_tokens.duplicate(cycle='1', task='a', job='02'), 'running'
+        )
+        assert calls == [{'1/a', '1/b', '1/c'}]
+        # a task is submitted before the data store is updated
+        itask = schd.pool.get_task(IntegerPoint('1'), 'b')
+        data_store_mgr.insert_job(
+            'b',
+            itask.point,
+            'submitted',
+            {**job_config(schd), 'submit_num': 3, 'task_id': '1/b'},
+        )
+
+        await schd.update_data_structure()
+        assert len(calls) == 1
+        data = data_store_mgr.data[data_store_mgr.workflow_id]
+        assert {Tokens(j_id).relative_id for j_id in data[JOBS]} == {
+            '1/a/01', '1/a/02',
+            '1/b/02', '1/b/03',
+            '1/c/01', '1/c/02',
+        }
+        assert data[JOBS][
+            w_tokens.duplicate(cycle='1', task='a', job='02').id
+        ].state == 'running'
@@ -221,6 +221,35 @@ async def test_task_proxies(harness):
     }
 
 
+async def test_task_proxies_pagination(harness):
+    schd, client, w_tokens = harness
+
+    # page through "taskProxies" one element at a time
+    ids = []
+    after = ''
+    while True:
+        ret = await client.async_request(
+            'graphql',
+            {
+                'request_string': '''
+                    query ($after: ID) {
+                        taskProxies (first: 1, after: $after) { id }
+                    }
+                ''',
+                'variables': {'after': after},
+            }
+        )
+        if not ret['taskProxies']:
+            break
+        assert len(ret['taskProxies']) == 1
+        after = ret['taskProxies'][0]['id']
+        ids.append(after)
+    assert ids == [
+        w_tokens.duplicate(cycle='1', task=namespace).id
+        for namespace in ('a', 'b', 'c')
+    ]
+
+
 async def test_family_proxies(harness):
     schd, client, w_tokens = harness
 
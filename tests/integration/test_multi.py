@@ -0,0 +1,66 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Test cylc.flow.network.multi."""
+
+from cylc.flow.network.client_factory import get_client
+from cylc.flow.network.multi import call_multi_async
+
+
+async def test_call_multi_async(flow, scheduler, start, one_conf, monkeypatch):
+    """It should share clients and limit the number of concurrent calls."""
+    monkeypatch.setattr(
+        'cylc.flow.network.multi.MAX_CONCURRENT_WORKFLOWS', 2
+    )
+    schds = [scheduler(flow(one_conf)) for _ in range(3)]
+    clients = []
+    running = 0
+    max_running = 0
+
+    async def _query(workflow_id):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        client = get_client(workflow_id)
+        # repeated calls for the same workflow should return the same client
+        assert get_client(workflow_id) is client
+        ret = await client.async_request(
+            'graphql',
+            {'request_string': 'query { workflows { id } }'}
+        )
+        clients.append(client)
+        running -= 1
+        return ret['workflows'][0]['id']
+
+    async with start(schds[0]), start(schds[1]), start(schds[2]):
+        ret = await call_multi_async(
+            _query,
+            *(schd.workflow for schd in schds),
+            constraint='workflows',
+            report=lambda _: None,
+        )
+
+        # the factory should not be used outside of call_multi_async
+        client = get_client(schds[0].workflow)
+        client.stop(stop_loop=False)
+
+    assert sorted(ret) == sorted(schd.id for schd in schds)
+    assert max_running == 2
+    # the clients should share a ZMQ context
+    assert len({client.context for client in clients}) == 1
+    # and they should be stopped when done with
+    assert all(client.socket.closed for client in clients)
+    assert client.context is not clients[0].context
@@ -18,6 +18,8 @@
 
 from contextlib import suppress
 
+from cylc.flow.cycling.integer import IntegerPoint
+from cylc.flow.data_store_mgr import TASKS
 from cylc.flow.task_state import (
     TASK_STATUS_WAITING,
     TASK_STATUS_PREPARING,
@@ -146,3 +148,62 @@ async def test_reload_failure(
 
         # the config should be unchanged
         assert schd.config.cfg['scheduling']['graph']['R1'] == 'one'
+
+
+async def test_reload_changed_tasks(flow, scheduler, start, log_filter):
+    """Reload should only replace the definitions of changed tasks.
+
+    Tasks whose definitions (or graph neighbours) are unchanged should keep
+    their task definitions and proxies. Other config changes should cause
+    all task definitions to be replaced.
+    """
+    conf = {
+        'scheduling': {
+            'graph': {
+                'R1': 'a => b\nc',
+            },
+        },
+        'runtime': {
+            'a': {},
+            'b': {'script': 'true'},
+            'c': {},
+        },
+    }
+    id_ = flow(conf)
+    schd = scheduler(id_)
+    async with start(schd) as log:
+        tasks = {itask.tdef.name: itask for itask in schd.pool.get_tasks()}
+        assert set(tasks) == {'a', 'c'}
+        tdefs = dict(schd.config.taskdefs)
+
+        # change the definition of "b" (which "a" triggers)
+        conf['runtime']['b']['script'] = 'false'
+        flow(conf, id_=id_)
+        await schd.command_reload_workflow()
+        assert log_filter(
+            log, contains='Reloading 2 changed task definition(s).'
+        )
+        new_tasks = {
+            itask.tdef.name: itask for itask in schd.pool.get_tasks()
+        }
+        assert new_tasks['a'] is not tasks['a']
+        assert new_tasks['c'] is tasks['c']
+        assert schd.config.taskdefs['a'] is not tdefs['a']
+        assert schd.config.taskdefs['b'].rtconfig['script'] == 'false'
+        assert schd.config.taskdefs['c'] is tdefs['c']
+        data_tasks = {
+            task.name: task
+            for task in schd.data_store_mgr.data[schd.id][TASKS].values()
+        }
+        assert data_tasks['b'].runtime.script == 'false'
+        assert list(data_tasks['c'].proxies) == [
+            schd.tokens.duplicate(cycle='1', task='c').id
+        ]
+
+        # change something other than [runtime] or the graph
+        conf['scheduling']['runahead limit'] = 'P3'
+        flow(conf, id_=id_)
+        await schd.command_reload_workflow()
+        assert log_filter(log, contains='Reloading all task definitions.')
+        assert schd.pool.get_task(IntegerPoint('1'), 'c') is not tasks['c']
+        assert schd.config.taskdefs['c'] is not tdefs['c']
@@ -14,16 +14,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import deque
 import logging
 from typing import AsyncGenerator, Callable
 from unittest.mock import Mock
 
 import pytest
 
-from cylc.flow.data_store_mgr import EDGES, TASK_PROXIES
+from cylc.flow.data_store_mgr import (
+    ALL_DELTAS,
+    DELTAS_MAP,
+    DELTA_UPDATED,
+    EDGES,
+    FAMILY_PROXIES,
+    TASK_PROXIES,
+    create_delta_store,
+)
 from cylc.flow.id import Tokens
 from cylc.flow import CYLC_LOG
-from cylc.flow.network.resolvers import Resolvers
+from cylc.flow.network.resolvers import Resolvers, queue_delta
 from cylc.flow.scheduler import Scheduler
 
 
@@ -126,6 +135,38 @@ async def test_get_nodes_all(mock_flow, node_args):
     assert len(nodes) == 1
 
 
+@pytest.mark.parametrize('node_type', [TASK_PROXIES, FAMILY_PROXIES])
+@pytest.mark.parametrize(
+    'args',
+    [
+        {'states': ['waiting']},
+        {'states': ['failed']},
+        {'is_held': False},
+        {'is_runahead': True},
+        {'ids': ['20000101T0000Z']},
+        {'ids': ['*/foo', '20000101T0000Z/bar']},
+        {'ids': ['20000101T0000Z/foo', '20000101T1200Z/foo']},
+        {'ids': ['20000101T1200Z/f*']},
+        {'ids': ['foo'], 'states': ['waiting'], 'is_queued': False},
+    ]
+)
+async def test_get_nodes_all_indexed(mock_flow, node_args, node_type, args):
+    """It should return the same nodes with or without the indexes."""
+    node_args.update(args)
+    node_args['ids'] = [
+        Tokens(id_, relative=True) for id_ in node_args['ids']
+    ]
+    indexed = await mock_flow.resolvers.get_nodes_all(node_type, node_args)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            mock_flow.resolvers, 'get_index', lambda *_: None
+        )
+        scanned = await mock_flow.resolvers.get_nodes_all(
+            node_type, node_args
+        )
+    assert indexed == scanned
+
+
 async def test_get_nodes_by_ids(mock_flow, node_args):
     """Test method returning workflow(s) node messages
     who's ID is a match to any given."""
@@ -245,3 +286,32 @@ async def test_command_logging(mock_flow, caplog, log_filter):
     await mock_flow.resolvers._mutation_mapper("put_messages", kwargs, meta)
     assert log_filter(
         caplog, contains='Command "put_messages" received from Dr Spock')
+
+
+def test_queue_delta():
+    """It should merge deltas queued for a slow subscriber."""
+    w_id = 'workflow_id'
+    deltas = []
+    for state in ('running', 'succeeded'):
+        delta = DELTAS_MAP[ALL_DELTAS]()
+        delta.task_proxies.updated.add(id='1/a', state=state)
+        deltas.append(create_delta_store(delta, w_id))
+
+    flow_queue = deque()
+    queue_delta(flow_queue, w_id, 'all', deltas[0])
+    assert list(flow_queue) == [['all', deltas[0], False]]
+
+    # the second delta is merged into a copy of the first
+    queue_delta(flow_queue, w_id, 'all', deltas[1])
+    assert len(flow_queue) == 1
+    topic, delta_store, merged = flow_queue[0]
+    assert merged
+    assert delta_store[DELTA_UPDATED][TASK_PROXIES]['1/a'].state == (
+        'succeeded'
+    )
+    assert deltas[0][DELTA_UPDATED][TASK_PROXIES]['1/a'].state == 'running'
+
+    # shutdown deltas are not merged
+    queue_delta(flow_queue, w_id, 'shutdown', create_delta_store())
+    queue_delta(flow_queue, w_id, 'all', deltas[0])
+    assert [item[0] for item in flow_queue] == ['all', 'shutdown', 'all']
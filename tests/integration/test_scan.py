@@ -16,6 +16,7 @@
 """Test file-system interaction aspects of scan functionality."""
 
 from contextlib import suppress
+import os
 from pathlib import Path
 import re
 from shutil import rmtree
@@ -25,6 +26,7 @@ from typing import List
 import pytest
 
 from cylc.flow.network.scan import (
+    ScanCache,
     filter_name,
     graphql_query,
     is_active,
@@ -343,6 +345,73 @@ async def test_scan_one(one, start, test_dir):
             raise Exception('Expected one scan result')
 
 
+async def test_scan_cache(tmp_path, monkeypatch):
+    """It should re-use unchanged directory listings."""
+    init_flows(tmp_path, running=('foo',), registered=('bar/baz',))
+    # don't wait for the modification times to become trustworthy
+    monkeypatch.setattr(ScanCache, 'RACY_INTERVAL', 0)
+    listed = []
+    listdir = os.listdir
+
+    def _listdir(path):
+        listed.append(Path(path))
+        return listdir(path)
+
+    monkeypatch.setattr('cylc.flow.network.scan.os.listdir', _listdir)
+    cache = ScanCache()
+
+    # the first scan should list everything
+    assert await listify(scan(tmp_path, cache=cache)) == ['bar/baz', 'foo']
+    assert listed
+
+    # the second scan should list nothing
+    listed.clear()
+    assert await listify(scan(tmp_path, cache=cache)) == ['bar/baz', 'foo']
+    assert listed == []
+
+    # only changed directories should be listed again
+    init_flows(tmp_path, registered=('qux',))
+    assert await listify(scan(tmp_path, cache=cache)) == [
+        'bar/baz', 'foo', 'qux'
+    ]
+    assert sorted(listed) == [tmp_path, tmp_path / 'qux']
+
+
+async def test_scan_cache_clients(one, start, test_dir):
+    """It should re-use clients until the contact file changes."""
+    cache = ScanCache()
+    pipe = (
+        scan(scan_dir=test_dir, cache=cache)
+        | filter_name(rf'^{re.escape(one.workflow)}$')
+        | is_active(True)
+        | graphql_query(['status'], cache=cache)
+    )
+    async with start(one):
+        assert len(await listify(pipe)) == 1
+        client = cache.get_client({
+            'name': one.workflow,
+            'path': Path(one.workflow_run_dir),
+        })
+
+        # the client should be re-used
+        assert len(await listify(pipe)) == 1
+        assert cache.get_client({
+            'name': one.workflow,
+            'path': Path(one.workflow_run_dir),
+        }) is client
+
+        # until the contact file changes
+        contact = Path(one.workflow_run_dir, SRV_DIR, CONTACT)
+        stat = contact.stat()
+        os.utime(contact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert len(await listify(pipe)) == 1
+        assert cache.get_client({
+            'name': one.workflow,
+            'path': Path(one.workflow_run_dir),
+        }) is not client
+    cache.close()
+
+
 async def test_workflow_params(
     one,
     start,
@@ -20,6 +20,10 @@ from getpass import getuser
 
 import pytest
 
+from cylc.flow.network.graphql import (
+    PERSISTED_QUERY_NOT_FOUND,
+    get_document_hash,
+)
 from cylc.flow.network.server import PB_METHOD_MAP
 from cylc.flow.scheduler import Scheduler
 
@@ -55,6 +59,35 @@ def test_graphql(myflow):
     assert myflow.id == data['workflows'][0]['id']
 
 
+def test_graphql_persisted_query(myflow):
+    """Test GraphQL endpoint method with a persisted query."""
+    request_string = f'''
+        query {{
+            workflows(ids: ["{myflow.id}"]) {{
+                id
+            }}
+        }}
+    '''
+    query_hash = get_document_hash(request_string)
+    myflow.server.graphql_backend.documents.clear()
+
+    # the query hasn't been sent yet
+    data = call_server_method(
+        myflow.server.graphql, query_hash=query_hash
+    )
+    assert data == [PERSISTED_QUERY_NOT_FOUND]
+
+    # send the query, it should be cached
+    call_server_method(myflow.server.graphql, request_string)
+    assert list(myflow.server.graphql_backend.documents) == [query_hash]
+
+    # now the query can be sent by hash
+    data = call_server_method(
+        myflow.server.graphql, query_hash=query_hash
+    )
+    assert myflow.id == data['workflows'][0]['id']
+
+
 def test_pb_data_elements(myflow):
     """Test Protobuf elements endpoint method."""
     element_type = 'workflow'
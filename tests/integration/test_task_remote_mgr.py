@@ -52,7 +52,7 @@ async def test_remote_tidy(
     # remotes actually happening:
     class MockProc:
         def __init__(self, *args, **kwargs):
-            self.poll = lambda: True
+            self.args = args[0]
             if (
                 'baum' in args[0]
                 or 'bay' in args[0]
@@ -60,6 +60,7 @@ async def test_remote_tidy(
                 self.returncode = 255
             else:
                 self.returncode = 0
+            self.poll = lambda: self.returncode
             self.communicate = lambda: ('out', 'err')
 
     monkeypatch.setattr(
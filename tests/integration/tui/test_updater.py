@@ -61,7 +61,10 @@ def updater(monkeypatch, test_dir):
     filters['workflows']['id'] = f'^{re.escape(id_base)}/.*'
     updater._update_filters(filters)
 
-    return updater
+    yield updater
+
+    # close any connections opened by the test
+    updater._close()
 
 
 def get_child_tokens(root_node, types, relative=False):
@@ -234,3 +237,55 @@ async def test_filters(one_conf, flow, scheduler, run, updater):
             #     '1/b',
             #     '1/c',
             # }
+
+
+async def test_delta_updates(one_conf, flow, scheduler, start, updater):
+    """It should keep the workflow up to date using published deltas."""
+    schd = scheduler(flow(one_conf))
+
+    async with start(schd):
+        await schd.update_data_structure()
+        async with timeout(10):
+            updater.subscribe(schd.tokens.id)
+            root_node = await updater._update()
+            store = updater._stores[schd.tokens.id]
+            version = store.version
+            (task_node,) = [
+                node
+                for node in root_node['children'][0]['children'][0][
+                    'children'
+                ]
+                if node['type_'] == 'task'
+            ]
+            assert task_node['data']['state'] == 'waiting'
+
+            # the tree should be re-used if nothing has changed
+            workflow_node = root_node['children'][0]
+            root_node = await updater._update()
+            assert root_node['children'][0] is workflow_node
+
+            # change the task state
+            itask = schd.pool.get_tasks()[0]
+            itask.state_reset('succeeded')
+            schd.data_store_mgr.delta_task_state(itask)
+            await schd.update_data_structure()
+
+            # the change should arrive as a delta
+            while store.version == version:
+                root_node = await updater._update()
+            assert updater._stores[schd.tokens.id] is store
+            (task_node,) = [
+                node
+                for node in root_node['children'][0]['children'][0][
+                    'children'
+                ]
+                if node['type_'] == 'task'
+            ]
+            assert task_node['data']['state'] == 'succeeded'
+
+            # task state filters should be applied locally
+            filters = deepcopy(updater.filters)
+            filters['tasks']['succeeded'] = False
+            updater.update_filters(filters)
+            root_node = await updater._update()
+            assert get_child_tokens(root_node, types={'task'}) == set()
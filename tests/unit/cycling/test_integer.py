@@ -226,3 +226,25 @@ def test_async_expr():
     sequence = IntegerSequence(IntegerSequence.get_async_expr(point), 1, 10)
     assert sequence.get_next_point(IntegerPoint('1')) == point
     assert sequence.get_next_point(IntegerPoint('5')) is None
+
+
+@pytest.mark.parametrize('sequence, start, stop', [
+    ('P1', 1, 10),
+    ('P3', 2, 30),
+    ('R/P1!(2,3,7)', 1, 10),
+    ('R/P1!(R/P2)', 1, 10),
+    ('R3/P2', 1, 30),
+    ('R1', 1, 10),
+    ('P1', 10, 1),
+])
+def test_get_points(sequence, start, stop):
+    """It matches walking the sequence one point at a time."""
+    sequence = IntegerSequence(sequence, 1, 20)
+    start = IntegerPoint(start)
+    stop = IntegerPoint(stop)
+    expected = []
+    point = sequence.get_first_point(start)
+    while point is not None and point <= stop:
+        expected.append(point)
+        point = sequence.get_next_point(point)
+    assert sequence.get_points(start, stop) == expected
@@ -16,6 +16,7 @@
 
 from datetime import datetime
 
+from metomi.isodatetime.data import CALENDAR
 import pytest
 from pytest import param
 
@@ -26,6 +27,7 @@ from cylc.flow.cycling.iso8601 import (
     ingest_time,
 )
 from cylc.flow.cycling.loader import ISO8601_CYCLING_TYPE
+from cylc.flow.exceptions import SequenceDegenerateError
 
 
 def test_exclusions_simple(set_cycling_type):
@@ -933,3 +935,75 @@ def test_validate_fails_comma_sep_offset_list(_input, errortext, set_cycling_typ
     set_cycling_type(ISO8601_CYCLING_TYPE, "Z")
     with pytest.raises(Exception, match=errortext):
         ingest_time(_input)
+
+
+@pytest.mark.parametrize('calendar', ['gregorian', '360day', '365day'])
+def test_point_cmp(calendar, set_cycling_type):
+    """It orders points across time zones and calendars."""
+    mode = CALENDAR.mode
+    CALENDAR.set_mode(calendar)
+    try:
+        _test_point_cmp(set_cycling_type)
+    finally:
+        CALENDAR.set_mode(mode)
+
+
+def _test_point_cmp(set_cycling_type):
+    set_cycling_type(ISO8601_CYCLING_TYPE, "+0530")
+    points = [
+        '20000102T0100+0100',
+        '20000102T0000Z',
+        '20000102T0429+0530',
+        '20000102T0030Z',
+        '20000130T0000Z',
+        '20000201T0000+1300',
+        '20000201T0000Z',
+    ]
+    expected = [
+        '20000102T0429+0530',
+        '20000102T0100+0100',
+        '20000102T0000Z',
+        '20000102T0030Z',
+        '20000130T0000Z',
+        '20000201T0000+1300',
+        '20000201T0000Z',
+    ]
+    assert [
+        point.value
+        for point in sorted(ISO8601Point(value) for value in points)
+    ] == expected
+    assert ISO8601Point(points[0]) == ISO8601Point(points[1])
+    assert ISO8601Point(points[0]) != ISO8601Point(points[2])
+
+
+@pytest.mark.parametrize('sequence, start, stop', [
+    ('PT1H', '20000101T00', '20000103T00'),
+    ('PT1H!(T00, T12)', '20000101T05', '20000103T00'),
+    ('PT1H!(T00, 20000101T06)', '20000101T00', '20000103T00'),
+    ('P1M!(01T00/P3M)', '20000101T00', '20011231T00'),
+    ('R3/PT6H', '19990101T00', '20000103T00'),
+    ('R1', '20000101T00', '20000103T00'),
+    ('PT1H', '20000103T00', '20000101T00'),
+])
+def test_get_points(sequence, start, stop, set_cycling_type):
+    """It matches walking the sequence one point at a time."""
+    set_cycling_type(ISO8601_CYCLING_TYPE, "Z")
+    sequence = ISO8601Sequence(sequence, '20000101T00', '20050101T00')
+    start = ISO8601Point.from_nonstandard_string(start)
+    stop = ISO8601Point.from_nonstandard_string(stop)
+    expected = []
+    point = sequence.get_first_point(start)
+    while point is not None and point <= stop:
+        expected.append(point)
+        point = sequence.get_next_point(point)
+    assert sequence.get_points(start, stop) == expected
+
+
+def test_get_points_degenerate(set_cycling_type):
+    """It detects sequences which are degenerate in the point format."""
+    set_cycling_type(ISO8601_CYCLING_TYPE, "Z", "CCYY-MM")
+    sequence = ISO8601Sequence('P1D', '2015-08', '2015-10')
+    with pytest.raises(SequenceDegenerateError):
+        sequence.get_points(
+            ISO8601Point('2015-08'), ISO8601Point('2015-09')
+        )
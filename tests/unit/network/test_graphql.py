@@ -22,7 +22,12 @@ from graphql import parse
 
 from cylc.flow.data_messages_pb2 import PbTaskProxy, PbPrerequisite
 from cylc.flow.network.graphql import (
-    AstDocArguments, null_setter, NULL_VALUE, grow_tree
+    AstDocArguments,
+    CylcGraphQLBackend,
+    null_setter,
+    NULL_VALUE,
+    get_document_hash,
+    grow_tree,
 )
 from cylc.flow.network.schema import schema
 
@@ -186,3 +191,37 @@ def test_null_setter(pre_result, expected_result):
 def test_grow_tree(expect, tree, path, leaves):
     grow_tree(tree, path, leaves)
     assert tree == expect
+
+
+def test_document_cache():
+    """Test the backend caches parsed documents."""
+    backend = CylcGraphQLBackend(cache_size=2)
+    queries = [
+        'query { workflows { id } }',
+        'query { workflows { name } }',
+        'query { workflows { status } }',
+    ]
+    hashes = [get_document_hash(query) for query in queries]
+
+    # documents are re-used
+    document = backend.document_from_string(schema, queries[0])
+    assert backend.document_from_string(schema, queries[0]) is document
+    assert backend.get_document(hashes[0]) is document
+
+    # the least recently used document is discarded
+    backend.document_from_string(schema, queries[1])
+    backend.get_document(hashes[0])
+    backend.document_from_string(schema, queries[2])
+    assert list(backend.documents) == [hashes[0], hashes[2]]
+    assert backend.get_document(hashes[1]) is None
+
+
+def test_document_cache_validation():
+    """Test invalid documents return validation errors each time."""
+    backend = CylcGraphQLBackend(cache_size=2)
+    for _ in range(2):
+        result = backend.document_from_string(
+            schema, 'query { workflows { elephant } }'
+        ).execute(variable_values={})
+        assert result.invalid
+        assert 'elephant' in str(result.errors[0])
@@ -25,7 +25,9 @@ from cylc.flow.cfgspec.workflow import SPEC as WORKFLOW_SPEC
 from cylc.flow.network.schema import (
     RUNTIME_FIELD_TO_CFG_MAP,
     Mutations,
+    PAGE_SIZE_MAX,
     Runtime,
+    paginate_elements,
     sort_elements,
     SortArgs,
 )
@@ -94,6 +96,43 @@ def test_sort_args(elements, sort_args, expected_result):
         assert elements == expected_result
 
 
+@dataclass
+class DummyElement:
+    id: str
+
+
+@pytest.mark.parametrize(
+    'args,expected_result',
+    [
+        # no pagination
+        ({}, ['c', 'a', 'b']),
+        # first page
+        ({'first': 2}, ['a', 'b']),
+        # following page
+        ({'first': 2, 'after': 'b'}, ['c']),
+        # the "after" element needn't exist
+        ({'after': 'aa'}, ['b', 'c']),
+        # past the end
+        ({'first': 2, 'after': 'c'}, []),
+        # page size out of range
+        ({'first': 0}, ValueError),
+        ({'first': PAGE_SIZE_MAX + 1}, ValueError),
+        # pages are ordered by ID
+        ({'first': 1, 'sort': SortArgs(keys=['id'])}, ValueError),
+    ]
+)
+def test_paginate_elements(args, expected_result):
+    """Test the pagination function used by the schema."""
+    elements = (DummyElement(id_) for id_ in ('c', 'a', 'b'))
+    if isclass(expected_result):
+        with pytest.raises(expected_result):
+            paginate_elements(elements, args)
+    else:
+        assert [
+            element.id for element in paginate_elements(elements, args)
+        ] == expected_result
+
+
 @pytest.mark.parametrize(
     'field_name', RUNTIME_FIELD_TO_CFG_MAP.keys()
 )
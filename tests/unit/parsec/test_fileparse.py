@@ -31,6 +31,7 @@ from cylc.flow.parsec.exceptions import (
     ParsecError,
 )
 from cylc.flow.parsec.OrderedDict import OrderedDictWithDefaults
+from cylc.flow.parsec import fileparse
 from cylc.flow.parsec.fileparse import (
     EXTRA_VARS_TEMPLATE,
     _prepend_old_templatevars,
@@ -362,6 +363,74 @@ def test_read_and_proc_jinja2():
         assert r == ['a=Cylc']
 
 
+def test_parse_cache(tmp_path, monkeypatch):
+    """It reuses the processed file until one of its inputs changes."""
+    monkeypatch.setattr(fileparse, 'CONFIG_CACHE_DIR', tmp_path / 'cache')
+    calls = []
+
+    def _read_and_proc(*args, **kwargs):
+        calls.append(args)
+        return read_and_proc(*args, **kwargs)
+
+    monkeypatch.setattr(fileparse, 'read_and_proc', _read_and_proc)
+    src = tmp_path / 'src'
+    src.mkdir()
+    fpath = src / 'flow.cylc'
+    fpath.write_text('#!jinja2\n%include inc.cylc\na={{ name }}\n')
+    (src / 'inc.cylc').write_text('b=1\n')
+
+    def _parse(name):
+        return parse(str(fpath), template_vars={'name': name}, use_cache=True)
+
+    assert _parse('x') == {'a': 'x', 'b': '1'}
+    assert _parse('x') == {'a': 'x', 'b': '1'}
+    assert len(calls) == 1
+
+    # change template variables
+    assert _parse('y') == {'a': 'y', 'b': '1'}
+    assert len(calls) == 2
+
+    # change an included file
+    (src / 'inc.cylc').write_text('b=2\n')
+    assert _parse('y') == {'a': 'y', 'b': '2'}
+    assert _parse('y') == {'a': 'y', 'b': '2'}
+    assert len(calls) == 3
+
+    # run directories are not part of the workflow definition
+    (src / 'log').mkdir()
+    (src / 'log' / 'foo').touch()
+    assert _parse('y') == {'a': 'y', 'b': '2'}
+    assert len(calls) == 3
+
+    # the cache is not used by default
+    parse(str(fpath), template_vars={'name': 'y'})
+    assert len(calls) == 4
+
+
+def test_parse_cache_env(tmp_path, monkeypatch):
+    """It only keys the cache on environment variables the workflow can
+    read."""
+    fpath = tmp_path / 'flow.cylc'
+    fpath.write_text('#!jinja2\na={{ environ["FOO"] }}\n')
+    monkeypatch.setenv('FOO', 'foo')
+
+    def _key():
+        return fileparse._get_config_cache_key(str(fpath), None, None)
+
+    key = _key()
+    # unrelated variables
+    monkeypatch.setenv('TERM', 'something-else')
+    monkeypatch.setenv('SSH_CONNECTION', '1.2.3.4 1 5.6.7.8 22')
+    assert _key() == key
+    # variables referenced by the workflow
+    monkeypatch.setenv('FOO', 'bar')
+    assert _key() != key
+    key = _key()
+    # Cylc variables (which are provided as template variables)
+    monkeypatch.setenv('CYLC_FOO', 'foo')
+    assert _key() != key
+
+
 def test_read_and_proc_cwd(tmp_path):
     """The template processor should be able to read workflow files.
 
@@ -76,6 +76,44 @@ def test_jinja2process_missing_variables(tmp_path):
         assert 'jinja2.UndefinedError' in str(exc)
 
 
+def test_jinja2process_bytecode_cache(tmp_path, monkeypatch):
+    """It caches compiled templates in installed workflows."""
+    lines = [
+        "skipped",
+        "{% include 'inc.cylc' %}",
+        "{% for i in range(2) %}My name is {{ name }}{{ i }}",
+        "{% endfor %}",
+    ]
+    (tmp_path / 'inc.cylc').write_text('Hello {{ name }}')
+    variables = {'name': 'Cylc'}
+    expected = ['Hello Cylc', 'My name is Cylc0', 'My name is Cylc1']
+
+    # not an installed workflow => no cache
+    assert jinja2process('flow.cylc', lines, tmp_path, variables) == expected
+    assert get_bytecode_cache(str(tmp_path)) is None
+
+    # installed workflow => templates are compiled and cached
+    (tmp_path / '.service').mkdir()
+    assert jinja2process('flow.cylc', lines, tmp_path, variables) == expected
+    assert len(list((tmp_path / '.service' / 'jinja2-cache').iterdir())) == 2
+
+    # => cached templates are used next time
+    def _compile(*args, **kwargs):
+        raise Exception('should not compile')
+
+    with monkeypatch.context() as mp:
+        mp.setattr(jinja2.Environment, 'compile', _compile)
+        assert jinja2process(
+            'flow.cylc', lines, tmp_path, variables) == expected
+
+    # => changed templates are recompiled
+    (tmp_path / 'inc.cylc').write_text('Goodbye {{ name }}')
+    lines[-1] = "{% endfor %}{{ 42 }}"
+    assert jinja2process('flow.cylc', lines, tmp_path, variables) == [
+        'Goodbye Cylc', 'My name is Cylc0', 'My name is Cylc1', '42'
+    ]
+
+
 def test_pymoduleloader(tmp_path):
     filters_dir = tmp_path / 'Jinja2filters'
     filters_dir.mkdir()
@@ -24,6 +24,7 @@ from cylc.flow.scripts.graph import (
     Node,
     format_cylc_reference,
     format_graphviz,
+    format_graphviz_stream,
     get_nodes_and_edges,
 )
 
@@ -303,3 +304,36 @@ def test_null(null_config):
         show_suicide=False
     )
     assert get_nodes_and_edges(opts, None, 1, 2, '')  == ([], [])
+
+
+def test_format_graphviz_stream():
+    """Test streamed graphviz output."""
+    graph = [
+        ('1/a', '1/b', None, False, False),
+        ('1/b', '2/b', None, False, False),
+        ('1/b', '1/x', None, True, False),
+        ('1/a', '1/b', None, False, False),
+        ('2/b', None, None, False, False),
+    ]
+    opts = SimpleNamespace(transpose=False, show_suicide=False)
+    assert list(format_graphviz_stream(opts, graph)) == [
+        'strict digraph {',
+        '  graph [fontname="sans" fontsize="25"]',
+        '  node [fontname="sans"]',
+        '',
+        '  "1/a" [label="a\\n1"]',
+        '  "1/b" [label="b\\n1"]',
+        '  "1/a" -> "1/b"',
+        '  "2/b" [label="b\\n2"]',
+        '  "1/b" -> "2/b"',
+        '  "1/a" -> "1/b"',
+        '}',
+    ]
+
+    # suicide edges are optional and node labels are repeated once they
+    # have been forgotten
+    opts = SimpleNamespace(transpose=True, show_suicide=True)
+    lines = list(format_graphviz_stream(opts, graph, max_seen_nodes=2))
+    assert '  rankdir="LR"' in lines
+    assert '  "1/b" -> "1/x"' in lines
+    assert lines.count('  "1/b" [label="b\\n1"]') == 3
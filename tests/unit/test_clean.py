@@ -957,6 +957,11 @@ def test_remote_clean(
         for p_name in expected_platforms:
             mocked_remote_clean_cmd.assert_any_call(
                 id_, PLATFORMS[p_name], rm_dirs, 'irrelevant')
+        # the stdout of each remote clean cmd is logged once
+        assert len([
+            rec for rec in caplog.records
+            if rec.levelno == logging.INFO and "Mocked stdout" in rec.message
+        ]) == len(expected_platforms)
     else:
         mocked_remote_clean_cmd.assert_not_called()
     if failed_platforms:
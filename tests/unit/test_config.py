@@ -1761,3 +1761,55 @@ def test_force_workflow_compat_mode(tmp_path):
         WorkflowConfig('foo', str(fpath), {})
     # It succeeds with compat mode:
     WorkflowConfig('foo', str(fpath), {}, force_compat_mode=True)
+
+
+def test_compute_inheritance(tmp_flow_config, mock_glbl_cfg):
+    """It inherits settings in MRO order without sharing the results."""
+    mock_glbl_cfg(
+        'cylc.flow.platforms.glbl_cfg',
+        '''
+        [platforms]
+            [[localhost]]
+                hosts = localhost
+        '''
+    )
+    id_ = 'test'
+    file_path = tmp_flow_config(id_, '''
+        [scheduling]
+            [[graph]]
+                R1 = a & b & c
+        [runtime]
+            [[root]]
+                script = root
+                [[[environment]]]
+                    X = root
+                    Y = root
+            [[A]]
+                script = A
+                [[[environment]]]
+                    X = A
+            [[B]]
+                [[[environment]]]
+                    Y = B
+                    Z = B
+            [[a, b]]
+                inherit = A
+            [[c]]
+                inherit = A, B
+                [[[environment]]]
+                    Z = c
+    ''')
+    config = WorkflowConfig(
+        id_, file_path, template_vars={}, options=Values()
+    )
+    runtime = config.cfg['runtime']
+    assert runtime['a']['script'] == 'A'
+    assert dict(runtime['a']['environment']) == {'X': 'A', 'Y': 'root'}
+    assert runtime['c']['script'] == 'A'
+    assert dict(runtime['c']['environment']) == {
+        'X': 'A', 'Y': 'B', 'Z': 'c'
+    }
+    # namespaces sharing ancestors do not share their config
+    runtime['a']['environment']['X'] = 'a'
+    assert runtime['b']['environment']['X'] == 'A'
+    assert runtime['A']['environment']['X'] == 'A'
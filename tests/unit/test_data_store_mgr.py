@@ -16,12 +16,20 @@
 
 from copy import deepcopy
 from time import time
+from types import SimpleNamespace
 
 from cylc.flow.data_store_mgr import (
     task_mean_elapsed_time,
     apply_delta,
+    create_delta_store,
+    merge_delta_store,
+    TASKS,
+    TASK_PROXIES,
     WORKFLOW,
     DELTAS_MAP,
+    DELTA_ADDED,
+    DELTA_PRUNED,
+    DELTA_UPDATED,
     ALL_DELTAS,
     DATA_TEMPLATE
 )
@@ -67,3 +75,102 @@ def test_apply_delta():
 
     assert data[WORKFLOW].id == w_id
     assert data[WORKFLOW].pruned is True
+
+
+def test_merge_delta_store():
+    """Merged delta stores should be equivalent to applying both in turn."""
+    w_id = 'workflow_id'
+    first = DELTAS_MAP[ALL_DELTAS]()
+    first.workflow.updated.status = 'running'
+    first.workflow.updated.state_totals['running'] = 1
+    added = first.task_proxies.added.add(id='1/a', state='waiting')
+    added.prerequisites.add(expression='c0')
+    first.task_proxies.updated.add(id='1/b', state='running')
+    first.task_proxies.pruned.append('1/c')
+
+    second = DELTAS_MAP[ALL_DELTAS]()
+    second.workflow.updated.state_totals['waiting'] = 1
+    updated = second.task_proxies.updated.add(id='1/a', state='running')
+    updated.prerequisites.add(expression='c1')
+    second.task_proxies.updated.add(id='1/b', is_held=True)
+    second.task_proxies.updated.add(id='1/d', state='failed')
+    second.task_proxies.added.add(id='1/c', state='waiting')
+    second.task_proxies.pruned.append('1/e')
+
+    third = DELTAS_MAP[ALL_DELTAS]()
+    third.task_proxies.pruned.append('1/b')
+
+    deltas = [
+        create_delta_store(delta, w_id)
+        for delta in (first, second, third)
+    ]
+    merged = create_delta_store(workflow_id=w_id)
+    for delta_store in deltas:
+        merge_delta_store(merged, delta_store)
+
+    # workflow updates are merged, clearing overwritten fields
+    workflow = merged[DELTA_UPDATED][WORKFLOW]
+    assert workflow.status == 'running'
+    assert dict(workflow.state_totals) == {'waiting': 1}
+
+    # updates to added elements are merged into them
+    assert set(merged[DELTA_ADDED][TASK_PROXIES]) == {'1/a', '1/c'}
+    proxy = merged[DELTA_ADDED][TASK_PROXIES]['1/a']
+    assert proxy.state == 'running'
+    assert [p.expression for p in proxy.prerequisites] == ['c1']
+    # pruned elements are dropped, pruned then added ones are not pruned
+    assert set(merged[DELTA_UPDATED][TASK_PROXIES]) == {'1/d'}
+    assert merged[DELTA_PRUNED][TASK_PROXIES] == ['1/e', '1/b']
+
+    # the original delta stores should not be modified
+    proxy = deltas[0][DELTA_ADDED][TASK_PROXIES]['1/a']
+    assert proxy.state == 'waiting'
+    assert [p.expression for p in proxy.prerequisites] == ['c0']
+
+
+def test_merge_delta_store_added_then_pruned():
+    """Elements added then pruned should leave no references behind."""
+    w_id = 'w'
+    tp_id = 'w//1/foo'
+    first = DELTAS_MAP[ALL_DELTAS]()
+    first.workflow.added.id = w_id
+    first.tasks.added.add(id='w//foo')
+    second = DELTAS_MAP[ALL_DELTAS]()
+    second.task_proxies.added.add(id=tp_id, task='w//foo')
+    second.tasks.updated.add(id='w//foo', proxies=[tp_id])
+    second.workflow.updated.task_proxies.append(tp_id)
+    third = DELTAS_MAP[ALL_DELTAS]()
+    third.task_proxies.pruned.append(tp_id)
+
+    # apply the deltas in turn
+    expected = deepcopy(DATA_TEMPLATE)
+    for delta in (first, second, third):
+        for field, sub_delta in delta.ListFields():
+            apply_delta(field.name, sub_delta, expected)
+    assert list(expected[TASKS]['w//foo'].proxies) == []
+    assert list(expected[WORKFLOW].task_proxies) == []
+
+    # apply the merged deltas
+    merged = create_delta_store(workflow_id=w_id)
+    for delta in (first, second, third):
+        merge_delta_store(merged, create_delta_store(delta, w_id))
+    data = deepcopy(DATA_TEMPLATE)
+    apply_delta(
+        WORKFLOW,
+        SimpleNamespace(
+            added=merged[DELTA_ADDED][WORKFLOW],
+            updated=merged[DELTA_UPDATED][WORKFLOW],
+        ),
+        data,
+    )
+    for key in (TASKS, TASK_PROXIES):
+        apply_delta(
+            key,
+            SimpleNamespace(
+                added=list(merged[DELTA_ADDED][key].values()),
+                updated=list(merged[DELTA_UPDATED][key].values()),
+                pruned=merged[DELTA_PRUNED][key],
+            ),
+            data,
+        )
+    assert data == expected
@@ -24,7 +24,7 @@ from types import SimpleNamespace
 
 from cylc.flow import CYLC_LOG
 from cylc.flow.exceptions import GraphParseError, ParamExpandError
-from cylc.flow.graph_parser import GraphParser
+from cylc.flow.graph_parser import GraphParser, parse_graphs
 from cylc.flow.task_outputs import (
     TASK_OUTPUT_SUBMITTED,
     TASK_OUTPUT_SUBMIT_FAILED,
@@ -961,3 +961,47 @@ def test_proc_dep_pair(args, err):
             gp._proc_dep_pair(*args)
     else:
         assert gp._proc_dep_pair(*args) is None
+
+
+def _parse_graphs_sequential(graphs, family_map):
+    task_output_opt = {}
+    for graph in graphs:
+        gp = GraphParser(family_map, task_output_opt=task_output_opt)
+        gp.parse_graph(graph)
+        task_output_opt.update(gp.task_output_opt)
+        yield gp
+
+
+@pytest.mark.parametrize(
+    'graphs',
+    [
+        param(['a => b', 'b => c', 'd:fail? => e'], id='ok'),
+        param(
+            # the error depends on the preceding graph strings
+            ['a:fail? => b', 'FAM:fail-all => c', 'FAM:fail-all? => d'],
+            id='inconsistent'
+        ),
+        param(['a => b', 'a? => c', 'x => & y'], id='two-errors'),
+    ]
+)
+def test_parse_graphs(graphs):
+    """It returns the same result (or error) as parsing in turn."""
+    family_map = {'FAM': ['a', 'x']}
+    task_output_opt = {}
+    parallel = parse_graphs(graphs, family_map, None, 2, task_output_opt)
+    sequential = _parse_graphs_sequential(graphs, family_map)
+    for _ in graphs:
+        try:
+            expected = next(sequential)
+        except GraphParseError as exc:
+            with pytest.raises(GraphParseError) as exc_info:
+                next(parallel)
+            assert str(exc_info.value) == str(exc)
+            break
+        result = next(parallel)
+        task_output_opt.update(result.task_output_opt)
+        assert result.triggers == expected.triggers
+        assert result.original == expected.original
+        assert result.task_output_opt == expected.task_output_opt
+    else:
+        parallel.close()
@@ -22,6 +22,7 @@ NOTE: these are functional tests, for unit tests see the docstrings in
 """
 import logging
 import socket
+import time
 
 import pytest
 
@@ -218,3 +219,30 @@ def test_get_metrics_no_hosts_error(caplog):
     assert not host_stats
     # the return code should be recorded
     assert data == {'not-a-host': {'returncode': 255}}
+
+
+def test_get_metrics_cache(tmp_path, monkeypatch):
+    """It should reuse cached metrics until they time out."""
+    monkeypatch.setattr(
+        'cylc.flow.host_select.METRICS_CACHE_PATH',
+        tmp_path / 'host-metrics.json'
+    )
+    metrics = [('cpu_count',)]
+    host_stats, _ = _get_metrics(['localhost'], metrics, cache_timeout=60)
+    assert host_stats['localhost'][('cpu_count',)] > 0
+
+    # the cached result should be used rather than running the command
+    def _run_cmd(*args, **kwargs):
+        raise Exception('should not be called')
+
+    monkeypatch.setattr('cylc.flow.host_select.run_cmd', _run_cmd)
+    assert _get_metrics(
+        ['localhost'], metrics, cache_timeout=60
+    ) == (host_stats, {'localhost': {'returncode': 0}})
+
+    # cached results which have timed out should not be used
+    monkeypatch.setattr(
+        'cylc.flow.host_select.time', lambda: time.time() + 120
+    )
+    with pytest.raises(Exception, match='should not be called'):
+        _get_metrics(['localhost'], metrics, cache_timeout=60)
@@ -460,3 +460,51 @@ def test_expand_parent_params(param):
         with pytest.raises(param.raises[0], match=param.raises[1]):
             param.name_expander.expand_parent_params(
                 param.raw_str, param.parameter_values, 'Errortext')
+
+
+@pytest.mark.parametrize(
+    'templates, line, expected',
+    [
+        param(
+            {'m': '_m%(m)s', 'n': '_n%(n)s'},
+            'foo<m,n> => bar<m,n-1> => baz<m=1>',
+            [
+                'foo_m0_n0 => bar_m0_n-32768 => baz_m1',
+                'foo_m0_n1 => bar_m0_n0 => baz_m1',
+                'foo_m1_n0 => bar_m1_n-32768 => baz_m1',
+                'foo_m1_n1 => bar_m1_n0 => baz_m1',
+            ],
+            id='offsets-and-specific-values'
+        ),
+        param(
+            # a template that can't be formatted one parameter at a time
+            {'m': '_m%(m)s_of_%(n)s', 'n': '_n%(n)s'},
+            'foo<m,n>',
+            ['foo_m0_of_0_n0', 'foo_m0_of_1_n1',
+             'foo_m1_of_0_n0', 'foo_m1_of_1_n1'],
+            id='joint-template'
+        ),
+        param(
+            {'m': '{%(m)s}', 'n': '_n%(n)s'},
+            'foo<m> => bar{}',
+            ['foo{0} => bar{}', 'foo{1} => bar{}'],
+            id='braces'
+        ),
+    ]
+)
+def test_graph_iter_expand(templates, line, expected):
+    """Test lazy graph expansion from compiled line templates."""
+    graph_expander = GraphExpander(({'m': [0, 1], 'n': [0, 1]}, templates))
+    results = graph_expander.iter_expand(line)
+    assert next(results) == expected[0]
+    assert [expected[0], *results] == expected
+    assert graph_expander.expand(line) == set(expected)
+
+
+def test_name_iter_expand():
+    """Test lazy runtime name expansion."""
+    name_expander = NameExpander(
+        ({'m': [0, 1], 'n': [0, 1, 2]}, {'m': '_m%(m)s', 'n': '_n%(n)s'}))
+    results = name_expander.iter_expand('foo<m,n=2>, bar')
+    assert next(results) == ('foo_m0_n2', {'n': 2, 'm': 0})
+    assert list(results) == [('foo_m1_n2', {'n': 2, 'm': 1}), ('bar', {})]
@@ -25,6 +25,7 @@ from cylc.flow.platforms import (
     get_platform_deprecated_settings,
     is_platform_definition_subshell,
     platform_from_name, platform_name_from_job_info,
+    get_platform_resolver,
     get_install_target_from_platform,
     get_install_target_to_platforms_map,
     generic_items_match,
@@ -206,6 +207,38 @@ def test_similar_but_not_exact_match():
         platform_from_name('vld1', PLATFORMS_WITH_RE)
 
 
+@pytest.mark.parametrize(
+    'platforms, expected',
+    [
+        pytest.param(
+            {'foo': {'hosts': ['a']}, 'fo.': {'hosts': ['b']}},
+            ['b'],
+            id='later-regex-overrides-literal'
+        ),
+        pytest.param(
+            {'fo.': {'hosts': ['b']}, 'foo': {'hosts': ['a']}},
+            ['a'],
+            id='later-literal-overrides-regex'
+        ),
+    ]
+)
+def test_platform_resolver_order(platforms, expected):
+    """Literal names and regexes are matched in reverse definition order."""
+    assert platform_from_name('foo', platforms)['hosts'] == expected
+
+
+def test_platform_resolver_cache():
+    """The resolver is reused for the same config and rebuilt otherwise."""
+    resolver = get_platform_resolver(PLATFORMS)
+    assert get_platform_resolver(PLATFORMS) is resolver
+    platform = platform_from_name('sugar', PLATFORMS)
+    assert resolver.get_platform_key('sugar') == 'sugar'
+    # returned platforms are copies which can be modified safely
+    platform['job runner'] = 'pbs'
+    assert platform_from_name('sugar', PLATFORMS)['job runner'] == 'slurm'
+    assert get_platform_resolver(PLATFORMS_WITH_RE) is not resolver
+
+
 # ----------------------------------------------------------------------------
 # Tests of platform_name_from_job_info
 # ----------------------------------------------------------------------------
@@ -15,13 +15,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test the cylc.flow.remote module."""
 
+from hashlib import sha256
 import os
+from subprocess import PIPE, Popen
+from time import time
 from unittest import mock
 
 import pytest
 
 from cylc.flow.remote import (
-    run_cmd, construct_rsync_over_ssh_cmd, construct_ssh_cmd
+    run_cmd, construct_rsync_over_ssh_cmd, construct_ssh_cmd,
+    get_install_manifest, get_install_manifest_changes, InstallManifestEntry,
+    RemoteOp, run_remote_ops,
 )
 import cylc.flow
 
@@ -96,6 +101,86 @@ def test_construct_rsync_over_ssh_cmd():
     ]
 
 
+def test_construct_rsync_over_ssh_cmd_files_from_stdin():
+    """It only installs the listed files without deleting anything."""
+    cmd, host = construct_rsync_over_ssh_cmd(
+        '/foo',
+        '/bar',
+        {
+            'rsync command': 'rsync',
+            'hosts': ['miklegard'],
+            'ssh command': 'strange_ssh',
+            'selection': {'method': 'definition order'},
+            'name': 'testplat'
+        },
+        files_from_stdin=True,
+    )
+    assert host == 'miklegard'
+    assert cmd == [
+        'rsync',
+        '--rsh=strange_ssh',
+        '--files-from=-',
+        '-a',
+        '--checksum',
+        '--out-format=%o %n%L',
+        '--no-t',
+        '/foo/',
+        'miklegard:/bar/',
+    ]
+
+
+def test_get_install_manifest(tmp_path):
+    """It lists the files installed by file install with their checksums."""
+    (tmp_path / 'bin').mkdir()
+    (tmp_path / 'bin' / 'foo').write_text('foo')
+    (tmp_path / 'bin' / 'bar').symlink_to('foo')
+    (tmp_path / 'lib' / 'python').mkdir(parents=True)
+    (tmp_path / '.service').mkdir()
+    (tmp_path / '.service' / 'server.key').write_text('key')
+    (tmp_path / '.service' / 'db').write_text('not installed')
+    (tmp_path / 'log').mkdir()
+    (tmp_path / 'log' / 'baz').write_text('not installed')
+    (tmp_path / 'extra.txt').write_text('extra')
+
+    manifest = get_install_manifest(str(tmp_path), ['extra.txt'])
+    assert set(manifest) == {
+        'bin',
+        'bin/foo',
+        'bin/bar',
+        'lib',
+        'lib/python',
+        '.service/server.key',
+        'extra.txt',
+    }
+    assert manifest['lib'].checksum == 'dir'
+    assert manifest['bin/bar'].checksum == 'link:foo'
+
+    # changing a file changes its checksum
+    (tmp_path / 'bin' / 'foo').write_text('FOO')
+    new_manifest = get_install_manifest(str(tmp_path), ['extra.txt'])
+    assert get_install_manifest_changes(manifest, new_manifest) == ['bin/foo']
+
+
+def test_get_install_manifest_reuse(tmp_path):
+    """It reuses checksums of files whose size and mtime are unchanged."""
+    (tmp_path / 'bin').mkdir()
+    foo = tmp_path / 'bin' / 'foo'
+    foo.write_text('foo')
+    stat = foo.stat()
+    prev_manifest = {
+        'bin/foo': InstallManifestEntry(
+            'prev-checksum', stat.st_size, stat.st_mtime_ns
+        )
+    }
+    manifest = get_install_manifest(str(tmp_path), None, prev_manifest)
+    assert manifest['bin/foo'].checksum == 'prev-checksum'
+
+    # the file has been modified => the checksum is recomputed
+    os.utime(foo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    manifest = get_install_manifest(str(tmp_path), None, prev_manifest)
+    assert manifest['bin/foo'].checksum == sha256(b'foo').hexdigest()
+
+
 def test_construct_ssh_cmd_forward_env(monkeypatch: pytest.MonkeyPatch):
     """ Test for 'ssh forward environment variables'
     """
@@ -122,3 +207,77 @@ def test_construct_ssh_cmd_forward_env(monkeypatch: pytest.MonkeyPatch):
     expect = ['ssh', host, 'env', f'CYLC_VERSION={cylc.flow.__version__}', 'FOO=BAR', 'cylc', 'play']
     cmd = construct_ssh_cmd(['play'], config, host)
     assert cmd == expect
+
+
+def test_run_remote_ops():
+    """It runs commands concurrently, retrying on 255 and timing out."""
+    calls = []
+
+    def _starter(*cmds):
+        cmds = list(cmds)
+
+        def _start(prev):
+            calls.append(prev.ret_code if prev else None)
+            if not cmds:
+                return None
+            return RemoteOp(
+                Popen(  # nosec
+                    ['bash', '-c', cmds.pop(0)], stdout=PIPE, stderr=PIPE,
+                    text=True
+                ),
+                {'name': 'x'},
+            )
+        return _start
+
+    start = time()
+    results = run_remote_ops(
+        {
+            'a': _starter('echo a'),
+            # retried after the SSH failure
+            'b': _starter('exit 255', 'echo b'),
+            # retries exhausted
+            'c': _starter('exit 255'),
+            # killed at the deadline
+            'd': _starter('sleep 10'),
+            'e': _starter('sleep 1; exit 1'),
+        },
+        max_parallel=2,
+        timeout=2,
+    )
+    # the sleeps ran concurrently
+    assert time() - start < 5
+    assert calls.count(255) == 2
+    assert (results['a'].ret_code, results['a'].out) == (0, 'a\n')
+    assert (results['b'].ret_code, results['b'].out) == (0, 'b\n')
+    assert results['c'].ret_code == 255
+    assert results['d'].timed_out
+    assert results['d'].ret_code is None
+    assert results['e'].ret_code == 1
+    assert not results['e'].timed_out
+
+
+def test_run_remote_ops_total_timeout(caplog):
+    """It stops all commands at the total deadline."""
+    def _starter(prev):
+        if prev:
+            return None
+        return RemoteOp(
+            Popen(  # nosec
+                ['sleep', '10'], stdout=PIPE, stderr=PIPE, text=True
+            ),
+            {'name': 'x'},
+        )
+
+    start = time()
+    results = run_remote_ops(
+        {target: _starter for target in 'abc'},
+        max_parallel=2,
+        timeout=5,
+        total_timeout=1,
+    )
+    # the commands were not given a deadline each
+    assert time() - start < 3
+    assert set(results) == {'a', 'b'}
+    assert all(result.timed_out for result in results.values())
+    # the remaining target was not started
+    assert 'Timed out before running remote commands on: c' in caplog.text
@@ -18,18 +18,26 @@ from tempfile import (
     NamedTemporaryFile, SpooledTemporaryFile, TemporaryFile,
     TemporaryDirectory
 )
+import logging
 import unittest
 import pytest
 
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import Mock
 
-from cylc.flow import LOG
+from cylc.flow import CYLC_LOG, LOG
 from cylc.flow.id import Tokens
 from cylc.flow.cycling.iso8601 import ISO8601Point
 from cylc.flow.task_events_mgr import TaskJobLogsRetrieveContext
 from cylc.flow.subprocctx import SubProcContext
-from cylc.flow.subprocpool import SubProcPool, _XTRIG_FUNC_CACHE, _XTRIG_MOD_CACHE, get_xtrig_func
+from cylc.flow.subprocpool import (
+    ProcPoolQueue,
+    SubProcPool,
+    _XTRIG_FUNC_CACHE,
+    _XTRIG_MOD_CACHE,
+    get_xtrig_func,
+)
 from cylc.flow.task_outputs import (
     TASK_OUTPUT_SUBMITTED,
     TASK_OUTPUT_SUBMIT_FAILED,
@@ -342,7 +350,8 @@ def test__run_command_exit_add_to_badhosts_log(caplog, mock_ctx):
                     TASK_OUTPUT_FAILED: [None, None],
                     TASK_OUTPUT_EXPIRED: [None, None],
                 },
-                graph_children={}, rtconfig={'platform': 'foo'}
+                graph_children={}, graph_children_table=None,
+                graph_children_cache={}, rtconfig={'platform': 'foo'}
 
             ),
             ISO8601Point('1990')
@@ -407,3 +416,52 @@ def test_rsync_255_fail(mock_ctx, expect, ctx_kwargs):
         }
     )
     assert output == expect
+
+
+def test_priority_classes(monkeypatch):
+    """It runs kills and polls ahead of queued event handlers and caps
+    the number of concurrent event handlers."""
+    pool = SubProcPool()
+    pool.size = 2
+    pool.queuings = ProcPoolQueue(pool.PRIORITY_CLASSES, pool.size)
+    started = []
+    monkeypatch.setattr(
+        pool,
+        '_run_command_init',
+        lambda ctx, *args: started.append(ctx.cmd_key) or Mock(),
+    )
+    for i in range(3):
+        pool.put_command(
+            SubProcContext(('handler-%d' % i, 'failed'), ['true']))
+    pool.put_command(SubProcContext('jobs-kill', ['true']))
+    pool.put_command(SubProcContext('jobs-poll', ['true']))
+    pool.process()
+    assert started == ['jobs-kill', 'jobs-poll']
+
+    # event handlers may only use half of the pool
+    pool.runnings.clear()
+    pool.process()
+    assert started[2:] == [('handler-0', 'failed')]
+    assert len(pool.queuings) == 2
+
+    stats = pool.get_queue_stats()
+    assert stats['control']['dequeued'] == 2
+    assert stats['event']['dequeued'] == 1
+    assert stats['event']['queued'] == 2
+    assert stats['event']['running'] == 1
+
+
+def test_log_queue_stats(monkeypatch, caplog):
+    """It periodically logs the queue stats of each priority class."""
+    pool = SubProcPool()
+    monkeypatch.setattr(pool, '_run_command_init', lambda *args: Mock())
+    pool.put_command(SubProcContext('jobs-kill', ['true']))
+    caplog.set_level(logging.DEBUG, CYLC_LOG)
+    pool.process()
+    assert 'Process pool queue stats' not in caplog.text
+
+    pool.runnings.clear()
+    pool.queue_stats_log_time = 0
+    pool.process()
+    assert 'control: queued=0 running=0 dequeued=1' in caplog.text
+    assert pool.queue_stats_log_time > 0
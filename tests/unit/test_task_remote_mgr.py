@@ -22,6 +22,7 @@ from unittest.mock import MagicMock, Mock
 
 from cylc.flow.exceptions import PlatformError
 from cylc.flow.network.client_factory import CommsMeth
+from cylc.flow.remote import InstallManifestEntry
 from cylc.flow.task_remote_mgr import (
     REMOTE_FILE_INSTALL_DONE, REMOTE_INIT_IN_PROGRESS, TaskRemoteMgr)
 from cylc.flow.workflow_files import WorkflowFiles, get_workflow_srv_dir
@@ -98,6 +99,127 @@ def test_remote_init_skip(
     assert status == expected_status
 
 
+@pytest.mark.parametrize(
+    'old_manifest, installed, stdin_str, skip_expected',
+    [
+        pytest.param({}, True, None, False, id='no-manifest'),
+        pytest.param(
+            {'bin': ('dir', None, None)},
+            True,
+            'bin/foo\n',
+            False,
+            id='added-file'
+        ),
+        pytest.param(
+            {
+                'bin': ('dir', None, None),
+                'bin/foo': ('x', 1, 1),
+                'bin/bar': ('y', 1, 1),
+            },
+            True,
+            None,
+            False,
+            id='removed-file'
+        ),
+        pytest.param(
+            {'bin': ('dir', None, None), 'bin/foo': ('x', 1, 1)},
+            True,
+            None,
+            True,
+            id='same'
+        ),
+        pytest.param(
+            {'bin': ('dir', None, None), 'bin/foo': ('x', 1, 1)},
+            False,
+            None,
+            False,
+            id='first-install-of-run'
+        ),
+    ]
+)
+def test_file_install_manifest(
+    old_manifest, installed, stdin_str, skip_expected, monkeypatch: Fixture
+):
+    """File install only installs what has changed since last time.
+
+    The first installation to a target in a run installs everything.
+    """
+    monkeypatch.setattr(
+        'cylc.flow.task_remote_mgr.get_install_manifest',
+        lambda *args: {
+            'bin': InstallManifestEntry('dir'),
+            'bin/foo': InstallManifestEntry('x', 2, 2),
+        }
+    )
+    monkeypatch.setattr(
+        'cylc.flow.task_remote_mgr.construct_rsync_over_ssh_cmd',
+        lambda *args, **kwargs: (['rsync'], 'host')
+    )
+    mock_task_remote_mgr = MagicMock(
+        remote_init_map={},
+        bad_hosts=set(),
+        file_installed_targets={'foo'} if installed else set(),
+        install_manifest=None,
+    )
+    dao = mock_task_remote_mgr.db_mgr.get_pri_dao.return_value.__enter__()
+    dao.select_install_manifest.return_value = old_manifest
+    platform = {'install target': 'foo', 'name': 'foo', 'hosts': ['host']}
+
+    TaskRemoteMgr.file_install(mock_task_remote_mgr, platform)
+    put_command = mock_task_remote_mgr.proc_pool.put_command
+    if skip_expected:
+        assert not put_command.called
+        assert mock_task_remote_mgr.remote_init_map['foo'] == (
+            REMOTE_FILE_INSTALL_DONE)
+    else:
+        ctx = put_command.call_args[0][0]
+        assert ctx.cmd_kwargs['stdin_str'] == stdin_str
+
+
+def test_file_install_manifest_shared(monkeypatch: Fixture):
+    """Targets installed at the same time share the manifest."""
+    mock_get_install_manifest = MagicMock(
+        side_effect=lambda *args: {'bin': InstallManifestEntry('dir')}
+    )
+    monkeypatch.setattr(
+        'cylc.flow.task_remote_mgr.get_install_manifest',
+        mock_get_install_manifest
+    )
+    monkeypatch.setattr(
+        'cylc.flow.task_remote_mgr.construct_rsync_over_ssh_cmd',
+        lambda *args, **kwargs: (['rsync'], 'host')
+    )
+    mock_task_remote_mgr = MagicMock(
+        remote_init_map={},
+        bad_hosts=set(),
+        file_installed_targets=set(),
+        install_manifest=None,
+    )
+    dao = mock_task_remote_mgr.db_mgr.get_pri_dao.return_value.__enter__()
+    dao.select_install_manifest.return_value = {}
+
+    for target in ('foo', 'bar'):
+        TaskRemoteMgr.file_install(
+            mock_task_remote_mgr,
+            {'install target': target, 'name': target, 'hosts': ['host']}
+        )
+    assert mock_get_install_manifest.call_count == 1
+
+    # once these have completed, the next install computes a new manifest
+    # (reusing the checksums of the last one)
+    mock_task_remote_mgr.remote_init_map = {
+        'foo': REMOTE_FILE_INSTALL_DONE,
+        'bar': REMOTE_FILE_INSTALL_DONE,
+    }
+    prev_manifest = mock_task_remote_mgr.install_manifest
+    TaskRemoteMgr.file_install(
+        mock_task_remote_mgr,
+        {'install target': 'foo', 'name': 'foo', 'hosts': ['host']}
+    )
+    assert mock_get_install_manifest.call_count == 2
+    assert mock_get_install_manifest.call_args[0][2] is prev_manifest
+
+
 @pytest.mark.parametrize(
     'install_target, load_type, expected',
     [
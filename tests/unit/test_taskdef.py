@@ -15,7 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from cylc.flow.config import WorkflowConfig
-from cylc.flow.taskdef import generate_graph_parents
+from cylc.flow.taskdef import (
+    TaskDef, generate_graph_children, generate_graph_parents
+)
 from cylc.flow.cycling.iso8601 import ISO8601Point
 from cylc.flow.cycling.integer import IntegerPoint
 
@@ -98,3 +100,55 @@ def test_generate_graph_parents_2(tmp_flow_config):
             )
         ]
     ]
+
+
+def test_generate_graph_children_cache(tmp_flow_config, monkeypatch):
+    """Test graph children are cached per point."""
+    monkeypatch.setattr(TaskDef, 'MAX_LEN_GRAPH_CACHE', 2)
+    id_ = 'babel-fish'
+    flow_file = tmp_flow_config(
+        id_,
+        f"""
+            [scheduling]
+                initial cycle point = 2023
+                [[graph]]
+                    R1 = "foo[^] => bar"
+                    PT6H = "foo => baz"
+                    T06 = "foo[-PT6H] => qux"
+            [runtime]
+                [[foo, bar, baz, qux]]
+        """
+    )
+    cfg = WorkflowConfig(workflow=id_, fpath=flow_file, options=None)
+    tdef = cfg.taskdefs['foo']
+
+    def children(point):
+        return {
+            output: [(name, str(point), abs_) for name, point, abs_ in kids]
+            for output, kids in generate_graph_children(tdef, point).items()
+        }
+
+    point = ISO8601Point('20230101T0000Z')
+    assert children(point) == {
+        'succeeded': [
+            ('bar', '20230101T0000Z', True),
+            ('baz', '20230101T0000Z', False),
+            ('qux', '20230101T0600Z', False),
+        ]
+    }
+    assert generate_graph_children(tdef, point) is (
+        generate_graph_children(tdef, point))
+    # the offset children are only generated at valid points
+    assert children(ISO8601Point('20230101T0600Z')) == {
+        'succeeded': [('baz', '20230101T0600Z', False)]
+    }
+    assert children(ISO8601Point('20230102T0000Z')) == {
+        'succeeded': [
+            ('baz', '20230102T0000Z', False),
+            ('qux', '20230102T0600Z', False),
+        ]
+    }
+    # the oldest results are discarded
+    assert list(tdef.graph_children_cache) == [
+        ISO8601Point('20230101T0600Z'), ISO8601Point('20230102T0000Z')
+    ]
@@ -0,0 +1,91 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import Mock
+
+from cylc.flow.data_messages_pb2 import (  # type: ignore
+    JDeltas,
+    PbEntireWorkflow,
+    PbJob,
+)
+from cylc.flow.data_store_mgr import JOBS, generate_checksum
+from cylc.flow.tui.store import WorkflowStore
+
+
+def make_workflow():
+    """Return a workflow with one task in one cycle."""
+    pb_data = PbEntireWorkflow()
+    pb_data.workflow.id = '~u/w'
+    pb_data.workflow.last_updated = 1.
+    task = pb_data.tasks.add()
+    task.id = '~u/w//foo'
+    task.mean_elapsed_time = 10.
+    task.proxies.append('~u/w//1/foo')
+    proxy = pb_data.task_proxies.add()
+    proxy.id = '~u/w//1/foo'
+    proxy.name = 'foo'
+    proxy.state = 'waiting'
+    proxy.task = task.id
+    proxy.first_parent = '~u/w//1/root'
+    root = pb_data.family_proxies.add()
+    root.id = '~u/w//1/root'
+    root.name = 'root'
+    root.state = 'waiting'
+    root.child_tasks.append(proxy.id)
+    return pb_data
+
+
+async def test_store():
+    """It should mirror the workflow and apply deltas."""
+    client = Mock()
+    store = WorkflowStore(client, subscriber=Mock())
+
+    async def async_request(*_):
+        return make_workflow().SerializeToString()
+
+    client.async_request = async_request
+    await store.sync()
+
+    data = store.get_data(['waiting'])
+    assert data['cyclePoints'][0]['id'] == '~u/w//1/root'
+    assert data['familyProxies'] == []
+    (task,) = data['taskProxies']
+    assert task['firstParent'] == {'id': '~u/w//1/root', 'name': 'root'}
+    assert task['task'] == {'meanElapsedTime': 10.}
+    assert task['jobs'] == []
+    assert store.get_data(['waiting']) is data
+    assert store.get_data(['running'])['taskProxies'] == []
+
+    # add a job
+    job = PbJob(
+        id='~u/w//1/foo/01',
+        stamp='~u/w//1/foo/01@1',
+        submit_num=1,
+        state='submitted',
+    )
+    delta = JDeltas(time=2., added=[job])
+    delta.checksum = generate_checksum([job.stamp])
+    store.data['task_proxies']['~u/w//1/foo'].jobs.append(job.id)
+    assert store._apply(JOBS, delta)
+    (task,) = store.get_data(['waiting'])['taskProxies']
+    assert [job['id'] for job in task['jobs']] == ['~u/w//1/foo/01']
+
+    # old deltas are ignored
+    assert store._apply(JOBS, JDeltas(time=1., pruned=[job.id]))
+    assert job.id in store.data[JOBS]
+
+    # the store is out of sync if the checksum doesn't match
+    assert not store._apply(JOBS, JDeltas(time=3., checksum=1))